@@ -34,16 +34,70 @@ WHITE = (255, 255, 255)
 BLACK = (20, 20, 20)
 BACKGROUND = (240, 240, 240)
 
-# Create game window
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+# Resolve assets relative to this file so the game runs from any working directory
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def asset_path(rel_path):
+    """Return the absolute path of a file under the game folder"""
+    return os.path.join(GAME_DIR, rel_path)
+
+# Shared image cache, text cache, display updates and result channel, available when started by the launcher
+try:
+    from game_wrappers import assets as shared_assets
+    from game_wrappers import results
+    from game_wrappers import text as shared_text
+    from game_wrappers import dirty as shared_dirty
+except ImportError:
+    shared_assets = None
+    results = None
+    shared_text = None
+    shared_dirty = None
+
+def load_image(rel_path, alpha=True):
+    """Load an image under the game folder (the returned Surface may be shared, copy before modifying)"""
+    path = asset_path(rel_path)
+    if shared_assets:
+        return shared_assets.load_image(path, alpha)
+    img = pygame.image.load(path)
+    return img.convert_alpha() if alpha else img.convert()
+
+def render_text(font, text, antialias, color):
+    """font.render() that reuses the surface of unchanged text (cached when started by the launcher)"""
+    if shared_text:
+        return shared_text.render(font, text, color, antialias)
+    return font.render(text, antialias, color)
+
+def present_frame():
+    """pygame.display.flip(), or only the changed regions when dirty-rect mode is on"""
+    if shared_dirty:
+        shared_dirty.present()
+    else:
+        pygame.display.flip()
+
+def load_sound(path):
+    """Load a sound effect (shared and decoded only once when started by the launcher)"""
+    if shared_assets:
+        return shared_assets.load_sound(path)
+    return pygame.mixer.Sound(path)
+
+def load_font(path, size):
+    """Load a font file (shared when started by the launcher)"""
+    if shared_assets:
+        return shared_assets.load_font(path, size)
+    return pygame.font.Font(path, size)
+
+# Create game window (reuse an existing window of the right size, e.g. inside the game host)
+screen = pygame.display.get_surface()
+if screen is None or screen.get_size() != (SCREEN_WIDTH, SCREEN_HEIGHT):
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Counting Butterfly!")
 clock = pygame.time.Clock()
 
 # Load font - Use Press Start 2P pixel font
 try:
-    font_large = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 32)  # Pixel font recommended to use smaller sizes
-    font_medium = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 20)
-    font_small = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 14)
+    font_large = load_font(asset_path("assets/fonts/PressStart2P-Regular.ttf"), 32)  # Pixel font recommended to use smaller sizes
+    font_medium = load_font(asset_path("assets/fonts/PressStart2P-Regular.ttf"), 20)
+    font_small = load_font(asset_path("assets/fonts/PressStart2P-Regular.ttf"), 14)
     print("✓ Successfully loaded Press Start 2P font!")
 except:
     # If font loading fails, try using system font
@@ -61,7 +115,9 @@ except:
 # Load background image (optional)
 def load_background_image():
     try:
-        img = pygame.image.load("assets/images/background1.png").convert()
+        if shared_assets:
+            return shared_assets.load_scaled(asset_path("assets/images/background1.png"), (SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False, smooth=False)
+        img = load_image("assets/images/background1.png", alpha=False)
         return pygame.transform.scale(img, (SCREEN_WIDTH, SCREEN_HEIGHT))
     except Exception:
         return None
@@ -80,13 +136,14 @@ def load_sounds():
     
     try:
         # Try to load background music (electronic style)
-        if os.path.exists("assets/audio/bgm.mp3") or os.path.exists("assets/audio/bgm.ogg") or os.path.exists("assets/audio/bgm.wav"):
+        if os.path.exists(asset_path("assets/audio/bgm.mp3")) or os.path.exists(asset_path("assets/audio/bgm.ogg")) or os.path.exists(asset_path("assets/audio/bgm.wav")):
             for ext in ['mp3', 'ogg', 'wav']:
-                if os.path.exists(f"assets/audio/bgm.{ext}"):
-                    pygame.mixer.music.load(f"assets/audio/bgm.{ext}")
+                if os.path.exists(asset_path(f"assets/audio/bgm.{ext}")):
+                    pygame.mixer.music.load(asset_path(f"assets/audio/bgm.{ext}"))
                     pygame.mixer.music.set_volume(0.3)
                     print(f"✓ Successfully loaded background music: bgm.{ext}")
-                    sounds['bgm'] = True
+                    # Keep the path so the music can be reloaded when another game used the mixer
+                    sounds['bgm'] = asset_path(f"assets/audio/bgm.{ext}")
                     break
         else:
             print("⚠ BGM music file not found (supported: bgm.mp3, bgm.ogg, bgm.wav)")
@@ -96,8 +153,8 @@ def load_sounds():
     try:
         # Try to load countdown sound effect
         for ext in ['wav', 'ogg', 'mp3']:
-            if os.path.exists(f"assets/audio/countdown.{ext}"):
-                sounds['countdown'] = pygame.mixer.Sound(f"assets/audio/countdown.{ext}")
+            if os.path.exists(asset_path(f"assets/audio/countdown.{ext}")):
+                sounds['countdown'] = load_sound(asset_path(f"assets/audio/countdown.{ext}"))
                 sounds['countdown'].set_volume(0.5)
                 print(f"✓ Successfully loaded countdown sound: countdown.{ext}")
                 break
@@ -109,8 +166,8 @@ def load_sounds():
     try:
         # Try to load start sound effect
         for ext in ['wav', 'ogg', 'mp3']:
-            if os.path.exists(f"assets/audio/start.{ext}"):
-                sounds['start'] = pygame.mixer.Sound(f"assets/audio/start.{ext}")
+            if os.path.exists(asset_path(f"assets/audio/start.{ext}")):
+                sounds['start'] = load_sound(asset_path(f"assets/audio/start.{ext}"))
                 sounds['start'].set_volume(0.5)
                 print(f"✓ Successfully loaded start sound: start.{ext}")
                 break
@@ -122,8 +179,8 @@ def load_sounds():
     try:
         # Try to load keypress sound effect
         for ext in ['wav', 'ogg', 'mp3']:
-            if os.path.exists(f"assets/audio/beep.{ext}"):
-                sounds['beep'] = pygame.mixer.Sound(f"assets/audio/beep.{ext}")
+            if os.path.exists(asset_path(f"assets/audio/beep.{ext}")):
+                sounds['beep'] = load_sound(asset_path(f"assets/audio/beep.{ext}"))
                 sounds['beep'].set_volume(0.5)
                 print(f"✓ Successfully loaded keypress sound: beep.{ext}")
                 break
@@ -133,8 +190,8 @@ def load_sounds():
     try:
         # Try to load success sound effect
         for ext in ['wav', 'ogg', 'mp3']:
-            if os.path.exists(f"assets/audio/success.{ext}"):
-                sounds['success'] = pygame.mixer.Sound(f"assets/audio/success.{ext}")
+            if os.path.exists(asset_path(f"assets/audio/success.{ext}")):
+                sounds['success'] = load_sound(asset_path(f"assets/audio/success.{ext}"))
                 sounds['success'].set_volume(0.5)
                 print(f"✓ Successfully loaded success sound: success.{ext}")
                 break
@@ -144,8 +201,8 @@ def load_sounds():
     try:
         # Try to load error sound effect
         for ext in ['wav', 'ogg', 'mp3']:
-            if os.path.exists(f"assets/audio/wrong.{ext}"):
-                sounds['wrong'] = pygame.mixer.Sound(f"assets/audio/wrong.{ext}")
+            if os.path.exists(asset_path(f"assets/audio/wrong.{ext}")):
+                sounds['wrong'] = load_sound(asset_path(f"assets/audio/wrong.{ext}"))
                 sounds['wrong'].set_volume(0.5)
                 print(f"✓ Successfully loaded error sound: wrong.{ext}")
                 break
@@ -172,11 +229,11 @@ def draw_text_with_outline(surface, text, font, color, x, y, outline_color=(255,
     for dx in [-outline_width, 0, outline_width]:
         for dy in [-outline_width, 0, outline_width]:
             if dx != 0 or dy != 0:
-                outline_surface = font.render(text, True, outline_color)
+                outline_surface = render_text(font, text, True, outline_color)
                 surface.blit(outline_surface, (x + dx, y + dy))
     
     # Draw main text
-    text_surface = font.render(text, True, color)
+    text_surface = render_text(font, text, True, color)
     surface.blit(text_surface, (x, y))
     return text_surface
 
@@ -189,7 +246,7 @@ class Butterfly:
     def load_images():
         if Butterfly.blue_img is None:
             try:
-                Butterfly.blue_img = pygame.image.load("assets/images/butterfly_blue.png").convert_alpha()
+                Butterfly.blue_img = load_image("assets/images/butterfly_blue.png")
             except Exception:
                 try:
                     Butterfly.blue_img = pygame.image.load("butterfly_blue.png").convert_alpha()
@@ -197,7 +254,7 @@ class Butterfly:
                     Butterfly.blue_img = None
         if Butterfly.red_img is None:
             try:
-                Butterfly.red_img = pygame.image.load("assets/images/butterfly_red.png").convert_alpha()
+                Butterfly.red_img = load_image("assets/images/butterfly_red.png")
             except Exception:
                 try:
                     Butterfly.red_img = pygame.image.load("butterfly_red.png").convert_alpha()
@@ -273,12 +330,25 @@ class Butterfly:
 # Load character sprite images
 def load_player_sprites():
     sprites = {}
+    if shared_assets:
+        try:
+            # Cropped and scaled once in the shared cache, or taken straight from the sprite atlas
+            for color in ('red', 'blue'):
+                stand = shared_assets.load_cropped_fit(asset_path(f"assets/images/{color}_player_stand.png"), height=130, smooth=False)
+                walk = shared_assets.load_cropped_fit(asset_path(f"assets/images/{color}_player_walk.png"), height=130, smooth=False)
+                sprites[f'{color}_stand'] = stand
+                sprites[f'{color}_walk1'] = sprites[f'{color}_walk2'] = sprites[f'{color}_walk3'] = walk
+            print("✓ Successfully loaded all character sprites!")
+            return sprites
+        except Exception as e:
+            print(f"⚠ Shared sprite cache unavailable, loading directly: {e}")
+            sprites = {}
     try:
         # Load sprite file (preserve alpha channel)
-        red_stand = pygame.image.load("assets/images/red_player_stand.png").convert_alpha()
-        red_walk = pygame.image.load("assets/images/red_player_walk.png").convert_alpha()
-        blue_stand = pygame.image.load("assets/images/blue_player_stand.png").convert_alpha()
-        blue_walk = pygame.image.load("assets/images/blue_player_walk.png").convert_alpha()
+        red_stand = load_image("assets/images/red_player_stand.png")
+        red_walk = load_image("assets/images/red_player_walk.png")
+        blue_stand = load_image("assets/images/blue_player_stand.png")
+        blue_walk = load_image("assets/images/blue_player_walk.png")
 
         print(f"Loaded sprite size: {red_stand.get_size()}")
 
@@ -305,17 +375,13 @@ def load_player_sprites():
             )
             return scaled
 
-        # Extract red character - use entire image
+        # Extract red character - use entire image (walk frames share one scaled Surface)
         sprites['red_stand'] = extract_and_scale_sprite(red_stand, 0)
-        sprites['red_walk1'] = extract_and_scale_sprite(red_walk, 0)
-        sprites['red_walk2'] = extract_and_scale_sprite(red_walk, 0)
-        sprites['red_walk3'] = extract_and_scale_sprite(red_walk, 0)
+        sprites['red_walk1'] = sprites['red_walk2'] = sprites['red_walk3'] = extract_and_scale_sprite(red_walk, 0)
 
         # Extract blue character - use entire image
         sprites['blue_stand'] = extract_and_scale_sprite(blue_stand, 0)
-        sprites['blue_walk1'] = extract_and_scale_sprite(blue_walk, 0)
-        sprites['blue_walk2'] = extract_and_scale_sprite(blue_walk, 0)
-        sprites['blue_walk3'] = extract_and_scale_sprite(blue_walk, 0)
+        sprites['blue_walk1'] = sprites['blue_walk2'] = sprites['blue_walk3'] = extract_and_scale_sprite(blue_walk, 0)
 
         print("✓ Successfully loaded all character sprites!")
     except Exception as e:
@@ -343,7 +409,7 @@ def load_butterfly_images():
             return surf
 
         # Load blue and red butterfly images
-        for name in ["assets/images/butterfly_blue.png", "assets/images/butterfly_red.png"]:
+        for name in [asset_path("assets/images/butterfly_blue.png"), asset_path("assets/images/butterfly_red.png")]:
             try:
                 s = pygame.image.load(name).convert()
                 arr = pygame.surfarray.pixels3d(s)
@@ -531,6 +597,7 @@ class ButterflyGame:
         self.last_countdown_sound = 0  # Last number for countdown sound played
         self.paused = False  # Pause flag
         self.previous_state = None  # State before pause
+        self.match_stats = None  # Duration / frame statistics of the running match
         
         # Create players (red on right, blue on left, keys match positions)
         # player1 = red, on right, uses UP/DOWN/ENTER
@@ -540,6 +607,8 @@ class ButterflyGame:
         
         # Play background music at game start
         if game_sounds['bgm']:
+            pygame.mixer.music.load(game_sounds['bgm'])
+            pygame.mixer.music.set_volume(0.3)
             pygame.mixer.music.play(-1)  # -1 means loop playback
             print("♪ Background music started (initial screen)")
         
@@ -689,7 +758,7 @@ class ButterflyGame:
                     self.level += 1
                     self.start_level()
                 else:
-                    self.state = GameState.GAME_OVER
+                    self.finish_match()
             return
         
         # Update input timer
@@ -746,7 +815,7 @@ class ButterflyGame:
                 self.level += 1
                 self.start_level()
             else:
-                self.state = GameState.GAME_OVER
+                self.finish_match()
                 
     def draw_start_screen(self):
         if background_image:
@@ -780,15 +849,15 @@ class ButterflyGame:
                   (100, 200, 255), (180, 150, 255), (255, 150, 200)]
         
         # Calculate total width for centering
-        total_width = sum(font_large.render(char, True, BLACK).get_width() for char in title_text)
+        total_width = sum(render_text(font_large, char, True, BLACK).get_width() for char in title_text)
         x_offset = SCREEN_WIDTH//2 - total_width//2
         
         # Draw colorful title (different color for each character)
         for i, char in enumerate(title_text):
             color = colors[i % len(colors)]
-            char_surface = font_large.render(char, True, color)
+            char_surface = render_text(font_large, char, True, color)
             # Add shadow
-            shadow = font_large.render(char, True, (80, 80, 80))
+            shadow = render_text(font_large, char, True, (80, 80, 80))
             screen.blit(shadow, (x_offset + 3, 153))
             screen.blit(char_surface, (x_offset, 150))
             x_offset += char_surface.get_width()
@@ -826,7 +895,7 @@ class ButterflyGame:
                            (100, 200, 255), (180, 150, 255), (255, 150, 200)]
             
             # Calculate total width for centering
-            total_width = sum(font_medium.render(char, True, BLACK).get_width() for char in start_text_str)
+            total_width = sum(render_text(font_medium, char, True, BLACK).get_width() for char in start_text_str)
             x_offset = SCREEN_WIDTH//2 - total_width//2
             
             # Draw colorful start hint, "SPACE" in bright yellow
@@ -838,7 +907,7 @@ class ButterflyGame:
                 else:
                     color = colors_start[char_index % len(colors_start)]
                     char_index += 1
-                char_surface = font_medium.render(char, True, color)
+                char_surface = render_text(font_medium, char, True, color)
                 screen.blit(char_surface, (x_offset, SCREEN_HEIGHT - 80))
                 x_offset += char_surface.get_width()
         
@@ -856,7 +925,7 @@ class ButterflyGame:
             screen.fill(BACKGROUND)
         
         # Draw level info - more vibrant colors
-        level_text = font_medium.render(f"Level {self.level}", True, (255, 50, 150))  # Vivid pink
+        level_text = render_text(font_medium, f"Level {self.level}", True, (255, 50, 150))  # Vivid pink
         screen.blit(level_text, (SCREEN_WIDTH//2 - level_text.get_width()//2, 20))
         
         # Draw large countdown numbers with animation effect
@@ -884,7 +953,7 @@ class ButterflyGame:
         screen.blit(countdown_surface, countdown_rect)
         
         # Draw hint text - use vivid purple with white outline
-        hint_x = SCREEN_WIDTH//2 - font_small.render("Get Ready!", True, (200, 50, 255)).get_width()//2
+        hint_x = SCREEN_WIDTH//2 - render_text(font_small, "Get Ready!", True, (200, 50, 255)).get_width()//2
         draw_text_with_outline(screen, "Get Ready!", font_small, (200, 50, 255), hint_x, SCREEN_HEIGHT//2 + 100)
         
         # Advance animation and draw players
@@ -900,7 +969,7 @@ class ButterflyGame:
             screen.fill(BACKGROUND)
         
         # Draw level info - more vibrant colors
-        level_text = font_medium.render(f"Level {self.level}", True, (255, 50, 150))  # Vivid pink
+        level_text = render_text(font_medium, f"Level {self.level}", True, (255, 50, 150))  # Vivid pink
         screen.blit(level_text, (SCREEN_WIDTH//2 - level_text.get_width()//2, 20))
         
         # Draw butterflies
@@ -921,12 +990,12 @@ class ButterflyGame:
         
         # Draw timer - more vivid colors, turns red when time is low
         timer_color = (255, 50, 50) if self.input_timer <= 3 else (50, 200, 255)  # Red if less than 3 seconds, otherwise bright blue
-        timer_text = font_medium.render(f"Time: {int(self.input_timer)}", True, timer_color)
+        timer_text = render_text(font_medium, f"Time: {int(self.input_timer)}", True, timer_color)
         screen.blit(timer_text, (SCREEN_WIDTH//2 - timer_text.get_width()//2, 20))
         
         # If results not shown yet, display hint text
         if not self.show_result:
-            hint_text = font_small.render("The faster you type, the higher the score you get!", True, (255, 215, 0))
+            hint_text = render_text(font_small, "The faster you type, the higher the score you get!", True, (255, 215, 0))
             screen.blit(hint_text, (SCREEN_WIDTH//2 - hint_text.get_width()//2, 55))
         
         # Red/blue box position: aligned with player horizontal position, vertically above character head
@@ -943,60 +1012,60 @@ class ButterflyGame:
         pygame.draw.rect(screen, RED, (red_x - 50, box_y - 25, 100, 50), 3)
         
         # Draw players input values (red/blue swapped) - use text with white outline
-        p1_x = red_x - font_large.render(str(self.player1.input_value), True, RED).get_width()//2
-        p1_y = box_y - font_large.render(str(self.player1.input_value), True, RED).get_height()//2
-        p2_x = blue_x - font_large.render(str(self.player2.input_value), True, BLUE).get_width()//2
-        p2_y = box_y - font_large.render(str(self.player2.input_value), True, BLUE).get_height()//2
+        p1_x = red_x - render_text(font_large, str(self.player1.input_value), True, RED).get_width()//2
+        p1_y = box_y - render_text(font_large, str(self.player1.input_value), True, RED).get_height()//2
+        p2_x = blue_x - render_text(font_large, str(self.player2.input_value), True, BLUE).get_width()//2
+        p2_y = box_y - render_text(font_large, str(self.player2.input_value), True, BLUE).get_height()//2
         
         draw_text_with_outline(screen, str(self.player2.input_value), font_large, BLUE, p2_x, p2_y)
         draw_text_with_outline(screen, str(self.player1.input_value), font_large, RED, p1_x, p1_y)
         
         # Blue player (left) - W ▲ [box] ▼ S layout, SPACE below
         # W outside above box
-        w_label = font_small.render("W", True, BLUE)
+        w_label = render_text(font_small, "W", True, BLUE)
         screen.blit(w_label, (blue_x - w_label.get_width()//2, box_y - 55))
         # Up triangle ▲ outside above box
         pygame.draw.polygon(screen, BLUE, [(blue_x, box_y - 40), (blue_x - 10, box_y - 30), (blue_x + 10, box_y - 30)])
         # Down triangle ▼ outside below box
         pygame.draw.polygon(screen, BLUE, [(blue_x, box_y + 40), (blue_x - 10, box_y + 30), (blue_x + 10, box_y + 30)])
         # S outside below box
-        s_label = font_small.render("S", True, BLUE)
+        s_label = render_text(font_small, "S", True, BLUE)
         screen.blit(s_label, (blue_x - s_label.get_width()//2, box_y + 45))
         # SPACE below
-        space_hint_bottom = font_small.render("SPACE", True, (255, 255, 50))
+        space_hint_bottom = render_text(font_small, "SPACE", True, (255, 255, 50))
         screen.blit(space_hint_bottom, (blue_x - space_hint_bottom.get_width()//2, box_y + 70))
         
         # Red player (right) - UP ▲ [box] ▼ DOWN layout, ENTER below
         # UP outside above box
-        up_label = font_small.render("UP", True, RED)
+        up_label = render_text(font_small, "UP", True, RED)
         screen.blit(up_label, (red_x - up_label.get_width()//2, box_y - 55))
         # Up triangle ▲ outside above box
         pygame.draw.polygon(screen, RED, [(red_x, box_y - 40), (red_x - 10, box_y - 30), (red_x + 10, box_y - 30)])
         # Down triangle ▼ outside below box
         pygame.draw.polygon(screen, RED, [(red_x, box_y + 40), (red_x - 10, box_y + 30), (red_x + 10, box_y + 30)])
         # DOWN outside below box
-        down_label = font_small.render("DOWN", True, RED)
+        down_label = render_text(font_small, "DOWN", True, RED)
         screen.blit(down_label, (red_x - down_label.get_width()//2, box_y + 45))
         # ENTER below
-        enter_hint_bottom = font_small.render("ENTER", True, (255, 255, 50))
+        enter_hint_bottom = render_text(font_small, "ENTER", True, (255, 255, 50))
         screen.blit(enter_hint_bottom, (red_x - enter_hint_bottom.get_width()//2, box_y + 70))
         
         # Draw submission status - only show when results not displayed
         if not self.show_result:
             if self.player2.submitted:
                 # Submission marker - no background, directly show text with outline
-                submit_x = blue_x - font_small.render("Submitted!", True, BLUE).get_width()//2
+                submit_x = blue_x - render_text(font_small, "Submitted!", True, BLUE).get_width()//2
                 draw_text_with_outline(screen, "Submitted!", font_small, BLUE, submit_x, box_y - 90)
                 
             if self.player1.submitted:
                 # Submission marker - no background, directly show text with outline
-                submit_x = red_x - font_small.render("Submitted!", True, RED).get_width()//2
+                submit_x = red_x - render_text(font_small, "Submitted!", True, RED).get_width()//2
                 draw_text_with_outline(screen, "Submitted!", font_small, RED, submit_x, box_y - 90)
         
         # If showing results, display more detailed information
         if self.show_result:
             # Show correct answer - moved to higher position to avoid occlusion, use large font with white outline
-            answer_x = SCREEN_WIDTH//2 - font_large.render(f"Answer: {self.correct_answer}", True, (255, 255, 50)).get_width()//2
+            answer_x = SCREEN_WIDTH//2 - render_text(font_large, f"Answer: {self.correct_answer}", True, (255, 255, 50)).get_width()//2
             draw_text_with_outline(screen, f"Answer: {self.correct_answer}", font_large, (255, 255, 50), answer_x, 100)
             
             # Calculate scores
@@ -1006,40 +1075,40 @@ class ButterflyGame:
             # Show blue player result
             if p2_correct:
                 score_gain = 10 if not self.player1.submitted or self.player2.submitted else 5
-                score_text = font_large.render(f"+{score_gain}", True, (50, 255, 100))
+                score_text = render_text(font_large, f"+{score_gain}", True, (50, 255, 100))
                 screen.blit(score_text, (blue_x - score_text.get_width()//2, box_y + 100))
             else:
-                wrong_text = font_large.render("X", True, (255, 50, 50))
+                wrong_text = render_text(font_large, "X", True, (255, 50, 50))
                 screen.blit(wrong_text, (blue_x - wrong_text.get_width()//2, box_y + 100))
             
             # Show red player result
             if p1_correct:
                 score_gain = 10 if not self.player2.submitted or self.player1.submitted else 5
-                score_text = font_large.render(f"+{score_gain}", True, (50, 255, 100))
+                score_text = render_text(font_large, f"+{score_gain}", True, (50, 255, 100))
                 screen.blit(score_text, (red_x - score_text.get_width()//2, box_y + 100))
             else:
-                wrong_text = font_large.render("X", True, (255, 50, 50))
+                wrong_text = render_text(font_large, "X", True, (255, 50, 50))
                 screen.blit(wrong_text, (red_x - wrong_text.get_width()//2, box_y + 100))
             
             # Show current total score - moved to screen bottom, avoid character occlusion, use outlined text
-            p2_total_x = blue_x - font_medium.render(f"Total: {self.player2.score}", True, BLUE).get_width()//2
-            p1_total_x = red_x - font_medium.render(f"Total: {self.player1.score}", True, RED).get_width()//2
+            p2_total_x = blue_x - render_text(font_medium, f"Total: {self.player2.score}", True, BLUE).get_width()//2
+            p1_total_x = red_x - render_text(font_medium, f"Total: {self.player1.score}", True, RED).get_width()//2
             draw_text_with_outline(screen, f"Total: {self.player2.score}", font_medium, BLUE, p2_total_x, SCREEN_HEIGHT - 60)
             draw_text_with_outline(screen, f"Total: {self.player1.score}", font_medium, RED, p1_total_x, SCREEN_HEIGHT - 60)
             
             # Show next level hint - use more vivid colors with white outline, larger font
             if self.level < 3:
                 next_text_str = f"Next: Level {self.level+1}"
-                next_x = SCREEN_WIDTH//2 - font_medium.render(next_text_str, True, (255, 200, 0)).get_width()//2
+                next_x = SCREEN_WIDTH//2 - render_text(font_medium, next_text_str, True, (255, 200, 0)).get_width()//2
                 draw_text_with_outline(screen, next_text_str, font_medium, (255, 200, 0), next_x, SCREEN_HEIGHT - 100)
             else:
-                final_x = SCREEN_WIDTH//2 - font_medium.render("Final Results!", True, (255, 150, 255)).get_width()//2
+                final_x = SCREEN_WIDTH//2 - render_text(font_medium, "Final Results!", True, (255, 150, 255)).get_width()//2
                 draw_text_with_outline(screen, "Final Results!", font_medium, (255, 150, 255), final_x, SCREEN_HEIGHT - 100)
         
         # If both players submitted but results not shown yet, display simple feedback
         elif self.player1.submitted and self.player2.submitted:
             # Show correct answer
-            answer_text = font_medium.render(f"Answer: {self.correct_answer}", True, (255, 255, 50))
+            answer_text = render_text(font_medium, f"Answer: {self.correct_answer}", True, (255, 255, 50))
             screen.blit(answer_text, (SCREEN_WIDTH//2 - answer_text.get_width()//2, 60))
             
             # Calculate scores
@@ -1049,19 +1118,19 @@ class ButterflyGame:
             # Show blue player score
             if p2_correct:
                 score_gain = 10 if not self.player1.submitted or self.player2.submitted else 5
-                score_text = font_medium.render(f"+{score_gain}", True, (50, 255, 100))
+                score_text = render_text(font_medium, f"+{score_gain}", True, (50, 255, 100))
                 screen.blit(score_text, (blue_x - score_text.get_width()//2, box_y + 100))
             else:
-                wrong_text = font_medium.render("X", True, (255, 50, 50))
+                wrong_text = render_text(font_medium, "X", True, (255, 50, 50))
                 screen.blit(wrong_text, (blue_x - wrong_text.get_width()//2, box_y + 100))
             
             # Show red player score
             if p1_correct:
                 score_gain = 10 if not self.player2.submitted or self.player1.submitted else 5
-                score_text = font_medium.render(f"+{score_gain}", True, (50, 255, 100))
+                score_text = render_text(font_medium, f"+{score_gain}", True, (50, 255, 100))
                 screen.blit(score_text, (red_x - score_text.get_width()//2, box_y + 100))
             else:
-                wrong_text = font_medium.render("X", True, (255, 50, 50))
+                wrong_text = render_text(font_medium, "X", True, (255, 50, 50))
                 screen.blit(wrong_text, (red_x - wrong_text.get_width()//2, box_y + 100))
         
         # Advance animation and draw players
@@ -1077,29 +1146,29 @@ class ButterflyGame:
             screen.fill(BACKGROUND)
         
         # Show correct answer
-        answer_text = font_medium.render(f"Correct answer: {self.correct_answer}", True, BLACK)
+        answer_text = render_text(font_medium, f"Correct answer: {self.correct_answer}", True, BLACK)
         screen.blit(answer_text, (SCREEN_WIDTH//2 - answer_text.get_width()//2, 100))
         
         # Show player answers and scores
-        p1_answer = font_small.render(f"Player 1: {self.player1.input_value}", True, RED)
-        p2_answer = font_small.render(f"Player 2: {self.player2.input_value}", True, BLUE)
+        p1_answer = render_text(font_small, f"Player 1: {self.player1.input_value}", True, RED)
+        p2_answer = render_text(font_small, f"Player 2: {self.player2.input_value}", True, BLUE)
         # Red/blue positions swapped
         screen.blit(p2_answer, (SCREEN_WIDTH//4 - p2_answer.get_width()//2, 200))
         screen.blit(p1_answer, (SCREEN_WIDTH*3//4 - p1_answer.get_width()//2, 200))
         
         # Show score
-        p1_score = font_small.render(f"Score: {self.player1.score}", True, RED)
-        p2_score = font_small.render(f"Score: {self.player2.score}", True, BLUE)
+        p1_score = render_text(font_small, f"Score: {self.player1.score}", True, RED)
+        p2_score = render_text(font_small, f"Score: {self.player2.score}", True, BLUE)
         # Red/blue positions swapped
         screen.blit(p2_score, (SCREEN_WIDTH//4 - p2_score.get_width()//2, 250))
         screen.blit(p1_score, (SCREEN_WIDTH*3//4 - p1_score.get_width()//2, 250))
         
         # Show next level hint
         if self.level < 3:
-            next_text = font_small.render(f"Next: Level {self.level+1}", True, BLACK)
+            next_text = render_text(font_small, f"Next: Level {self.level+1}", True, BLACK)
             screen.blit(next_text, (SCREEN_WIDTH//2 - next_text.get_width()//2, 350))
         else:
-            next_text = font_small.render("Final Results!", True, BLACK)
+            next_text = render_text(font_small, "Final Results!", True, BLACK)
             screen.blit(next_text, (SCREEN_WIDTH//2 - next_text.get_width()//2, 350))
         
     def draw_game_over(self):
@@ -1115,29 +1184,29 @@ class ButterflyGame:
                        (255, 150, 100), (255, 200, 100), (200, 255, 100)]
         
         # Calculate total title width for centering
-        title_width = sum(font_large.render(char, True, BLACK).get_width() for char in title_text)
+        title_width = sum(render_text(font_large, char, True, BLACK).get_width() for char in title_text)
         x_offset = SCREEN_WIDTH//2 - title_width//2
         
         # Draw colorful title (each character different color, with shadow)
         for i, char in enumerate(title_text):
             color = title_colors[i % len(title_colors)]
             # Shadow
-            shadow = font_large.render(char, True, (60, 60, 60))
+            shadow = render_text(font_large, char, True, (60, 60, 60))
             screen.blit(shadow, (x_offset + 4, 84))
             # Main text
-            char_surface = font_large.render(char, True, color)
+            char_surface = render_text(font_large, char, True, color)
             screen.blit(char_surface, (x_offset, 80))
             x_offset += char_surface.get_width()
         
         # Show final score - use outlined text and larger font
         # Blue player (left)
         blue_score_text = f"BLUE: {self.player2.score}"
-        blue_score_x = SCREEN_WIDTH//4 - font_medium.render(blue_score_text, True, BLUE).get_width()//2
+        blue_score_x = SCREEN_WIDTH//4 - render_text(font_medium, blue_score_text, True, BLUE).get_width()//2
         draw_text_with_outline(screen, blue_score_text, font_medium, BLUE, blue_score_x, 200)
         
         # Red player (right)
         red_score_text = f"RED: {self.player1.score}"
-        red_score_x = SCREEN_WIDTH*3//4 - font_medium.render(red_score_text, True, RED).get_width()//2
+        red_score_x = SCREEN_WIDTH*3//4 - render_text(font_medium, red_score_text, True, RED).get_width()//2
         draw_text_with_outline(screen, red_score_text, font_medium, RED, red_score_x, 200)
         
         # Show winner - use outlined text with larger more eye-catching style
@@ -1151,19 +1220,19 @@ class ButterflyGame:
             winner_text = "IT'S A TIE!"
             winner_color = (255, 200, 0)  # Gold
         
-        winner_x = SCREEN_WIDTH//2 - font_large.render(winner_text, True, winner_color).get_width()//2
+        winner_x = SCREEN_WIDTH//2 - render_text(font_large, winner_text, True, winner_color).get_width()//2
         # Add extra shadow effect to make victory text more prominent
         for dx, dy in [(5, 5), (4, 4), (3, 3), (2, 2)]:
-            shadow = font_large.render(winner_text, True, (80, 80, 80))
+            shadow = render_text(font_large, winner_text, True, (80, 80, 80))
             screen.blit(shadow, (winner_x + dx, 285 + dy))
         draw_text_with_outline(screen, winner_text, font_large, winner_color, winner_x, 280)
         
         # Restart hint - use more obvious color
-        restart_x = SCREEN_WIDTH//2 - font_small.render("Press SPACE to play again", True, (100, 255, 100)).get_width()//2
+        restart_x = SCREEN_WIDTH//2 - render_text(font_small, "Press SPACE to play again", True, (100, 255, 100)).get_width()//2
         draw_text_with_outline(screen, "Press SPACE to play again", font_small, (100, 255, 100), restart_x, 400, (50, 50, 50), 1)
         
         # Exit hint
-        exit_x = SCREEN_WIDTH//2 - font_small.render("Press ESC to exit", True, (200, 200, 200)).get_width()//2
+        exit_x = SCREEN_WIDTH//2 - render_text(font_small, "Press ESC to exit", True, (200, 200, 200)).get_width()//2
         draw_text_with_outline(screen, "Press ESC to exit", font_small, (200, 200, 200), exit_x, 430, (50, 50, 50), 1)
         
         # Advance animation and draw players
@@ -1181,28 +1250,51 @@ class ButterflyGame:
         screen.blit(overlay, (0, 0))
         
         # Draw "PAUSED" title
-        paused_text = font_large.render("PAUSED", True, (255, 255, 100))
+        paused_text = render_text(font_large, "PAUSED", True, (255, 255, 100))
         paused_x = SCREEN_WIDTH//2 - paused_text.get_width()//2
         # Add shadow
-        shadow = font_large.render("PAUSED", True, (100, 100, 100))
+        shadow = render_text(font_large, "PAUSED", True, (100, 100, 100))
         screen.blit(shadow, (paused_x + 4, 154))
         screen.blit(paused_text, (paused_x, 150))
         
         # Draw hint message
-        hint1 = font_small.render("Press ESC to resume", True, (200, 200, 200))
+        hint1 = render_text(font_small, "Press ESC to resume", True, (200, 200, 200))
         hint1_x = SCREEN_WIDTH//2 - hint1.get_width()//2
         screen.blit(hint1, (hint1_x, 250))
         
         # Show current level and scores
-        level_text = font_small.render(f"Level {self.level}", True, (150, 200, 255))
+        level_text = render_text(font_small, f"Level {self.level}", True, (150, 200, 255))
         level_x = SCREEN_WIDTH//2 - level_text.get_width()//2
         screen.blit(level_text, (level_x, 320))
         
-        score_text = font_small.render(f"RED: {self.player1.score}  BLUE: {self.player2.score}", True, (200, 200, 200))
+        score_text = render_text(font_small, f"RED: {self.player1.score}  BLUE: {self.player2.score}", True, (200, 200, 200))
         score_x = SCREEN_WIDTH//2 - score_text.get_width()//2
         screen.blit(score_text, (score_x, 360))
         
+    def finish_match(self):
+        """Enter the game over screen and report the result to the launcher"""
+        self.state = GameState.GAME_OVER
+        if results and self.match_stats:
+            results.report(self.match_stats.record(
+                "Counting Butterfly", self.get_winner(),
+                scores=(self.player2.score, self.player1.score)
+            ))
+            self.match_stats = None
+
+    def get_winner(self):
+        """
+        Winner in launcher numbering: 1 = blue player (W/S/SPACE, left),
+        2 = red player (UP/DOWN/ENTER, right), None = tie
+        """
+        if self.player2.score > self.player1.score:
+            return 1
+        elif self.player1.score > self.player2.score:
+            return 2
+        return None
+
     def run(self):
+        """Run the game loop until the window is closed or ESC is pressed on the
+        start / game over screen. Returns the winner (see get_winner) or None."""
         last_time = time.time()
         
         while True:
@@ -1215,8 +1307,7 @@ class ButterflyGame:
             events = pygame.event.get()
             for event in events:
                 if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+                    return None
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         # ESC key toggle pause
@@ -1234,25 +1325,13 @@ class ButterflyGame:
                             self.state = self.previous_state
                             pygame.mixer.music.unpause()
                         elif self.state in [GameState.START_SCREEN, GameState.GAME_OVER]:
-                            # 如果是游戏结束状态，写入结果文件
+                            # Leaving from the game over screen reports the winner
                             if self.state == GameState.GAME_OVER:
-                                try:
-                                    result_file = "../game_result.txt"
-                                    with open(result_file, 'w') as f:
-                                        if self.player1_wins > self.player2_wins:
-                                            f.write("1")
-                                            print("[RESULT] Written: Player 1 wins")
-                                        elif self.player2_wins > self.player1_wins:
-                                            f.write("2")
-                                            print("[RESULT] Written: Player 2 wins")
-                                        else:
-                                            f.write("0")
-                                            print("[RESULT] Written: Draw")
-                                except Exception as e:
-                                    print(f"[ERROR] Could not write result file: {e}")
-                            pygame.quit()
-                            sys.exit()
+                                return self.get_winner()
+                            return None
                     elif self.state == GameState.START_SCREEN and event.key == pygame.K_SPACE:
+                        if results:
+                            self.match_stats = results.MatchStats()
                         self.start_level()
                     elif self.state == GameState.GAME_OVER and event.key == pygame.K_SPACE:
                         # Reset game
@@ -1263,7 +1342,7 @@ class ButterflyGame:
             if self.state == GameState.PAUSED:
                 # Draw pause screen
                 self.draw_pause_screen()
-                pygame.display.flip()
+                present_frame()
                 clock.tick(FPS)
                 continue
             
@@ -1291,16 +1370,26 @@ class ButterflyGame:
             elif self.state == GameState.GAME_OVER:
                 self.draw_game_over()
             
-            pygame.display.flip()
+            present_frame()
+            if self.match_stats:
+                self.match_stats.frame()
             clock.tick(FPS)
 
+def play():
+    """Play one match and return the winner (1, 2 or None) without quitting pygame"""
+    game = ButterflyGame()
+    try:
+        return game.run()
+    finally:
+        pygame.mixer.music.stop()
+
 # Run game
 if __name__ == "__main__":
     try:
-        game = ButterflyGame()
-        game.run()
+        play()
     except Exception as e:
         print(f"Game runtime error: {e}")
         import traceback
         traceback.print_exc()
-        pygame.quit()
\ No newline at end of file
+    pygame.quit()
+    sys.exit()
\ No newline at end of file
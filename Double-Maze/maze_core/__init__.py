@@ -0,0 +1,6 @@
+"""
+Double Maze 的迷宫逻辑（与绘制无关）
+- collision: 墙体占用表（按格子）和像素遮罩（图片迷宫）的碰撞检测
+- generator: 可指定种子的迷宫生成（回溯 / Kruskal / Wilson）
+- distance: 从终点出发的距离场（判胜和提示路线）
+"""
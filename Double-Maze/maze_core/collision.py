@@ -0,0 +1,160 @@
+"""
+迷宫的碰撞检测
+迷宫的墙都是对齐到 cell 网格的方块，所以用一张占用表（bytearray，每格一个字节）存储，
+判断一个矩形是否撞墙只需要查它覆盖的 1~4 个格子，不再遍历所有墙体矩形，
+迷宫再大、格子再小，每次检测的开销都不变
+
+从图片识别出的迷宫（黄色草垛）不对齐网格，用像素遮罩（pygame.mask.Mask）存储，
+遮罩由 from_threshold 一次生成，检测用 Mask.overlap，都在 C 中完成
+"""
+import pygame
+
+# is_hay_wall() 的两条颜色规则，写成 from_threshold 的 (中心颜色, 阈值)：
+# 每个通道满足 |像素 - 中心| < 阈值 时命中
+HAY_THRESHOLDS = (
+    ((203, 183, 44, 255), (53, 73, 46, 255)),  # 金黄主体: r > 150, g > 110, b < 90
+    ((188, 173, 36, 255), (68, 83, 39, 255)),  # 棕色阴影: r > 120, g > 90, b < 75
+)
+
+
+def hay_wall_mask(surface):
+    """把图片中的草垛像素标成墙，返回和图片一样大的 Mask（全透明的像素不算）"""
+    mask = pygame.mask.Mask(surface.get_size())
+    for color, threshold in HAY_THRESHOLDS:
+        mask.draw(pygame.mask.from_threshold(surface, color, threshold), (0, 0))
+    return mask
+
+
+class WallGrid:
+    """墙体占用表：cells[row * cols + col] 为 1 表示这一格是墙"""
+
+    def __init__(self, width, height, cell):
+        self.width = width
+        self.height = height
+        self.cell = cell
+        self.cols = -(-width // cell)
+        self.rows = -(-height // cell)
+        self.cells = bytearray(self.cols * self.rows)
+
+    @classmethod
+    def from_rects(cls, rects, width, height, cell):
+        """由墙体矩形列表（pygame.Rect）建表，矩形覆盖到的格子都算墙"""
+        grid = cls(width, height, cell)
+        for r in rects:
+            grid.fill_rect(r.left, r.top, r.width, r.height)
+        return grid
+
+    def fill_rect(self, x, y, w, h, value=1):
+        """把像素矩形覆盖到的格子设为墙（value=1）或通道（value=0）"""
+        c0, r0 = max(0, x // self.cell), max(0, y // self.cell)
+        c1 = min(self.cols - 1, (x + w - 1) // self.cell)
+        r1 = min(self.rows - 1, (y + h - 1) // self.cell)
+        for row in range(r0, r1 + 1):
+            start = row * self.cols
+            self.cells[start + c0:start + c1 + 1] = bytes([value]) * (c1 - c0 + 1)
+
+    def wall_rects(self):
+        """每个墙格一个 pygame.Rect（按列、再按行的顺序）"""
+        cell = self.cell
+        return [pygame.Rect(col * cell, row * cell, cell, cell)
+                for col in range(self.cols) for row in range(self.rows)
+                if self.cells[row * self.cols + col]]
+
+    def is_wall(self, col, row):
+        """格子是不是墙（网格外面都算墙）"""
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return self.cells[row * self.cols + col] != 0
+        return True
+
+    def hits(self, x, y, w, h):
+        """左上角在 (x, y)、大小 w x h 的矩形是否碰到墙或超出画面（坐标按 int 取整，和 pygame.Rect 一致）"""
+        left, top = int(x), int(y)
+        if left < 0 or top < 0 or left + w > self.width or top + h > self.height:
+            return True
+        cell, cols, cells = self.cell, self.cols, self.cells
+        c0, c1 = left // cell, (left + w - 1) // cell
+        for row in range(top // cell, (top + h - 1) // cell + 1):
+            start = row * cols
+            if any(cells[start + c0:start + c1 + 1]):
+                return True
+        return False
+
+    def hits_rect(self, rect):
+        """pygame.Rect 版本的 hits()"""
+        return self.hits(rect.x, rect.y, rect.width, rect.height)
+
+    def move(self, x, y, dx, dy, w, h):
+        """
+        把矩形移动 (dx, dy)，返回新的左上角坐标
+        两个方向分开处理：撞墙的方向贴到墙边停下，另一个方向照常移动（沿墙滑动）
+        """
+        if dx:
+            nx = x + dx
+            if self.hits(nx, y, w, h):
+                # 贴到挡住的那一格（或画面边缘）旁边
+                if dx > 0:
+                    nx = (int(nx) + w - 1) // self.cell * self.cell - w
+                    nx = min(nx, self.width - w)
+                else:
+                    nx = (int(nx) // self.cell + 1) * self.cell
+                    nx = max(nx, 0)
+                if (dx > 0 and nx < x) or (dx < 0 and nx > x) or self.hits(nx, y, w, h):
+                    nx = x
+            x = nx
+        if dy:
+            ny = y + dy
+            if self.hits(x, ny, w, h):
+                if dy > 0:
+                    ny = (int(ny) + h - 1) // self.cell * self.cell - h
+                    ny = min(ny, self.height - h)
+                else:
+                    ny = (int(ny) // self.cell + 1) * self.cell
+                    ny = max(ny, 0)
+                if (dy > 0 and ny < y) or (dy < 0 and ny > y) or self.hits(x, ny, w, h):
+                    ny = y
+            y = ny
+        return x, y
+
+
+class MaskWalls:
+    """像素级的墙体（例如 hay_wall_mask() 的结果），接口和 WallGrid 相同"""
+
+    def __init__(self, mask):
+        self.mask = mask
+        self.width, self.height = mask.get_size()
+        self._rect_masks = {}  # {(宽, 高): 填满的 Mask}
+
+    def rect_mask(self, w, h):
+        """填满的矩形遮罩，按尺寸缓存"""
+        rect_mask = self._rect_masks.get((w, h))
+        if rect_mask is None:
+            rect_mask = self._rect_masks[(w, h)] = pygame.mask.Mask((w, h), fill=True)
+        return rect_mask
+
+    def hits(self, x, y, w, h):
+        """左上角在 (x, y)、大小 w x h 的矩形是否碰到墙或超出画面"""
+        left, top = int(x), int(y)
+        if left < 0 or top < 0 or left + w > self.width or top + h > self.height:
+            return True
+        return self.mask.overlap(self.rect_mask(w, h), (left, top)) is not None
+
+    def hits_rect(self, rect):
+        """pygame.Rect 版本的 hits()"""
+        return self.hits(rect.x, rect.y, rect.width, rect.height)
+
+    def move(self, x, y, dx, dy, w, h):
+        """
+        把矩形移动 (dx, dy)，返回新的左上角坐标
+        两个方向分开处理：撞墙的方向每次退回 1 像素直到不再重叠，另一个方向照常移动
+        """
+        if dx:
+            step = dx
+            while step and self.hits(x + step, y, w, h):
+                step = max(0, step - 1) if step > 0 else min(0, step + 1)
+            x += step
+        if dy:
+            step = dy
+            while step and self.hits(x, y + step, w, h):
+                step = max(0, step - 1) if step > 0 else min(0, step + 1)
+            y += step
+        return x, y
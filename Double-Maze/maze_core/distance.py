@@ -0,0 +1,113 @@
+"""
+到终点的距离场
+每生成一个迷宫，从终点（宝箱）出发做一次广度优先搜索，记下每个位置沿通道走到终点的距离，
+和走向终点的下一步。之后：
+- 时间到时比较两个玩家谁离宝箱更近，只需要查表（考虑了墙，不是直线距离）
+- 提示路线只需要顺着"下一步"走到终点，不用每帧搜索
+"""
+import math
+from collections import deque
+
+UNREACHABLE = -1
+
+
+class DistanceField:
+    """按网格存储的距离场，每个节点代表一个 step x step 像素的格子"""
+
+    def __init__(self, passable, cols, rows, step, goals):
+        """passable: 每个节点能否通行（按行存储）；goals: 终点节点的下标"""
+        self.cols = cols
+        self.rows = rows
+        self.step = step
+        n = cols * rows
+        self.dist = [UNREACHABLE] * n   # 到终点的步数
+        self.next = [UNREACHABLE] * n   # 走向终点的下一个节点
+        queue = deque()
+        for g in goals:
+            if passable[g] and self.dist[g] == UNREACHABLE:
+                self.dist[g] = 0
+                self.next[g] = g
+                queue.append(g)
+        dist, nxt = self.dist, self.next
+        while queue:
+            i = queue.popleft()
+            col, row = i % cols, i // cols
+            d = dist[i] + 1
+            for j, ok in ((i - 1, col > 0), (i + 1, col < cols - 1), (i - cols, row > 0), (i + cols, row < rows - 1)):
+                if ok and passable[j] and dist[j] == UNREACHABLE:
+                    dist[j] = d
+                    nxt[j] = i
+                    queue.append(j)
+
+    @classmethod
+    def from_grid(cls, grid, goal_rect):
+        """按 collision.WallGrid 的格子建立距离场（一个格子一个节点）"""
+        passable = bytes(1 - c for c in grid.cells)
+        return cls(passable, grid.cols, grid.rows, grid.cell, cls._goal_nodes(goal_rect, grid.cols, grid.rows, grid.cell))
+
+    @classmethod
+    def from_walls(cls, walls, goal_rect, body_size, step=8):
+        """
+        任意提供 hits(x, y, w, h) 的墙体（例如 collision.MaskWalls）
+        每 step 像素取一个节点，玩家身体（body_size）以节点为中心放得下时才能通行
+        """
+        cols, rows = -(-walls.width // step), -(-walls.height // step)
+        bw, bh = body_size
+        passable = bytearray(cols * rows)
+        for row in range(rows):
+            cy = row * step + step // 2
+            for col in range(cols):
+                cx = col * step + step // 2
+                passable[row * cols + col] = not walls.hits(cx - bw // 2, cy - bh // 2, bw, bh)
+        return cls(passable, cols, rows, step, cls._goal_nodes(goal_rect, cols, rows, step))
+
+    @staticmethod
+    def _goal_nodes(rect, cols, rows, step):
+        c0, r0 = max(0, rect.left // step), max(0, rect.top // step)
+        c1, r1 = min(cols - 1, (rect.right - 1) // step), min(rows - 1, (rect.bottom - 1) // step)
+        return [row * cols + col for row in range(r0, r1 + 1) for col in range(c0, c1 + 1)]
+
+    def node_at(self, pos):
+        """像素坐标所在的节点；不能到达终点时取周围能到达的最近节点，都不能时返回 None"""
+        col = min(self.cols - 1, max(0, int(pos[0]) // self.step))
+        row = min(self.rows - 1, max(0, int(pos[1]) // self.step))
+        i = row * self.cols + col
+        if self.dist[i] != UNREACHABLE:
+            return i
+        best = None
+        for dc, dr in ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1)):
+            c, r = col + dc, row + dr
+            if 0 <= c < self.cols and 0 <= r < self.rows:
+                j = r * self.cols + c
+                if self.dist[j] != UNREACHABLE and (best is None or self.dist[j] < self.dist[best]):
+                    best = j
+        return best
+
+    def _center(self, i):
+        half = self.step // 2
+        return i % self.cols * self.step + half, i // self.cols * self.step + half
+
+    def distance(self, pos):
+        """
+        从像素坐标沿通道走到终点的距离（像素），到不了时返回 None
+        同一个格子里的位置按到"下一步"节点中心的直线距离区分，格子大时也分得出远近
+        """
+        i = self.node_at(pos)
+        if i is None:
+            return None
+        j = self.next[i]
+        if j == i:
+            return 0.0
+        cx, cy = self._center(j)
+        return self.dist[j] * self.step + math.hypot(pos[0] - cx, pos[1] - cy)
+
+    def path(self, pos, limit=None):
+        """从像素坐标到终点的路线：沿途节点中心的像素坐标列表（最多 limit 个）"""
+        i = self.node_at(pos)
+        points = []
+        while i is not None and (limit is None or len(points) < limit):
+            points.append(self._center(i))
+            if self.next[i] == i:
+                break
+            i = self.next[i]
+        return points
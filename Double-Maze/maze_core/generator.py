@@ -0,0 +1,166 @@
+"""
+迷宫生成
+网格按行存储在 bytearray 中：cells[row * cols + col] 为 1 表示墙，0 表示通道
+（和 collision.WallGrid 的格式相同）。奇数坐标的格子是房间，相邻房间之间隔一格墙，
+生成算法决定打通哪些墙，得到一个"完美迷宫"（任意两个房间之间只有一条路）：
+    backtracker  递归回溯（深度优先），走廊长而曲折
+    kruskal      随机 Kruskal（并查集），分叉多、死路短
+    wilson       Wilson 算法（擦除环的随机游走），在所有生成树中均匀抽样
+同样的 seed 总是生成同样的迷宫
+"""
+import random
+
+from .collision import WallGrid
+
+ALGORITHMS = ("backtracker", "kruskal", "wilson")
+
+# 房间之间的四个方向（每次走两格，中间一格是墙）
+_STEPS = ((2, 0), (-2, 0), (0, 2), (0, -2))
+
+
+def _room(tile, size):
+    """把格子坐标对齐到最近的房间坐标（奇数）"""
+    last = size - 1 if (size - 1) % 2 else size - 2
+    return min(last, max(1, tile | 1))
+
+
+def _rooms(cols, rows):
+    """所有房间的坐标"""
+    return [(x, y) for y in range(1, rows, 2) for x in range(1, cols, 2)]
+
+
+def _neighbors(x, y, cols, rows):
+    for dx, dy in _STEPS:
+        nx, ny = x + dx, y + dy
+        if 0 < nx < cols and 0 < ny < rows:
+            yield nx, ny
+
+
+def _carve_backtracker(cells, cols, rows, start, rng):
+    sx, sy = start
+    cells[sy * cols + sx] = 0
+    stack = [start]
+    while stack:
+        cx, cy = stack[-1]
+        options = [(nx, ny) for nx, ny in _neighbors(cx, cy, cols, rows) if cells[ny * cols + nx]]
+        if options:
+            nx, ny = rng.choice(options)
+            # 打通两个房间之间的墙
+            cells[((cy + ny) // 2) * cols + (cx + nx) // 2] = 0
+            cells[ny * cols + nx] = 0
+            stack.append((nx, ny))
+        else:
+            stack.pop()
+
+
+def _carve_kruskal(cells, cols, rows, start, rng):
+    rooms = _rooms(cols, rows)
+    parent = {room: room for room in rooms}
+
+    def find(room):
+        while parent[room] != room:
+            parent[room] = parent[parent[room]]
+            room = parent[room]
+        return room
+
+    edges = [((x, y), (x + dx, y + dy)) for x, y in rooms for dx, dy in ((2, 0), (0, 2))
+             if x + dx < cols and y + dy < rows]
+    rng.shuffle(edges)
+    for room in rooms:
+        cells[room[1] * cols + room[0]] = 0
+    for (ax, ay), (bx, by) in edges:
+        ra, rb = find((ax, ay)), find((bx, by))
+        if ra != rb:
+            parent[ra] = rb
+            cells[((ay + by) // 2) * cols + (ax + bx) // 2] = 0
+
+
+def _carve_wilson(cells, cols, rows, start, rng):
+    rooms = _rooms(cols, rows)
+    in_tree = {start}
+    cells[start[1] * cols + start[0]] = 0
+    for room in rooms:
+        if room in in_tree:
+            continue
+        # 随机游走直到碰到已经在树中的房间，只记住每个房间最后一次离开的方向（即擦除了环）
+        exits = {}
+        current = room
+        while current not in in_tree:
+            nxt = rng.choice(list(_neighbors(current[0], current[1], cols, rows)))
+            exits[current] = nxt
+            current = nxt
+        # 沿着记住的方向把这条路加入树
+        current = room
+        while current not in in_tree:
+            nxt = exits[current]
+            in_tree.add(current)
+            cells[current[1] * cols + current[0]] = 0
+            cells[((current[1] + nxt[1]) // 2) * cols + (current[0] + nxt[0]) // 2] = 0
+            current = nxt
+
+
+_CARVERS = {
+    "backtracker": _carve_backtracker,
+    "kruskal": _carve_kruskal,
+    "wilson": _carve_wilson,
+}
+
+
+def widen_passages(cells, cols, rows, iterations=1):
+    """
+    把和通道相邻（上下左右）的墙变成通道，重复 iterations 次
+    整个网格当作一个大整数（每格一个字节，通道为 1）一次移位完成，不逐格扫描
+    """
+    if iterations <= 0:
+        return cells
+    n = cols * rows
+    full = int.from_bytes(b"\x01" * n, "little")
+    # 每行第一列 / 最后一列为 0 的掩码，防止左右移位时跨行
+    not_first = int.from_bytes((b"\x00" + b"\x01" * (cols - 1)) * rows, "little")
+    not_last = int.from_bytes((b"\x01" * (cols - 1) + b"\x00") * rows, "little")
+    passages = int.from_bytes(cells, "little") ^ full
+    for _ in range(iterations):
+        passages = (passages
+                    | ((passages << 8) & not_first)
+                    | ((passages >> 8) & not_last)
+                    | ((passages << 8 * cols) & full)
+                    | (passages >> 8 * cols))
+    return bytearray((passages ^ full).to_bytes(n, "little"))
+
+
+def generate_cells(cols, rows, start=(1, 1), end=None, algorithm="backtracker",
+                   seed=None, rng=None, passage_expand=0):
+    """
+    生成 cols x rows 的迷宫网格，返回 bytearray（1 = 墙）
+    start / end 是格子坐标，会对齐到最近的房间；end 一定是通道
+    passage_expand: 通道加宽的次数（0 = 一格宽）
+    """
+    if algorithm not in _CARVERS:
+        raise ValueError(f"unknown maze algorithm: {algorithm!r} (choose from {', '.join(ALGORITHMS)})")
+    if cols < 3 or rows < 3:
+        raise ValueError(f"maze grid must be at least 3x3, got {cols}x{rows}")
+    rng = rng or random.Random(seed)
+    cells = bytearray(b"\x01" * (cols * rows))
+    start = (_room(start[0], cols), _room(start[1], rows))
+    _CARVERS[algorithm](cells, cols, rows, start, rng)
+    if end is not None:
+        cells[_room(end[1], rows) * cols + _room(end[0], cols)] = 0
+    return widen_passages(cells, cols, rows, passage_expand)
+
+
+def generate_maze(width, height, cell, start, end, algorithm="backtracker", seed=None,
+                  passage_expand=0, keep_clear=()):
+    """
+    生成铺满 width x height 像素的迷宫，返回 collision.WallGrid
+    start / end 是像素坐标；keep_clear 中的像素矩形（例如出生点、终点）保证没有墙
+    """
+    grid = WallGrid(width, height, cell)
+    grid.cells[:] = generate_cells(
+        grid.cols, grid.rows,
+        start=(start[0] // cell, start[1] // cell),
+        end=(end[0] // cell, end[1] // cell),
+        algorithm=algorithm, seed=seed, passage_expand=passage_expand,
+    )
+    for r in keep_clear:
+        grid.fill_rect(r.left, r.top, r.width, r.height, value=0)
+    return grid
@@ -0,0 +1,95 @@
+"""
+关卡文件
+把画好的迷宫图片按格子分成墙和通道，保存成文本关卡文件，游戏直接加载，不用每局生成：
+    每行一排格子，'x' 为墙，' ' 为通道（和 maze_game.build_level() 的格式相同）
+
+分类整张图一次完成（Pillow，都在 C 中执行）：
+1. 整张图转换成 HSV，每个通道查表后合成"草垛"黑白遮罩（规则同 maze_game.is_hay()）
+2. 遮罩按格子求平均（box 缩小），超过一半像素是草垛的格子算墙（多数表决，不再只看格子中心一个像素）
+"""
+import os
+
+from PIL import Image, ImageChops
+
+from .collision import WallGrid
+
+WALL = "x"
+PASSAGE = " "
+
+# is_hay() 的规则，换算到 Pillow 的 0~255 取值
+HAY_HUE = (20, 45)     # 0.08 <= h <= 0.18
+HAY_MIN_SAT = 64       # s >= 0.25
+HAY_MIN_VAL = 64       # v >= 0.25
+SHADOW_RGB = (120, 90, 90)  # 偏棕兜底: r > 120 and g > 90 and b < 90
+
+
+def _lut(test):
+    return [255 if test(v) else 0 for v in range(256)]
+
+
+def hay_mask(image):
+    """返回和图片一样大的 "L" 遮罩，草垛像素为 255"""
+    rgb = image.convert("RGB")
+    h, s, v = rgb.convert("HSV").split()
+    hsv_hit = ImageChops.multiply(
+        ImageChops.multiply(h.point(_lut(lambda x: HAY_HUE[0] <= x <= HAY_HUE[1])),
+                            s.point(_lut(lambda x: x >= HAY_MIN_SAT))),
+        v.point(_lut(lambda x: x >= HAY_MIN_VAL)))
+    r, g, b = rgb.split()
+    rgb_hit = ImageChops.multiply(
+        ImageChops.multiply(r.point(_lut(lambda x: x > SHADOW_RGB[0])),
+                            g.point(_lut(lambda x: x > SHADOW_RGB[1]))),
+        b.point(_lut(lambda x: x < SHADOW_RGB[2])))
+    return ImageChops.lighter(hsv_hit, rgb_hit)
+
+
+def extract_level(path, tile, size=None):
+    """
+    把迷宫图片分类成关卡，返回字符串列表（每行一排格子）
+    size=(宽, 高) 时先把图片缩放到这个尺寸（游戏画面大小）
+    """
+    with Image.open(path) as im:
+        if size is not None and im.size != tuple(size):
+            im = im.convert("RGB").resize(size, Image.BILINEAR)
+        mask = hay_mask(im)
+    cols, rows = mask.width // tile, mask.height // tile
+    # 每个格子一个像素：格子中草垛像素所占的比例（0~255）
+    votes = mask.crop((0, 0, cols * tile, rows * tile)).reduce(tile)
+    data = votes.tobytes()
+    return ["".join(WALL if data[row * cols + col] > 127 else PASSAGE for col in range(cols))
+            for row in range(rows)]
+
+
+def save_level(lines, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+
+
+def read_level(path):
+    """读取关卡文件，返回字符串列表（行尾空格可能被编辑器去掉，按最长的一行补齐）"""
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().split("\n")
+    while lines and not lines[-1].strip():
+        lines.pop()
+    cols = max((len(line) for line in lines), default=0)
+    return [line.ljust(cols) for line in lines]
+
+
+def load_level(path, width, height, keep_clear=()):
+    """
+    把关卡文件加载成 collision.WallGrid，格子大小由画面宽度和列数决定
+    keep_clear 中的像素矩形（例如出生点、终点）保证没有墙
+    """
+    lines = read_level(path)
+    if not lines or not lines[0]:
+        raise ValueError(f"empty level file: {path}")
+    cell = width // len(lines[0])
+    grid = WallGrid(width, height, cell)
+    for row, line in enumerate(lines[:grid.rows]):
+        for col, ch in enumerate(line[:grid.cols]):
+            if ch == WALL:
+                grid.cells[row * grid.cols + col] = 1
+    for r in keep_clear:
+        grid.fill_rect(r.left, r.top, r.width, r.height, value=0)
+    return grid
@@ -1,22 +1,88 @@
 import pygame
+import os
 import sys
 from PIL import Image
 from pathlib import Path
 import colorsys
+import glob
 import random
 
+from maze_core import collision, generator, levels
+from maze_core.distance import DistanceField
+
 # ------------ 基础设置 ------------
+# 资源路径基于本文件所在目录，游戏可以从任意工作目录启动
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def asset_path(rel_path):
+    """返回游戏目录下文件的绝对路径"""
+    return os.path.join(GAME_DIR, rel_path)
+
+
+# 共用图片缓存、文字缓存、显示更新和结果通道（由启动器启动时可用）
+try:
+    from game_wrappers import assets as shared_assets
+    from game_wrappers import results
+    from game_wrappers import text as shared_text
+    from game_wrappers import dirty as shared_dirty
+except ImportError:
+    shared_assets = None
+    results = None
+    shared_text = None
+    shared_dirty = None
+
+
+def load_image(path, alpha=True):
+    """加载图片；返回的 Surface 可能被共用，修改前请先 copy()"""
+    if shared_assets:
+        return shared_assets.load_image(path, alpha)
+    img = pygame.image.load(path)
+    return img.convert_alpha() if alpha else img.convert()
+
+
+def load_scaled_image(path, size=None, height=None, alpha=True, smooth=True):
+    """加载并缩放图片: size=(宽, 高) 为固定尺寸，只给 height 时保持宽高比；共用缓存中每个尺寸只缩放一次"""
+    if shared_assets:
+        if size is not None:
+            return shared_assets.load_scaled(path, size, alpha, smooth)
+        return shared_assets.load_fit(path, height=height, alpha=alpha, smooth=smooth)
+    img = load_image(path, alpha)
+    if size is None:
+        size = (int(img.get_width() * height / img.get_height()), height)
+    if img.get_size() == tuple(size):
+        return img
+    if smooth:
+        return pygame.transform.smoothscale(img, size)
+    return pygame.transform.scale(img, size)
+
+
+def render_text(font_obj, text, antialias, color):
+    """渲染文字；不变的文字（计时器、提示栏）在共用缓存中只渲染一次"""
+    if shared_text:
+        return shared_text.render(font_obj, text, color, antialias)
+    return font_obj.render(text, antialias, color)
+
+
+def present_frame():
+    """更新显示；脏矩形模式下只送出变化的区域"""
+    if shared_dirty:
+        shared_dirty.present()
+    else:
+        pygame.display.flip()
+
+
 WIDTH, HEIGHT = 800, 480
 FPS = 60
 TIMER_SECONDS = 3 * 60  # 3 分钟
 
-BG_PATH = "assets/background_new.png"  # 使用像素风格的草地背景
-BLUE_PATH = "maze/assets/blue_player.png"
-BLUE_STAND_PATH = "maze/assets/blue_player_stand.png"
-RED_PATH = "maze/assets/red_player.png"
-RED_STAND_PATH = "maze/assets/red_player_stand.png"
-CHEST_PATH = "assets/treasure_chest.png"  # 宝箱图片
-GRASS_PATH = "assets/Grass.png"  # 障碍物草丛图片
+BG_PATH = asset_path("assets/background_new.png")  # 使用像素风格的草地背景
+BLUE_PATH = asset_path("maze/assets/blue_player.png")
+BLUE_STAND_PATH = asset_path("maze/assets/blue_player_stand.png")
+RED_PATH = asset_path("maze/assets/red_player.png")
+RED_STAND_PATH = asset_path("maze/assets/red_player_stand.png")
+CHEST_PATH = asset_path("assets/treasure_chest.png")  # 宝箱图片
+GRASS_PATH = asset_path("assets/Grass.png")  # 障碍物草丛图片
 
 # 你图上的起点 — 蓝在左上、红在左下（带一点内边距）
 BLUE_START = (20, 20)
@@ -30,11 +96,20 @@ FLAG_RECT = END_ZONE
 PLAYER_SIZE = 32
 PLAYER_SPEED = 2.4
 
-IMG = "maze/assets/background_maze.png"
-OUT = "maze/level_maze.txt"
+IMG = asset_path("maze/assets/background_maze.png")
+# 随机迷宫：格子大小、生成算法（backtracker / kruskal / wilson）和种子
+# （None = 每次都不同；固定种子时每局的迷宫序列可以重现）
+MAZE_CELL = 40
+MAZE_ALGORITHM = "backtracker"
+MAZE_SEED = None
+# 有 IMG 图片时用图中的黄色草垛作为墙（像素级碰撞），没有时随机生成草丛迷宫
+IMAGE_MAZE = True
+OUT = asset_path("maze/level_maze.txt")
+# 关卡文件（tools/build_levels.py 生成）：有的话每局随机选一个，不再随机生成迷宫
+LEVELS_DIR = asset_path("maze/levels")
 TILE = 32               # 800x480 -> 25x15
 # 音乐文件路径
-MUSIC_FILE = "assets/maze_background_music.mp3"
+MUSIC_FILE = asset_path("assets/maze_background_music.mp3")
 # 全局变量
 music_playing = False
 beats = []
@@ -54,48 +129,104 @@ def is_hay_wall(rgb):
 
 
 def build_wall_mask(bg_surf):
-    """把整张背景图扫一遍，生成一个 True/False 的墙体表"""
-    w, h = bg_surf.get_size()
-    px = pygame.PixelArray(bg_surf)
-    wall_mask = [[False] * w for _ in range(h)]
-    for y in range(h):
-        for x in range(w):
-            color = bg_surf.unmap_rgb(px[x, y])
-            if is_hay_wall(color):
-                wall_mask[y][x] = True
-    del px
-    return wall_mask
-
-
-def rect_hits_wall(rect, mask):
-    """玩家的矩形跟草垛有没有撞上"""
-    # iterate only over the intersection between rect and the mask bounds
-    mw, mh = mask.get_size()
-    x0 = max(0, rect.left)
-    y0 = max(0, rect.top)
-    x1 = min(mw, rect.right)
-    y1 = min(mh, rect.bottom)
-    for y in range(y0, y1):
-        for x in range(x0, x1):
-            if mask.get_at((x, y)):
-                return True
-    return False
-
-
-def main():
+    """把整张背景图中的草垛像素标成墙，返回 pygame.mask.Mask（规则同 is_hay_wall）"""
+    return collision.hay_wall_mask(bg_surf)
+
+
+def build_static_layer(bg_surf, obstacles, grass_img, chest_img, chest_rect):
+    """把背景、草丛障碍物和宝箱合成为一张图；一局中迷宫不变，每帧只需要 blit 这一张"""
+    layer = bg_surf.copy()
+    tile_w, tile_h = grass_img.get_size()
+    for r in obstacles:
+        # 用草丛图片平铺填充整个障碍物区域，边缘不完整的部分裁剪
+        for y in range(r.top, r.bottom, tile_h):
+            for x in range(r.left, r.right, tile_w):
+                src_rect = pygame.Rect(0, 0, min(tile_w, r.right - x), min(tile_h, r.bottom - y))
+                layer.blit(grass_img, (x, y), src_rect)
+    # 终点宝箱（按原始宽高比居中显示）
+    layer.blit(chest_img, chest_rect.topleft)
+    return layer
+
+
+class MazeHud:
+    """
+    HUD 用到的 Surface 按内容缓存，内容不变时不重新渲染、不重新分配：
+    带阴影的文字按 (字体, 文字, 颜色) 缓存，半透明底板按 (尺寸, 颜色) 缓存，字体按字号只加载一次
+    """
+    MAX_TEXTS = 256
+
+    def __init__(self, load_font):
+        self._load_font = load_font
+        self._fonts = {}     # {字号: Font}
+        self._texts = {}     # {(字体, 文字, 颜色, 阴影颜色): (阴影, 文字)}
+        self._panels = {}    # {(尺寸, RGBA): Surface}
+
+    def font(self, size):
+        """字号对应的字体（第一次使用时才加载）"""
+        font_obj = self._fonts.get(size)
+        if font_obj is None:
+            font_obj = self._fonts[size] = self._load_font(size)
+        return font_obj
+
+    def text(self, font_obj, text, color, shadow_color=(10, 10, 10)):
+        """返回 (阴影, 文字) 两个 Surface"""
+        key = (font_obj, text, color, shadow_color)
+        pair = self._texts.get(key)
+        if pair is None:
+            if len(self._texts) >= self.MAX_TEXTS:
+                self._texts.clear()
+            pair = self._texts[key] = (render_text(font_obj, text, True, shadow_color),
+                                       render_text(font_obj, text, True, color))
+        return pair
+
+    def draw_text(self, surf, font_obj, text, pos, color=(255, 255, 255), shadow_offset=(2, 2), shadow_color=(10, 10, 10)):
+        """画带阴影的文字，返回文字的尺寸"""
+        sh, fg = self.text(font_obj, text, color, shadow_color)
+        surf.blit(sh, (pos[0] + shadow_offset[0], pos[1] + shadow_offset[1]))
+        surf.blit(fg, pos)
+        return fg.get_size()
+
+    def panel(self, size, rgba):
+        """填充了半透明颜色的 Surface（计时器底板、胜利遮罩）"""
+        key = (tuple(size), rgba)
+        surf = self._panels.get(key)
+        if surf is None:
+            surf = self._panels[key] = pygame.Surface(size, pygame.SRCALPHA)
+            surf.fill(rgba)
+        return surf
+
+
+def winner_number(winner):
+    """把胜者文字转换为启动器编号: 1 = P1 (Blue), 2 = P2 (Red), None = 平局/未分胜负"""
+    if winner == "P1 (Blue)":
+        return 1
+    if winner == "P2 (Red)":
+        return 2
+    return None
+
+
+def play():
+    """Play one match and return the winner: 1 = P1 (Blue), 2 = P2 (Red), None = draw/quit.
+    Does not quit pygame, so it can run inside the launcher's game host."""
     pygame.init()
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    # reuse an existing window of the right size (e.g. inside the game host)
+    screen = pygame.display.get_surface()
+    if screen is None or screen.get_size() != (WIDTH, HEIGHT):
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Pixel Maze Duel")
     clock = pygame.time.Clock()
 
     # 尝试加载 Press Start 2P 字体（放在 assets 中），没有则回退到系统字体
     def load_press_start_font(size):
-        possible_paths = ["assets/PressStart2P-Regular.ttf", "assets/pressstart2p.ttf"]
+        possible_paths = [asset_path("assets/PressStart2P-Regular.ttf"), asset_path("assets/pressstart2p.ttf")]
         for p in possible_paths:
             fp = Path(p)
             if fp.exists():
                 try:
-                    font_obj = pygame.font.Font(str(fp), size)
+                    if shared_assets:
+                        font_obj = shared_assets.load_font(str(fp), size)
+                    else:
+                        font_obj = pygame.font.Font(str(fp), size)
                     # indicate which font file was loaded (helpful for debugging)
                     print(f"[font] loaded {fp} for size {size}")
                     return font_obj
@@ -128,11 +259,11 @@ def main():
         # try to load a custom instruction background from assets (several common name variants)
         start_bg = None
         candidate_paths = [
-            "assets/instruction- background.JPG",
-            "assets/instruction-background.JPG",
-            "assets/instruction_background.JPG",
-            "assets/instruction-background.jpg",
-            "assets/instruction- background.jpg",
+            asset_path("assets/instruction- background.JPG"),
+            asset_path("assets/instruction-background.JPG"),
+            asset_path("assets/instruction_background.JPG"),
+            asset_path("assets/instruction-background.jpg"),
+            asset_path("assets/instruction- background.jpg"),
         ]
         for p in candidate_paths:
             if Path(p).exists():
@@ -166,8 +297,7 @@ def main():
         while True:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+                    return False
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     mx, my = event.pos
                     if btn_rect.collidepoint(mx, my):
@@ -177,7 +307,7 @@ def main():
                                 pygame.mixer.music.fadeout(300)
                         except Exception:
                             pass
-                        return
+                        return True
 
             # use custom start background if available
             if start_bg is not None:
@@ -212,8 +342,8 @@ def main():
 
                 x = left_x
                 for idx, w in enumerate(words):
-                    sh = font_s.render(w, True, shadow_color)
-                    fg = font_s.render(w, True, color)
+                    sh = render_text(font_s, w, True, shadow_color)
+                    fg = render_text(font_s, w, True, color)
                     surf_s.blit(sh, (x + 2, y_pos + 2))
                     surf_s.blit(fg, (x, y_pos))
                     x += w_widths[idx] + gap
@@ -240,8 +370,8 @@ def main():
 
                 # main title (double maze) centered
                 if i == 0:
-                    surf = f.render(ln, True, (255,255,255))
-                    shadow = f.render(ln, True, (10,10,10))
+                    surf = render_text(f, ln, True, (255,255,255))
+                    shadow = render_text(f, ln, True, (10,10,10))
                     screen.blit(shadow, (WIDTH // 2 - surf.get_width() // 2 + 2, current_y + 2))
                     screen.blit(surf, (WIDTH // 2 - surf.get_width() // 2, current_y))
                     current_section = None
@@ -250,8 +380,8 @@ def main():
 
                 # Controls title: centered and blue, but use instr_font (same size as body)
                 if stripped == "Controls":
-                    surf = instr_font.render(ln, True, (30,140,200))
-                    shadow = instr_font.render(ln, True, (10,10,10))
+                    surf = render_text(instr_font, ln, True, (30,140,200))
+                    shadow = render_text(instr_font, ln, True, (10,10,10))
                     screen.blit(shadow, (WIDTH // 2 - surf.get_width() // 2 + 2, current_y + 2))
                     screen.blit(surf, (WIDTH // 2 - surf.get_width() // 2, current_y))
                     current_section = "Controls"
@@ -260,8 +390,8 @@ def main():
 
                 # Goal title: centered and yellow, but same size as body
                 if stripped == "Goal":
-                    surf = instr_font.render(ln, True, (255,204,0))
-                    shadow = instr_font.render(ln, True, (10,10,10))
+                    surf = render_text(instr_font, ln, True, (255,204,0))
+                    shadow = render_text(instr_font, ln, True, (10,10,10))
                     screen.blit(shadow, (WIDTH // 2 - surf.get_width() // 2 + 2, current_y + 2))
                     screen.blit(surf, (WIDTH // 2 - surf.get_width() // 2, current_y))
                     current_section = "Goal"
@@ -285,27 +415,27 @@ def main():
                 # content under Goal: left align
                 if current_section == "Goal":
                     left_margin = 40
-                    sh = instr_font.render(ln, True, (10,10,10))
-                    fg = instr_font.render(ln, True, (255,255,255))
+                    sh = render_text(instr_font, ln, True, (10,10,10))
+                    fg = render_text(instr_font, ln, True, (255,255,255))
                     screen.blit(sh, (left_margin + 2, current_y + 2))
                     screen.blit(fg, (left_margin, current_y))
                     current_y += LINE_GAP
                     continue
 
                 # default: centered small lines
-                surf = instr_font.render(ln, True, (255,255,255))
-                shadow = instr_font.render(ln, True, (10,10,10))
+                surf = render_text(instr_font, ln, True, (255,255,255))
+                shadow = render_text(instr_font, ln, True, (10,10,10))
                 screen.blit(shadow, (WIDTH // 2 - surf.get_width() // 2 + 2, current_y + 2))
                 screen.blit(surf, (WIDTH // 2 - surf.get_width() // 2, current_y))
                 current_y += LINE_GAP
 
             # Draw the yellow start rectangle with centered black text 'Start'
             pygame.draw.rect(screen, btn_color, btn_rect)
-            start_surf = instr_font.render("Start", True, btn_text_color)
+            start_surf = render_text(instr_font, "Start", True, btn_text_color)
             screen.blit(start_surf, (btn_rect.centerx - start_surf.get_width() // 2,
                                      btn_rect.centery - start_surf.get_height() // 2))
 
-            pygame.display.flip()
+            present_frame()
             clock.tick(30)
 
     # (start screen will be shown after background is loaded)
@@ -314,14 +444,13 @@ def main():
     pygame.mouse.set_visible(True)
 
     # 加载背景图片
-    bg_image = pygame.image.load(BG_PATH).convert()
-    if bg_image.get_size() != (WIDTH, HEIGHT):
-        bg_image = pygame.transform.scale(bg_image, (WIDTH, HEIGHT))
+    bg_image = load_scaled_image(BG_PATH, size=(WIDTH, HEIGHT), alpha=False, smooth=False)
     
     # 直接使用背景图片
     bg = bg_image.copy()
     # Show the start screen now that the background is ready
-    show_start_screen()
+    if not show_start_screen():
+        return None
     # stop any menu music and start maze background music if available
     # make loading robust: some files may have wrong extensions (e.g. a WAV saved as .mp3)
     maze_music_sound = None
@@ -333,7 +462,7 @@ def main():
                 pygame.mixer.music.stop()
             except Exception:
                 pass
-        maze_music_paths = ["assets/maze_background_music.mp3", "assets/maze_background_music.ogg", "assets/maze_background_music.wav"]
+        maze_music_paths = [asset_path("assets/maze_background_music.mp3"), asset_path("assets/maze_background_music.ogg"), asset_path("assets/maze_background_music.wav")]
         for mp in maze_music_paths:
             if Path(mp).exists():
                 try:
@@ -388,152 +517,86 @@ def main():
     # 统一使用相同的目标高度，确保所有玩家图片大小一致
     PLAYER_HEIGHT = PLAYER_SIZE  # 32像素高度
     
-    # 蓝色玩家 - 行走图
-    blue_original = pygame.image.load(BLUE_PATH).convert_alpha()
-    blue_ratio = blue_original.get_width() / blue_original.get_height()
-    blue_width = int(PLAYER_HEIGHT * blue_ratio)
-    blue_img = pygame.transform.smoothscale(blue_original, (blue_width, PLAYER_HEIGHT))
-    
-    # 蓝色玩家 - 站立图
-    blue_stand_original = pygame.image.load(BLUE_STAND_PATH).convert_alpha()
-    blue_stand_ratio = blue_stand_original.get_width() / blue_stand_original.get_height()
-    blue_stand_width = int(PLAYER_HEIGHT * blue_stand_ratio)
-    blue_stand_img = pygame.transform.smoothscale(blue_stand_original, (blue_stand_width, PLAYER_HEIGHT))
-    
-    # 红色玩家 - 行走图
-    red_original = pygame.image.load(RED_PATH).convert_alpha()
-    red_ratio = red_original.get_width() / red_original.get_height()
-    red_width = int(PLAYER_HEIGHT * red_ratio)
-    red_img = pygame.transform.smoothscale(red_original, (red_width, PLAYER_HEIGHT))
+    # 蓝色玩家 - 行走图 / 站立图
+    blue_img = load_scaled_image(BLUE_PATH, height=PLAYER_HEIGHT)
+    blue_stand_img = load_scaled_image(BLUE_STAND_PATH, height=PLAYER_HEIGHT)
     
-    # 红色玩家 - 站立图
-    red_stand_original = pygame.image.load(RED_STAND_PATH).convert_alpha()
-    red_stand_ratio = red_stand_original.get_width() / red_stand_original.get_height()
-    red_stand_width = int(PLAYER_HEIGHT * red_stand_ratio)
-    red_stand_img = pygame.transform.smoothscale(red_stand_original, (red_stand_width, PLAYER_HEIGHT))
-    
-    # 加载宝箱图片作为终点标记
-    chest_img_original = pygame.image.load(CHEST_PATH).convert_alpha()
-    # 保持原始宽高比缩放宝箱，以高度为基准
-    original_width = chest_img_original.get_width()
-    original_height = chest_img_original.get_height()
-    aspect_ratio = original_width / original_height
+    # 红色玩家 - 行走图 / 站立图
+    red_img = load_scaled_image(RED_PATH, height=PLAYER_HEIGHT)
+    red_stand_img = load_scaled_image(RED_STAND_PATH, height=PLAYER_HEIGHT)
     
+    # 加载宝箱图片作为终点标记，保持原始宽高比缩放，以高度为基准
     # 设置目标高度（可以调整这个值来改变宝箱大小）
-    target_height = 60  # 宝箱高度
-    target_width = int(target_height * aspect_ratio)
-    
-    chest_img = pygame.transform.smoothscale(chest_img_original, (target_width, target_height))
+    chest_img = load_scaled_image(CHEST_PATH, height=60)
     
     # 更新终点区域以匹配宝箱大小（保持碰撞检测准确）
     # 宝箱将居中显示在原来的终点位置
     chest_rect = chest_img.get_rect(center=END_ZONE.center)
     
     # 加载障碍物草丛图片
-    grass_img_original = pygame.image.load(GRASS_PATH).convert_alpha()
     # 草丛缩放到40x40像素（与迷宫单元格大小一致）
-    grass_img = pygame.transform.smoothscale(grass_img_original, (40, 40))
-
-    # 不使用像素级碰撞检测，使用矩形碰撞
-    hay_wall_mask = pygame.mask.Mask((WIDTH, HEIGHT))  # all False (no collisions)
+    grass_img = load_scaled_image(GRASS_PATH, size=(40, 40))
+
+    # 图片迷宫：墙是图中的草垛像素，使用像素级碰撞检测
+    image_maze = None
+    if IMAGE_MAZE and Path(IMG).exists():
+        try:
+            image_maze = load_scaled_image(IMG, size=(WIDTH, HEIGHT), alpha=False)
+            print(f"[maze] using image maze {IMG}")
+        except Exception as e:
+            print(f"[maze] could not load {IMG}: {e}")
+    # 关卡文件（没有图片迷宫时使用）
+    level_files = sorted(glob.glob(os.path.join(LEVELS_DIR, "*.txt")))
+    if Path(OUT).exists():
+        level_files.append(OUT)
+    maze_rng = random.Random(MAZE_SEED)
+    if image_maze is not None:
+        hay_wall_mask = build_wall_mask(image_maze)
+    else:
+        # 随机迷宫不使用像素级碰撞检测，使用格子碰撞
+        hay_wall_mask = pygame.mask.Mask((WIDTH, HEIGHT))  # all False (no collisions)
 
     # Colors
     OBSTACLE_COLOR = (120, 80, 40)   # brown block color
     END_ZONE_COLOR = (255, 204, 0)   # gold for the end/flag
     END_ZONE_BORDER = (200, 140, 0)
 
-    # --- Maze generator: perfect maze (recursive backtracker) with 40x40 cells ---
-    def generate_obstacles(cell=40, passage_expand=0):
-        """Produce a perfect maze where each tile is `cell`×`cell` pixels.
-        We use an expanded visual grid where odd indices are passage centers and
-        carving moves by 2 tiles so walls remain aligned to the `cell` grid.
-        `passage_expand` = number of dilation iterations to widen passages (0 = 1-cell wide).
-        Returns list of pygame.Rect wall blocks (cell-aligned).
+    def build_maze():
         """
-        visual_cols = WIDTH // cell
-        visual_rows = HEIGHT // cell
-
-        # ensure at least a 3x3 visual grid
-        visual_cols = max(3, visual_cols)
-        visual_rows = max(3, visual_rows)
-
-        # map pixel pos to visual tile coords
-        def pos_to_tile(pos):
-            x, y = pos
-            tx = min(visual_cols - 1, max(0, x // cell))
-            ty = min(visual_rows - 1, max(0, y // cell))
-            return tx, ty
-
-        start_tile = pos_to_tile(BLUE_START)
-        end_tile = pos_to_tile(END_ZONE.center)
-
-        # visual grid: True = wall, False = passage
-        grid = [[True for _ in range(visual_rows)] for _ in range(visual_cols)]
-
-        # convert to "carvable" coordinates where passages are at odd indices:
-        def to_carve(tile):
-            tx, ty = tile
-            # clamp and map to odd coordinate (1,3,5,...)
-            cx = min(visual_cols - 1, max(1, tx | 1))
-            cy = min(visual_rows - 1, max(1, ty | 1))
-            return cx, cy
-
-        sx, sy = to_carve(start_tile)
-        ex, ey = to_carve(end_tile)
-
-        # carve with recursive backtracker stepping by 2 tiles
-        dirs = [(2, 0), (-2, 0), (0, 2), (0, -2)]
-        stack = [(sx, sy)]
-        grid[sx][sy] = False
-        while stack:
-            cx, cy = stack[-1]
-            neighbors = []
-            for dx, dy in dirs:
-                nx, ny = cx + dx, cy + dy
-                if 0 <= nx < visual_cols and 0 <= ny < visual_rows and grid[nx][ny]:
-                    neighbors.append((nx, ny))
-            if neighbors:
-                nx, ny = random.choice(neighbors)
-                # remove wall between
-                wx, wy = (cx + nx) // 2, (cy + ny) // 2
-                grid[wx][wy] = False
-                grid[nx][ny] = False
-                stack.append((nx, ny))
-            else:
-                stack.pop()
-
-        # ensure end is passage
-        grid[ex][ey] = False
-
-        # optionally expand passages by converting adjacent wall tiles into passages
-        for _ in range(max(0, passage_expand)):
-            new_grid = [row[:] for row in grid]
-            for tx in range(visual_cols):
-                for ty in range(visual_rows):
-                    if grid[tx][ty]:
-                        # if any 4-neighbor is passage, convert this wall to passage
-                        neighbors = [(tx+1,ty),(tx-1,ty),(tx,ty+1),(tx,ty-1)]
-                        if any(0 <= nx < visual_cols and 0 <= ny < visual_rows and not grid[nx][ny] for nx,ny in neighbors):
-                            new_grid[tx][ty] = False
-            grid = new_grid
-
-        # convert True tiles to obstacle rects
-        obs = []
-        for tx in range(visual_cols):
-            for ty in range(visual_rows):
-                if grid[tx][ty]:
-                    obs.append(pygame.Rect(tx * cell, ty * cell, cell, cell))
-
-        # remove any obstacles overlapping start/red or end
-        start_rect = pygame.Rect(BLUE_START[0], BLUE_START[1], PLAYER_SIZE, PLAYER_SIZE)
-        red_rect = pygame.Rect(RED_START[0], RED_START[1], PLAYER_SIZE, PLAYER_SIZE)
-        safe_obs = [r for r in obs if not r.colliderect(start_rect)
-                    and not r.colliderect(red_rect)
-                    and not r.colliderect(END_ZONE)]
-        return safe_obs
-
-    # initial maze: 40×40 tiles, 1-cell-wide passages (passage_expand=0)
-    OBSTACLES = generate_obstacles(cell=40, passage_expand=0)
+        准备一局的迷宫，返回 (障碍物列表, 碰撞检测, 静态层, 距离场)
+        静态层：背景 + 障碍物 + 宝箱，只在生成新迷宫时重新合成
+        距离场：从宝箱出发搜索一次，之后判胜和提示路线都只查表
+        """
+        if image_maze is not None:
+            walls = collision.MaskWalls(hay_wall_mask)
+            field = DistanceField.from_walls(walls, END_ZONE, (PLAYER_SIZE, PLAYER_SIZE))
+            return [], walls, build_static_layer(image_maze, [], grass_img, chest_img, chest_rect), field
+        # 出生点和终点周围不放墙
+        keep_clear = (pygame.Rect(BLUE_START, (PLAYER_SIZE, PLAYER_SIZE)),
+                      pygame.Rect(RED_START, (PLAYER_SIZE, PLAYER_SIZE)),
+                      END_ZONE)
+        walls = None
+        if level_files:
+            level_path = maze_rng.choice(level_files)
+            try:
+                walls = levels.load_level(level_path, WIDTH, HEIGHT, keep_clear=keep_clear)
+                print(f"[maze] loaded level {level_path}")
+            except Exception as e:
+                print(f"[maze] could not load level {level_path}: {e}")
+        if walls is None:
+            # 40×40 tiles, 1-cell-wide passages (passage_expand=0)
+            # 返回的墙体占用表直接用于碰撞检测：只查玩家覆盖的格子
+            walls = generator.generate_maze(
+                WIDTH, HEIGHT, MAZE_CELL, BLUE_START, END_ZONE.center,
+                algorithm=MAZE_ALGORITHM, seed=maze_rng.getrandbits(32), passage_expand=0,
+                keep_clear=keep_clear,
+            )
+        obstacles = walls.wall_rects()
+        field = DistanceField.from_grid(walls, END_ZONE)
+        return obstacles, walls, build_static_layer(bg, obstacles, grass_img, chest_img, chest_rect), field
+
+    # initial maze
+    OBSTACLES, walls, static_layer, distance_field = build_maze()
 
     # 玩家当前位置（浮点数）
     blue_x, blue_y = BLUE_START
@@ -545,20 +608,45 @@ def main():
     ANIM_SPEED = 10  # 每10帧切换一次动画
 
     start_ticks = pygame.time.get_ticks()
+    # HUD 缓存：计时器、底部文字和胜利画面只在内容变化时重新渲染
+    hud = MazeHud(load_press_start_font)
     # Use PressStart2P font everywhere when available
-    font = load_press_start_font(14)
-    small_font = load_press_start_font(10)
+    font = hud.font(14)
+    small_font = hud.font(10)
 
     # helper to draw text with shadow and optional color
     def draw_text_with_shadow(surf, font_obj, text, pos, color=(255,255,255), shadow_offset=(2,2), shadow_color=(10,10,10)):
-        sh = font_obj.render(text, True, shadow_color)
-        fg = font_obj.render(text, True, color)
-        surf.blit(sh, (pos[0] + shadow_offset[0], pos[1] + shadow_offset[1]))
-        surf.blit(fg, pos)
+        hud.draw_text(surf, font_obj, text, pos, color, shadow_offset, shadow_color)
+
+    def path_distance(pos):
+        """沿通道走到宝箱的距离（距离场查表），到不了时为无穷大"""
+        d = distance_field.distance(pos)
+        return float("inf") if d is None else d
+
+    # 提示路线（H 键开关）：沿距离场的"下一步"画点，玩家换了格子才重新取路线
+    show_hint = False
+    hint_dots = {}
+    for name, color in (("blue", (60, 140, 255)), ("red", (255, 70, 70))):
+        dot = pygame.Surface((8, 8), pygame.SRCALPHA)
+        pygame.draw.circle(dot, color + (170,), (4, 4), 4)
+        hint_dots[name] = dot
+    hint_paths = {}  # {玩家: (距离场, 节点, 路线上的点)}
+
+    def draw_hint(name, center):
+        node = distance_field.node_at(center)
+        cached = hint_paths.get(name)
+        if cached is None or cached[0] is not distance_field or cached[1] != node:
+            # 细网格（图片迷宫）上大约每 16 像素画一个点
+            spacing = max(1, 16 // distance_field.step)
+            cached = hint_paths[name] = (distance_field, node, distance_field.path(center)[spacing::spacing])
+        dot = hint_dots[name]
+        for x, y in cached[2]:
+            screen.blit(dot, (x - 4, y - 4))
 
     winner = None
     winner_time = None  # Track when winner was determined
     AUTO_EXIT_DELAY = 3000  # Auto exit after 3 seconds (milliseconds)
+    match_stats = results.MatchStats() if results else None  # 本局时长/帧统计，上报后清空
 
     running = True
     while running:
@@ -571,16 +659,19 @@ def main():
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     running = False
+                elif event.key == pygame.K_h:
+                    show_hint = not show_hint
                 elif event.key == pygame.K_r:
                     blue_x, blue_y = BLUE_START
                     red_x, red_y = RED_START
                     start_ticks = pygame.time.get_ticks()
                     winner = None
                     winner_time = None  # Reset winner time
+                    match_stats = results.MatchStats() if results else None
                     blue_anim_counter = 0
                     red_anim_counter = 0
                     # regenerate a fresh random maze on restart
-                    OBSTACLES = generate_obstacles(cell=40, passage_expand=0)
+                    OBSTACLES, walls, static_layer, distance_field = build_maze()
                     # restart maze background music if available
                     try:
                         if pygame.mixer.get_init():
@@ -607,19 +698,19 @@ def main():
 
         if winner is None:
             # ---------- 蓝玩家移动 (WASD) ----------
-            old_bx, old_by = blue_x, blue_y
+            blue_dx = blue_dy = 0.0
             blue_moving = False
             if keys[pygame.K_w]:
-                blue_y -= PLAYER_SPEED
+                blue_dy -= PLAYER_SPEED
                 blue_moving = True
             if keys[pygame.K_s]:
-                blue_y += PLAYER_SPEED
+                blue_dy += PLAYER_SPEED
                 blue_moving = True
             if keys[pygame.K_a]:
-                blue_x -= PLAYER_SPEED
+                blue_dx -= PLAYER_SPEED
                 blue_moving = True
             if keys[pygame.K_d]:
-                blue_x += PLAYER_SPEED
+                blue_dx += PLAYER_SPEED
                 blue_moving = True
 
             # 更新蓝色玩家动画计数器
@@ -628,33 +719,24 @@ def main():
             else:
                 blue_anim_counter = 0
 
+            # 碰撞检测：撞墙的方向停在墙边，另一个方向沿墙滑动（画面边缘也算墙）
+            blue_x, blue_y = walls.move(blue_x, blue_y, blue_dx, blue_dy, PLAYER_SIZE, PLAYER_SIZE)
             blue_rect = pygame.Rect(int(blue_x), int(blue_y), PLAYER_SIZE, PLAYER_SIZE)
-            blue_rect.clamp_ip(pygame.Rect(0, 0, WIDTH, HEIGHT))
-            # keep float position synced with the potentially clamped rect
-            blue_x, blue_y = float(blue_rect.left), float(blue_rect.top)
-            # obstacle collision (rect-based)
-            if blue_rect.collidelist(OBSTACLES) != -1:
-                blue_x, blue_y = old_bx, old_by
-                blue_rect.topleft = (int(blue_x), int(blue_y))
-
-            # remove noisy per-frame prints (use logging only on collisions or state change)
-            if rect_hits_wall(blue_rect, hay_wall_mask):
-                print(f"[DEBUG] Blue collided at ({blue_x},{blue_y})")
 
             # ---------- 红玩家移动 (方向键) ----------
-            old_rx, old_ry = red_x, red_y
+            red_dx = red_dy = 0.0
             red_moving = False
             if keys[pygame.K_UP]:
-                red_y -= PLAYER_SPEED
+                red_dy -= PLAYER_SPEED
                 red_moving = True
             if keys[pygame.K_DOWN]:
-                red_y += PLAYER_SPEED
+                red_dy += PLAYER_SPEED
                 red_moving = True
             if keys[pygame.K_LEFT]:
-                red_x -= PLAYER_SPEED
+                red_dx -= PLAYER_SPEED
                 red_moving = True
             if keys[pygame.K_RIGHT]:
-                red_x += PLAYER_SPEED
+                red_dx += PLAYER_SPEED
                 red_moving = True
 
             # 更新红色玩家动画计数器
@@ -663,17 +745,9 @@ def main():
             else:
                 red_anim_counter = 0
 
+            # 碰撞检测：撞墙的方向停在墙边，另一个方向沿墙滑动（画面边缘也算墙）
+            red_x, red_y = walls.move(red_x, red_y, red_dx, red_dy, PLAYER_SIZE, PLAYER_SIZE)
             red_rect = pygame.Rect(int(red_x), int(red_y), PLAYER_SIZE, PLAYER_SIZE)
-            red_rect.clamp_ip(pygame.Rect(0, 0, WIDTH, HEIGHT))
-            # keep float position synced with the potentially clamped rect
-            red_x, red_y = float(red_rect.left), float(red_rect.top)
-            # obstacle collision (rect-based)
-            if red_rect.collidelist(OBSTACLES) != -1:
-                red_x, red_y = old_rx, old_ry
-                red_rect.topleft = (int(red_x), int(red_y))
-
-            if rect_hits_wall(red_rect, hay_wall_mask):
-                print(f"[DEBUG] Red collided at ({red_x},{red_y})")
 
             # ---------- 判胜 ----------
             # 使用宝箱的实际位置进行碰撞检测
@@ -692,12 +766,9 @@ def main():
             elapsed = (pygame.time.get_ticks() - start_ticks) // 1000
             remaining = max(0, TIMER_SECONDS - elapsed)
             if remaining == 0 and winner is None:
-                # 时间到了没人到旗子，就比谁近
-                fx, fy = FLAG_RECT.center
-                bx, by = blue_rect.center
-                rx, ry = red_rect.center
-                b_dist = abs(bx - fx) + abs(by - fy)
-                r_dist = abs(rx - fx) + abs(ry - fy)
+                # 时间到了没人到旗子，就比谁沿通道离宝箱近（隔着墙的直线距离不算）
+                b_dist = path_distance(blue_rect.center)
+                r_dist = path_distance(red_rect.center)
                 if b_dist < r_dist:
                     winner = "P1 (Blue)"
                 elif r_dist < b_dist:
@@ -708,47 +779,34 @@ def main():
                     winner_time = pygame.time.get_ticks()
                     print(f"[TIME UP] Winner determined by distance: {winner}")
 
+            # 刚分出胜负时立即上报结果
+            if winner is not None and match_stats is not None:
+                results.report(match_stats.record("Double Maze", winner_number(winner)))
+                match_stats = None
+
         # ---------- 绘制 ----------
-        screen.blit(bg, (0, 0))
-
-        # 绘制障碍物 - 使用草丛图片平铺
-        for r in OBSTACLES:
-            # 用40x40的草丛图片平铺填充整个障碍物区域
-            for y in range(r.top, r.bottom, 40):
-                for x in range(r.left, r.right, 40):
-                    # 计算需要绘制的区域（处理边缘不完整的情况）
-                    draw_width = min(40, r.right - x)
-                    draw_height = min(40, r.bottom - y)
-                    
-                    if draw_width == 40 and draw_height == 40:
-                        # 完整的草丛
-                        screen.blit(grass_img, (x, y))
-                    else:
-                        # 部分草丛（裁剪）
-                        src_rect = pygame.Rect(0, 0, draw_width, draw_height)
-                        screen.blit(grass_img, (x, y), src_rect)
+        # 背景、障碍物和宝箱都在静态层中
+        screen.blit(static_layer, (0, 0))
 
-        # 绘制终点宝箱（按原始宽高比居中显示）
-        screen.blit(chest_img, chest_rect.topleft)
+        if show_hint:
+            draw_hint("blue", (int(blue_x) + PLAYER_SIZE // 2, int(blue_y) + PLAYER_SIZE // 2))
+            draw_hint("red", (int(red_x) + PLAYER_SIZE // 2, int(red_y) + PLAYER_SIZE // 2))
 
         # 计时器 — 使用半透明背景并且根据文字大小自动缩放（50% 透明度）
         elapsed = (pygame.time.get_ticks() - start_ticks) // 1000
         remaining = max(0, TIMER_SECONDS - elapsed)
         m, s = divmod(remaining, 60)
         timer_text = f"{m}:{s:02d}"
-        # draw timer with shadow
-        # create timer surface using helper for consistent shadow
-        # but still need size for background
-        timer_surf = font.render(timer_text, True, (255, 204, 0))
+        # draw timer with shadow; the cached text also gives the size for the background
+        timer_surf = hud.text(font, timer_text, (255, 204, 0))[1]
 
         # 动态背景尺寸（左右/上下留白）
         pad_x, pad_y = 12, 6
         bg_w = timer_surf.get_width() + pad_x * 2
         bg_h = timer_surf.get_height() + pad_y * 2
 
-        # 创建支持 alpha 的 surface，并用半透明黑色填充（128/255 ~= 50%）
-        bg_surf = pygame.Surface((bg_w, bg_h), pygame.SRCALPHA)
-        bg_surf.fill((0, 0, 0, 128))
+        # 支持 alpha 的 surface，用半透明黑色填充（128/255 ~= 50%），同样尺寸只创建一次
+        bg_surf = hud.panel((bg_w, bg_h), (0, 0, 0, 128))
 
         # 居中显示在屏幕上方（稍微向下偏移以保证不贴边）
         bg_x = WIDTH // 2 - bg_w // 2
@@ -784,19 +842,16 @@ def main():
             screen.blit(red_stand_img, (int(red_x), int(red_y)))
 
         # 底部文字
-        info_text = "Blue: WASD   Red: Arrows   R: restart   ESC: quit"
+        info_text = "Blue: WASD   Red: Arrows   H: hint   R: restart   ESC: quit"
         draw_text_with_shadow(screen, small_font, info_text, (10, HEIGHT - 26), color=(255,255,255), shadow_offset=(2,2), shadow_color=(10,10,10))
 
         if winner:
-            # Create semi-transparent overlay
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))  # Dark overlay
-            screen.blit(overlay, (0, 0))
+            # Semi-transparent overlay (created once)
+            screen.blit(hud.panel((WIDTH, HEIGHT), (0, 0, 0, 180)), (0, 0))  # Dark overlay
             
-            # Large winner announcement
-            winner_font = load_press_start_font(32)
-            winner_surf = winner_font.render(f"{winner} WINS!", True, (255, 204, 0))
-            winner_shadow = winner_font.render(f"{winner} WINS!", True, (10, 10, 10))
+            # Large winner announcement (font loaded once)
+            winner_font = hud.font(32)
+            winner_shadow, winner_surf = hud.text(winner_font, f"{winner} WINS!", (255, 204, 0))
             wx = WIDTH // 2 - winner_surf.get_width() // 2
             wy = HEIGHT // 2 - 60
             screen.blit(winner_shadow, (wx + 3, wy + 3))
@@ -809,8 +864,7 @@ def main():
                 
                 # Auto-exit message
                 exit_text = f"Returning to menu in {time_remaining + 1}..."
-                exit_surf = small_font.render(exit_text, True, (200, 200, 200))
-                exit_shadow = small_font.render(exit_text, True, (10, 10, 10))
+                exit_shadow, exit_surf = hud.text(small_font, exit_text, (200, 200, 200))
                 ex = WIDTH // 2 - exit_surf.get_width() // 2
                 ey = HEIGHT // 2 + 20
                 screen.blit(exit_shadow, (ex + 2, ey + 2))
@@ -818,8 +872,7 @@ def main():
                 
                 # Manual restart hint
                 hint_text = "Press R to restart or ESC to exit now"
-                hint_surf = small_font.render(hint_text, True, (150, 150, 150))
-                hint_shadow = small_font.render(hint_text, True, (10, 10, 10))
+                hint_shadow, hint_surf = hud.text(small_font, hint_text, (150, 150, 150))
                 hx = WIDTH // 2 - hint_surf.get_width() // 2
                 hy = HEIGHT // 2 + 60
                 screen.blit(hint_shadow, (hx + 2, hy + 2))
@@ -828,25 +881,25 @@ def main():
                 # Auto-exit after delay
                 if time_since_win >= AUTO_EXIT_DELAY:
                     print(f"[AUTO-EXIT] Exiting after {AUTO_EXIT_DELAY}ms delay")
-                    # 写入游戏结果到文件供主启动器读取
-                    try:
-                        result_file = "../game_result.txt"
-                        with open(result_file, 'w') as f:
-                            if winner == "P1 (Blue)":
-                                f.write("1")
-                                print("[RESULT] Written: Player 1 wins")
-                            elif winner == "P2 (Red)":
-                                f.write("2")
-                                print("[RESULT] Written: Player 2 wins")
-                            elif winner == "Draw":
-                                f.write("0")
-                                print("[RESULT] Written: Draw")
-                    except Exception as e:
-                        print(f"[ERROR] Could not write result file: {e}")
                     running = False
 
-        pygame.display.flip()
+        present_frame()
+        if match_stats is not None:
+            match_stats.frame()
+
+    # 停止迷宫音乐，把窗口和混音器留给调用者
+    try:
+        if maze_music_sound is not None:
+            maze_music_sound.stop()
+        pygame.mixer.music.stop()
+    except Exception:
+        pass
+
+    return winner_number(winner)
 
+
+def main():
+    play()
     pygame.quit()
     sys.exit()
 
@@ -866,28 +919,14 @@ def build_level():
     p = Path(IMG)
     if not p.exists():
         raise SystemExit(f"not found: {p}")
-    im = Image.open(p).convert("RGB")
-    if im.size != (WIDTH, HEIGHT):
-        print(f"[warn] image size {im.size}, expect {(WIDTH,HEIGHT)}")
-
-    cols = WIDTH // TILE
-    rows = HEIGHT // TILE
-    pixels = im.load()
-
-    lines = []
-    for row in range(rows):
-        y = row*TILE + TILE//2
-        y = min(HEIGHT-1, y)
-        chars = []
-        for col in range(cols):
-            x = col*TILE + TILE//2
-            x = min(WIDTH-1, x)
-            rgb = pixels[x,y]
-            chars.append('x' if is_hay(rgb) else ' ')
-        lines.append(''.join(chars))
-
-    Path(OUT).write_text('\n'.join(lines), encoding="utf-8")
-    print(f"[ok] wrote {OUT}  ({cols}x{rows})")
+    with Image.open(p) as im:
+        if im.size != (WIDTH, HEIGHT):
+            print(f"[warn] image size {im.size}, expect {(WIDTH,HEIGHT)}")
+
+    # 整张图一次分类，每个格子按其中所有像素多数表决（maze_core.levels）
+    lines = levels.extract_level(p, TILE)
+    levels.save_level(lines, OUT)
+    print(f"[ok] wrote {OUT}  ({len(lines[0]) if lines else 0}x{len(lines)})")
     # 预览前5行
     for ln in lines[:5]:
         print(ln)
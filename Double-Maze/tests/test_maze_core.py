@@ -0,0 +1,146 @@
+from collections import deque
+
+import pygame
+import pytest
+from PIL import Image
+
+from maze_core.collision import WallGrid
+from maze_core.distance import UNREACHABLE, DistanceField
+from maze_core.generator import ALGORITHMS, generate_cells
+from maze_core.levels import extract_level, load_level, read_level, save_level
+
+
+def _grid_with_wall():
+    # 200x200, 20px cells, a vertical wall in column 5 (x 100..119)
+    grid = WallGrid(200, 200, 20)
+    grid.fill_rect(100, 0, 20, 200)
+    return grid
+
+def test_wall_grid_from_rects_marks_covered_cells():
+    grid = WallGrid.from_rects([pygame.Rect(25, 45, 20, 10)], 100, 100, 20)
+    assert grid.is_wall(1, 2) and grid.is_wall(2, 2)
+    assert not grid.is_wall(1, 1)
+    assert grid.is_wall(-1, 0)  # outside the grid counts as wall
+
+def test_wall_grid_hits_walls_and_edges():
+    grid = _grid_with_wall()
+    assert not grid.hits(60, 60, 30, 30)
+    assert grid.hits(80, 60, 30, 30)
+    assert grid.hits(-1, 60, 30, 30)
+    assert grid.hits(180, 60, 30, 30)
+
+def test_wall_grid_move_slides_along_wall():
+    grid = _grid_with_wall()
+    # moving right-down into the wall: x stops flush against it, y keeps moving
+    x, y = grid.move(60, 60, 15, 7, 30, 30)
+    assert x == 70
+    assert y == 67
+
+def test_wall_grid_move_snaps_flush_moving_left():
+    grid = _grid_with_wall()
+    x, y = grid.move(125, 40, -10, 0, 30, 30)
+    assert (x, y) == (120, 40)
+
+def test_wall_grid_move_free_space_is_unchanged():
+    grid = _grid_with_wall()
+    assert grid.move(10, 10, 5, 5, 30, 30) == (15, 15)
+
+
+def _reachable(cells, cols, rows, start):
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nx < cols and 0 <= ny < rows and not cells[ny * cols + nx] and (nx, ny) not in seen:
+                seen.add((nx, ny))
+                queue.append((nx, ny))
+    return seen
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_generate_cells_same_seed_same_maze(algorithm):
+    a = generate_cells(21, 15, algorithm=algorithm, seed=7)
+    b = generate_cells(21, 15, algorithm=algorithm, seed=7)
+    assert a == b
+    assert a != generate_cells(21, 15, algorithm=algorithm, seed=8)
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_generate_cells_connects_every_room(algorithm):
+    cols, rows = 21, 15
+    cells = generate_cells(cols, rows, end=(19, 13), algorithm=algorithm, seed=3)
+    reachable = _reachable(cells, cols, rows, (1, 1))
+    rooms = {(x, y) for y in range(1, rows, 2) for x in range(1, cols, 2)}
+    assert rooms <= reachable
+    assert (19, 13) in reachable
+    # a perfect maze: every passage cell is reachable and there are no loops
+    passages = sum(1 for c in cells if not c)
+    assert len(reachable) == passages == 2 * len(rooms) - 1
+
+def test_generate_cells_rejects_tiny_or_unknown():
+    with pytest.raises(ValueError):
+        generate_cells(2, 5)
+    with pytest.raises(ValueError):
+        generate_cells(9, 9, algorithm="prim")
+
+
+def _u_maze():
+    # 3x3 cells of 10px; the goal is top-right and the only way there is around the wall
+    #   S x G
+    #   . x .
+    #   . . .
+    passable = bytes([1, 0, 1,
+                      1, 0, 1,
+                      1, 1, 1])
+    return DistanceField(passable, 3, 3, 10, goals=[2])
+
+def test_distance_field_bfs_goes_around_walls():
+    field = _u_maze()
+    assert field.dist == [6, UNREACHABLE, 0,
+                          5, UNREACHABLE, 1,
+                          4, 3, 2]
+    assert field.path((5, 5)) == [(5, 5), (5, 15), (5, 25), (15, 25), (25, 25), (25, 15), (25, 5)]
+    assert field.path((5, 5), limit=2) == [(5, 5), (5, 15)]
+
+def test_distance_field_distance_in_pixels():
+    field = _u_maze()
+    assert field.distance((25, 5)) == 0
+    assert field.distance((5, 5)) == 60
+    # inside one cell the position closer to the next step is closer to the goal
+    assert field.distance((5, 8)) < field.distance((5, 2))
+
+def test_distance_field_unreachable():
+    field = DistanceField(bytes([1, 0, 1]), 3, 1, 10, goals=[2])
+    assert field.distance((5, 5)) is None
+    assert field.path((5, 5)) == []
+    # standing inside a wall falls back to a reachable neighbour
+    assert field.distance((15, 5)) == 0
+
+
+HAY = (220, 180, 40)
+GRASS = (40, 140, 60)
+
+def _level_image(path):
+    # three 10px tiles in one row, each partly covered by hay
+    im = Image.new("RGB", (30, 10), GRASS)
+    im.paste(HAY, (0, 0, 10, 6))     # 60% hay: wall
+    im.paste(HAY, (10, 0, 20, 4))    # 40% hay: passage
+    im.paste(HAY, (20, 0, 30, 10))   # all hay except the centre pixel: still a wall
+    im.putpixel((25, 5), GRASS)
+    im.save(path)
+
+def test_extract_level_majority_vote(tmp_path):
+    path = tmp_path / "maze.png"
+    _level_image(path)
+    assert extract_level(str(path), 10) == ["x x"]
+    # scaling to twice the size keeps the same tiles
+    assert extract_level(str(path), 20, size=(60, 20)) == ["x x"]
+
+def test_level_file_round_trip(tmp_path):
+    path = tmp_path / "levels" / "maze.txt"
+    save_level(["x  ", " x "], str(path))
+    path.write_text(path.read_text().replace(" \n", "\n"))  # an editor strips trailing spaces
+    assert read_level(str(path)) == ["x  ", " x "]
+    grid = load_level(str(path), 60, 40, keep_clear=[pygame.Rect(20, 20, 20, 20)])
+    assert grid.cell == 20
+    assert grid.is_wall(0, 0) and not grid.is_wall(1, 0)
+    assert not grid.is_wall(1, 1)   # cleared by keep_clear
@@ -0,0 +1,54 @@
+"""
+迷宫生成基准测试
+每种算法在几种网格尺寸下各生成 N 个迷宫（默认 10000），报告每个迷宫的平均 / p99 / 最长耗时，
+用来确认每局换一个新迷宫不会造成掉帧（60 FPS 下一帧约 16.7 ms）
+
+用法: python tools/benchmark_maze.py [--count 10000] [--sizes 20x12,40x24,80x48]
+                                   [--algorithms backtracker,kruskal,wilson] [--expand 0]
+"""
+import os
+import sys
+import time
+import argparse
+
+# 从 Double-Maze 目录导入 maze_core
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze_core import generator  # noqa: E402
+
+FRAME_MS = 1000 / 60
+
+
+def bench(cols, rows, algorithm, count, expand):
+    """生成 count 个迷宫，返回每个迷宫的耗时（毫秒，已排序）"""
+    times = []
+    for seed in range(count):
+        started = time.perf_counter()
+        generator.generate_cells(cols, rows, (0, 0), (cols - 1, rows // 2), algorithm=algorithm,
+                                 seed=seed, passage_expand=expand)
+        times.append((time.perf_counter() - started) * 1000)
+    times.sort()
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Double Maze generation")
+    parser.add_argument("--count", type=int, default=10000, help="mazes per size and algorithm")
+    parser.add_argument("--sizes", default="20x12,40x24,80x48", help="comma-separated COLSxROWS grids")
+    parser.add_argument("--algorithms", default=",".join(generator.ALGORITHMS))
+    parser.add_argument("--expand", type=int, default=0, help="passage_expand iterations")
+    args = parser.parse_args()
+
+    print(f"{'grid':>8} {'algorithm':>12} {'mean ms':>9} {'p99 ms':>9} {'max ms':>9} {'total s':>9}")
+    for size in args.sizes.split(","):
+        cols, rows = (int(v) for v in size.lower().split("x"))
+        for algorithm in args.algorithms.split(","):
+            times = bench(cols, rows, algorithm, args.count, args.expand)
+            p99 = times[min(len(times) - 1, int(len(times) * 0.99))]
+            flag = "" if p99 < FRAME_MS else "  ⚠ over one frame"
+            print(f"{size:>8} {algorithm:>12} {sum(times) / len(times):9.3f} {p99:9.3f} "
+                  f"{times[-1]:9.3f} {sum(times) / 1000:9.2f}{flag}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+关卡提取工具
+把迷宫图片（单个文件或整个目录）按格子分类成关卡文件，多个图片用进程池并行处理。
+游戏启动时如果 maze/levels/ 中有关卡文件，每局随机选一个，不再随机生成迷宫
+
+用法: python tools/build_levels.py 图片或目录 [...] [--out maze/levels] [--tile 32] [--jobs N]
+"""
+import os
+import sys
+import glob
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+# 从 Double-Maze 目录导入 maze_core
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, GAME_DIR)
+
+from maze_core import levels  # noqa: E402
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+GAME_SIZE = (800, 480)
+
+
+def find_images(inputs):
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths += sorted(p for p in glob.glob(os.path.join(item, "*")) if p.lower().endswith(IMAGE_EXTENSIONS))
+        else:
+            paths.append(item)
+    return paths
+
+
+def build_one(job):
+    """进程池中执行：分类一张图片并写出关卡文件，返回 (输出路径, 列数, 行数, 墙格数)"""
+    path, out_dir, tile = job
+    lines = levels.extract_level(path, tile, size=GAME_SIZE)
+    out_path = os.path.join(out_dir, os.path.splitext(os.path.basename(path))[0] + ".txt")
+    levels.save_level(lines, out_path)
+    return out_path, len(lines[0]) if lines else 0, len(lines), sum(line.count(levels.WALL) for line in lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract Double Maze level files from maze images")
+    parser.add_argument("inputs", nargs="+", help="maze images or directories of images")
+    parser.add_argument("--out", default=os.path.join(GAME_DIR, "maze", "levels"), help="output directory")
+    parser.add_argument("--tile", type=int, default=32, help="tile size in pixels (at 800x480)")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    images = find_images(args.inputs)
+    if not images:
+        raise SystemExit("no maze images found")
+    jobs = [(path, args.out, args.tile) for path in images]
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        for path, (out_path, cols, rows, walls) in zip(images, pool.map(build_one, jobs)):
+            print(f"[ok] {path} -> {out_path}  ({cols}x{rows}, {walls} walls)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,44 @@ import sys
 import pygame
 from .player import Player
 from .rope import Rope
-from .utils import load_image, load_sound, load_music
-from game.projectile import Bomb
+from .utils import load_image, load_sound, load_music, load_font
+from game.projectile import BombPool, projectile_image
+from game import sequences
 import random
 import os
 import pygame
 
+# result channel and display updates, available when started by the launcher
+try:
+    from game_wrappers import results
+    from game_wrappers import dirty as shared_dirty
+except ImportError:
+    results = None
+    shared_dirty = None
+
+# fixed-timestep loop: the simulation always advances in SIM_HZ ticks per second
+# (every timer in the game counts ticks); rendering is decoupled and interpolated
+SIM_HZ = 60
+TICK_MS = 1000.0 / SIM_HZ
+MAX_FRAME_MS = 250      # longest stall fed into the accumulator (avoids a catch-up spiral)
+RENDER_FPS = 120        # render cap passed to clock.tick(); 0 = uncapped
+
+# round settings applied to both players by Game.start()
+# --- enforce strict symmetry so each tap moves the rope equally ---
+# make each pull half strength to increase difficulty
+PULL_POWER = 3          # single canonical pull strength for both sides (halved)
+TAP_DURATION = 6        # frames a tap lasts
+MAX_STAMINA = 100.0
+STAMINA_DRAIN = 1.5
+STAMINA_REGEN = 0.8
+AI_START_PAUSE = 12     # initial AI pause so it doesn't burst immediately (~0.2s)
+
+# 1-player mode: per-tick chances of the AI (right player) using its specials
+AI_CLONE_CHANCE = 0.004
+AI_BOMB_CHANCE = 0.002
+BOMB_TRAVEL_TICKS = 60
+BOMB_FREEZE_TICKS = 120
+
 # Minimal SpriteEffect implementation used by spawn_effect.
 # Provides update(), draw() and finished flag so effects list in Game works.
 class SpriteEffect:
@@ -50,17 +82,8 @@ class SpriteEffect:
             pass
 
 def load_sequence(folder_name, pad=3):
-    """Load frames named folder_name/frame_###.png from sprites folder."""
-    frames = []
-    i = 0
-    while True:
-        name = f"{folder_name}/frame_{i:0{pad}d}.png"
-        img = load_image(name)
-        if img is None:
-            break
-        frames.append(img)
-        i += 1
-    return frames
+    """Frames of the folder_name sequence (folder_name/frame_###.png), shared via game.sequences."""
+    return list(sequences.get(folder_name))
 
 class Game:
     def __init__(self, screen, width, height, ai=False):
@@ -120,11 +143,11 @@ class Game:
         if font_path:
             try:
                 # even smaller sizes
-                self.menu_font = pygame.font.Font(font_path, 28)
-                self.menu_small_font = pygame.font.Font(font_path, 14)
-                self.menu_hint_font = pygame.font.Font(font_path, 12)
-                self.menu_label_font = pygame.font.Font(font_path, 12)
-                self.determination_hint_font = pygame.font.Font(font_path, 10)
+                self.menu_font = load_font(font_path, 28)
+                self.menu_small_font = load_font(font_path, 14)
+                self.menu_hint_font = load_font(font_path, 12)
+                self.menu_label_font = load_font(font_path, 12)
+                self.determination_hint_font = load_font(font_path, 10)
                 print(f"[debug] loaded determination.ttf from: {font_path}")
             except Exception as e:
                 print(f"[debug] failed to load determination.ttf from {font_path}: {e}")
@@ -169,6 +192,8 @@ class Game:
         self.small_font = pygame.font.SysFont(None, 28)
         self.game_over = False
         self.winner = None
+        # duration / frame statistics of the running round (cleared once reported)
+        self.match_stats = None
 
         # track previous pull to detect start events
         self.left_prev_pull = 0
@@ -189,6 +214,9 @@ class Game:
         except Exception:
             pass
 
+        # gameplay background + rope body, composed by _build_scene_layer()
+        self.scene_layer = None
+
         # load gameplay background (put file at src/assets/sprites/gameplay-bg.png)
         self.game_bg = load_image("gameplay-bg.png")
         if self.game_bg:
@@ -217,8 +245,8 @@ class Game:
         # active particle/effect list
         self.effects = []
 
-        # active projectiles (bombs)
-        self.projectiles = []
+        # active projectiles (bombs), reused from a free list
+        self.projectiles = BombPool()
 
         clone_sound = load_sound("clone-smoke.wav")
         if clone_sound:
@@ -228,6 +256,8 @@ class Game:
         self.clone_sound = clone_sound
 
         self.running = True  # add this line
+        self.ai_enabled = ai
+        self.ticks = 0          # simulation ticks since the game was created
 
     def _set_music(self, which):
         """Set background music for 'menu' or 'gameplay' reliably.
@@ -305,6 +335,7 @@ class Game:
         # reset gameplay state when starting a new round
         self.game_over = False
         self.winner = None
+        self.match_stats = results.MatchStats() if results else None
         self.rope = Rope(self.width, self.height)
 
         # align rope with player center on start
@@ -338,14 +369,7 @@ class Game:
         self.left.ai_pause_timer = 0
         self.right.ai_pause_timer = 0
 
-        # --- enforce strict symmetry so each tap moves the rope equally ---
-        # make each pull half strength to increase difficulty
-        PULL_POWER = 3          # single canonical pull strength for both sides (halved)
-        TAP_DURATION = 6        # frames a tap lasts
-        MAX_STAMINA = 100.0
-        STAMINA_DRAIN = 1.5
-        STAMINA_REGEN = 0.8
-
+        # --- enforce strict symmetry so each tap moves the rope equally (see PULL_POWER) ---
         self.left.pull_strength = PULL_POWER
         self.right.pull_strength = PULL_POWER
         self.left.tap_duration = TAP_DURATION
@@ -361,7 +385,9 @@ class Game:
 
         # give AI a short initial pause so it doesn't burst immediately on game start
         if self.ai_enabled:
-            self.right.ai_pause_timer = 12  # ~0.2s at 60fps; increase if needed
+            self.right.ai_pause_timer = AI_START_PAUSE
+
+        self._build_scene_layer()
 
         # switch to gameplay music if available
         try:
@@ -407,8 +433,9 @@ class Game:
                 pass
 
             # reset projectiles and effects
-            self.projectiles = []
+            self.projectiles.clear()
             self.effects = []
+            self._build_scene_layer()
 
             # switch back to menu music
             try:
@@ -420,6 +447,22 @@ class Game:
             # ensure we at least go back to menu to avoid quitting
             self.state = "waiting"
 
+    def _build_scene_layer(self):
+        """Compose the gameplay background and the rope body (neither moves during
+        a round) into one Surface, so a frame starts with a single blit."""
+        if self.game_bg:
+            layer = self.game_bg.copy()
+        else:
+            layer = pygame.Surface((self.width, self.height))
+            layer.fill((30, 30, 30))
+        self.rope.draw_body(layer)
+        try:
+            # opaque, display-format copy: the fastest Surface to blit every frame
+            layer = layer.convert()
+        except pygame.error:
+            pass
+        self.scene_layer = layer
+
     def draw_menu(self):
         # blit a centered, aspect-correct menu background if available
         if getattr(self, "menu_bg_scaled", None):
@@ -546,30 +589,18 @@ class Game:
             if not frames:
                 return
 
-            # if target height requested, create scaled copies of frames
+            # if target height requested, use the scaled copies (built once per height)
             if target_h is not None:
-                scaled = []
-                for f in frames:
-                    fw, fh = f.get_size()
-                    if fh == 0:
-                        scaled.append(f)
-                        continue
-                    scale = float(target_h) / float(fh)
-                    nw = max(1, int(fw * scale))
-                    nh = max(1, int(fh * scale))
-                    try:
-                        scaled.append(pygame.transform.smoothscale(f, (nw, nh)))
-                    except Exception:
-                        scaled.append(f)
-                frames_used = scaled
+                frames_used = sequences.get("clone-smoke", height=target_h) or frames
             else:
                 frames_used = frames
 
             eff = SpriteEffect(x, y, frames_used, frame_rate=frame_rate)
             self.effects.append(eff)
 
-    def spawn_bomb(self, thrower, target, travel_time_frames=60):
-        """Spawn a bomb from thrower aimed at target."""
+    def spawn_bomb(self, thrower, target, travel_time_frames=60, count=1, stagger_frames=8):
+        """Spawn a bomb from thrower aimed at target.
+        count > 1 throws a volley: each further bomb lands stagger_frames later."""
         if not thrower or not target or getattr(thrower, "bomb_used", False):
             return
         sx = thrower.x + thrower.width // 2
@@ -578,56 +609,236 @@ class Game:
         ty = target.y
         dx = tx - sx
         dy = ty - sy
-        T = float(max(10, travel_time_frames))
         g = 0.4
-        vx = dx / T
-        vy = (dy - 0.5 * g * T * T) / T
-        bomb = Bomb(sx, sy, vx, vy, gravity=g)
-        self.projectiles.append(bomb)
+        for i in range(max(1, count)):
+            T = float(max(10, travel_time_frames + i * stagger_frames))
+            vx = dx / T
+            vy = (dy - 0.5 * g * T * T) / T
+            self.projectiles.spawn(sx, sy, vx, vy, gravity=g)
         thrower.bomb_used = True
 
+    def _report_result(self):
+        """send the round result to the launcher the moment a team wins"""
+        if self.match_stats is not None:
+            results.report(self.match_stats.record("Tug Of War", self.result()))
+            self.match_stats = None
+
+    def result(self):
+        """Winner in launcher numbering: 1 = left team (P1, blue),
+        2 = right team (P2, red), None while no round has been won."""
+        if self.game_over and self.winner == "Left team":
+            return 1
+        if self.game_over and self.winner == "Right team":
+            return 2
+        return None
+
+    def step(self):
+        """Advance the simulation by exactly one tick (1 / SIM_HZ seconds).
+
+        Every timer in the game (taps, stamina, freeze, clone, AI pauses, effects,
+        bomb gravity) counts ticks, so the outcome of a round depends only on the
+        inputs per tick, not on how fast frames are rendered. Does not draw.
+        """
+        self.ticks += 1
+        # capture previous pulls for sound detection
+        prev_left = self.left.pull
+        prev_right = self.right.pull
+        # remember where the knot was so render() can interpolate between ticks
+        self.rope.prev_pos = self.rope.pos
+
+        # handle menu selection flicker countdown (if active)
+        if self.menu_flicker_timer > 0:
+            self.menu_flicker_timer -= 1
+            # when timer reaches zero, finalize choice and start game
+            if self.menu_flicker_timer == 0 and self.menu_selected_choice is not None:
+                self.ai_enabled = False  # Always disable AI for 2-player
+                # clear selection state and actually start the game
+                self.menu_selected_choice = None
+                self.start()
+
+        if self.state != "waiting" and not self.game_over:
+            # ---- AI decision step: call ai_act BEFORE update so bursts apply immediately ----
+            if getattr(self, "ai_enabled", False):
+                try:
+                    rope_pos = getattr(self.rope, "pos", 0.5)
+                    rope_center = 0.5
+                    # call ai_act on right player (1-player mode)
+                    if getattr(self.right, "ai_act", None):
+                        self.right.ai_act(rope_pos, rope_center, opponent_pull=getattr(self.left, "pull", 0))
+                except Exception:
+                    pass
+
+            # update players
+            self.left.update()
+            self.right.update()
+
+            # Spawn clone effect + sound when a player activates clone (both human & AI)
+            try:
+                for player in (self.left, self.right):
+                    if getattr(player, "clone_active", False) and not getattr(player, "clone_effect_spawned", False):
+                        # place effect at the clone's position (match Player.draw clone offset),
+                        # not at the main character center.
+                        try:
+                            center_x = player.x + player.width // 2
+                            offset_x = int(player.width * 0.8)
+                            if getattr(player, "side", "") == "left":
+                                fx = center_x + offset_x - 2
+                            else:
+                                fx = center_x - offset_x + 2
+                            fy = player.y
+
+                            # spawn effect scaled to player height if supported
+                            try:
+                                self.spawn_effect(fx, fy, target_h=player.height)
+                            except TypeError:
+                                self.spawn_effect(fx, fy)
+                        except Exception:
+                            # fallback to player center if anything fails
+                            try:
+                                self.spawn_effect(player.x + player.width // 2, player.y, target_h=player.height)
+                            except Exception:
+                                pass
+
+                        if getattr(self, "clone_sound", None):
+                            try:
+                                self.clone_sound.play()
+                            except Exception:
+                                pass
+                        player.clone_effect_spawned = True
+            except Exception:
+                pass
+
+            # --- SIMPLE AI RANDOM ACTIONS (1-player only) ---
+            if getattr(self, "ai_enabled", False):
+                try:
+                    # AI random clone
+                    if (not getattr(self.right, "clone_used", False)
+                            and getattr(self.right, "clone_cooldown_timer", 0) == 0
+                            and getattr(self.right, "freeze_timer", 0) == 0
+                            and random.random() < AI_CLONE_CHANCE):
+                        try:
+                            if self.right.activate_clone():
+                                fx = self.right.x + self.right.width // 2 - int(self.right.width * 0.6) - 5
+                                fy = self.right.y
+                                try:
+                                    self.spawn_effect(fx, fy, target_h=self.right.height)
+                                except Exception:
+                                    pass
+                                if getattr(self, "clone_sound", None):
+                                    try:
+                                        self.clone_sound.play()
+                                    except Exception:
+                                        pass
+                        except Exception:
+                            pass
+
+                    # AI random bomb
+                    if (not getattr(self.right, "bomb_used", False)
+                            and getattr(self.right, "freeze_timer", 0) == 0
+                            and random.random() < AI_BOMB_CHANCE):
+                        try:
+                            self.spawn_bomb(self.right, self.left, travel_time_frames=BOMB_TRAVEL_TICKS)
+                        except Exception:
+                            pass
+
+                except Exception:
+                    pass
+            # --- end AI random actions ---
+
+            # play pull-start sound if someone just started pulling
+            if self.left.pull > 0 and prev_left == 0:
+                self._maybe_play_pull_sound()
+            if self.right.pull > 0 and prev_right == 0:
+                self._maybe_play_pull_sound()
+
+            # apply pulls to rope
+            self.rope.apply_pull(self.left.pull, self.right.pull)
+
+            # check win condition...
+            if self.rope.pos <= self.rope.min_x:
+                self.game_over = True
+                self.winner = "Left team"
+                self._maybe_play_win_sound()
+                self._report_result()
+            elif self.rope.pos >= self.rope.max_x:
+                self.game_over = True
+                self.winner = "Right team"
+                self._maybe_play_win_sound()
+                self._report_result()
+
+        # update effects
+        for e in self.effects:
+            e.update()
+        # remove finished
+        self.effects = [e for e in self.effects if not e.finished]
+
+        # update projectiles and handle collisions (one batch pass over the pool)
+        left_rect = pygame.Rect(self.left.x, self.left.y - self.left.height, self.left.width, self.left.height)
+        right_rect = pygame.Rect(self.right.x, self.right.y - self.right.height, self.right.width, self.right.height)
+        for side in self.projectiles.update(self.width, self.height, left_rect, right_rect):
+            (self.left if side == "left" else self.right).apply_bomb_hit(freeze_frames=BOMB_FREEZE_TICKS)
+            if getattr(self, "explosion_sound", None):
+                self.explosion_sound.play()
+
+    def render(self, alpha=1.0):
+        """Draw the current state. alpha (0..1) is how far the next tick has
+        progressed; moving things are drawn between their last two tick positions."""
+        if self.state == "waiting":
+            # draw menu (draw_menu fills the screen)
+            self.draw_menu()
+            return
+
+        # background + rope body (one precomposed layer) -> characters -> knot on top
+        if getattr(self, "scene_layer", None) is None:
+            self._build_scene_layer()
+        self.screen.blit(self.scene_layer, (0, 0))
+        self.left.draw(self.screen)
+        self.right.draw(self.screen)
+        prev = getattr(self.rope, "prev_pos", self.rope.pos)
+        self.rope.draw_knot(self.screen, pos=prev + (self.rope.pos - prev) * alpha)
+
+        if self.game_over:
+            # final frame: keep background visible behind game over overlay
+            self.draw_game_over()
+            return
+
+        # draw effects on top (smoke)
+        for e in self.effects:
+            e.draw(self.screen)
+
+        # draw projectiles (bombs)
+        self.projectiles.draw(self.screen, alpha)
+
+    def simulate(self, max_ticks=None):
+        """Step the current round without rendering or waiting until it is won
+        (or max_ticks have passed) and return result(). No display output is
+        needed, so thousands of ticks run per second (tests, AI tuning)."""
+        if self.state == "waiting":
+            self.start()
+        ticks = 0
+        while not self.game_over and (max_ticks is None or ticks < max_ticks):
+            self.step()
+            ticks += 1
+        return self.result()
+
     def run(self):
+        """Run until the window is closed or ESC is pressed and return result().
+        Does not quit pygame, so the game can run inside the launcher's game host.
+
+        The simulation advances in fixed SIM_HZ ticks fed by an accumulator of real
+        time; rendering runs as often as RENDER_FPS allows and interpolates between
+        ticks, so a slow frame no longer slows the game down."""
         clock = pygame.time.Clock()
+        accumulator = 0.0
+        frame_ms = 0
         while self.running:
-            # capture previous pulls for sound detection
-            prev_left = self.left.pull
-            prev_right = self.right.pull
-
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    # 如果游戏结束了，写入结果
-                    if self.game_over and self.winner:
-                        try:
-                            result_file = "../../game_result.txt"
-                            with open(result_file, 'w') as f:
-                                if self.winner == "Left team":
-                                    f.write("1")
-                                    print("[RESULT] Written: Player 1 (Left/Blue) wins")
-                                elif self.winner == "Right team":
-                                    f.write("2")
-                                    print("[RESULT] Written: Player 2 (Right/Red) wins")
-                        except Exception as e:
-                            print(f"[ERROR] Could not write result file: {e}")
-                    pygame.quit()
-                    sys.exit()
+                    return self.result()
 
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
-                        # 如果游戏结束了，写入结果
-                        if self.game_over and self.winner:
-                            try:
-                                result_file = "../../game_result.txt"
-                                with open(result_file, 'w') as f:
-                                    if self.winner == "Left team":
-                                        f.write("1")
-                                        print("[RESULT] Written: Player 1 (Left/Blue) wins")
-                                    elif self.winner == "Right team":
-                                        f.write("2")
-                                        print("[RESULT] Written: Player 2 (Right/Red) wins")
-                            except Exception as e:
-                                print(f"[ERROR] Could not write result file: {e}")
-                        pygame.quit()
-                        sys.exit()
+                        return self.result()
 
                     if self.state == "waiting":
                         # Start game immediately when Enter is pressed (for 2-player mode)
@@ -645,21 +856,6 @@ class Game:
                     elif self.game_over:
                         if event.key == pygame.K_r:
                             self.reset()
-                        elif event.key == pygame.K_ESCAPE:
-                            # 写入游戏结果到文件供主启动器读取
-                            try:
-                                result_file = "../../game_result.txt"
-                                with open(result_file, 'w') as f:
-                                    if self.winner == "Left team":
-                                        f.write("1")  # P1 (Blue) is on the left
-                                        print("[RESULT] Written: Player 1 (Left/Blue) wins")
-                                    elif self.winner == "Right team":
-                                        f.write("2")  # P2 (Red) is on the right
-                                        print("[RESULT] Written: Player 2 (Right/Red) wins")
-                            except Exception as e:
-                                print(f"[ERROR] Could not write result file: {e}")
-                            pygame.quit()
-                            sys.exit()
                     else:
                         # gameplay keydown -> trigger tap pulls (single press)
                         if event.key == pygame.K_a:
@@ -697,225 +893,39 @@ class Game:
                     if event.key == pygame.K_d:
                         try:
                             if not getattr(self.left, "bomb_used", False) and getattr(self.left, "freeze_timer", 0) == 0:
-                                self.spawn_bomb(self.left, self.right, travel_time_frames=60)
+                                self.spawn_bomb(self.left, self.right, travel_time_frames=BOMB_TRAVEL_TICKS)
                         except Exception:
                             pass
 
                     if event.key == pygame.K_j:
                         try:
                             if not getattr(self.right, "bomb_used", False) and getattr(self.right, "freeze_timer", 0) == 0:
-                                self.spawn_bomb(self.right, self.left, travel_time_frames=60)
+                                self.spawn_bomb(self.right, self.left, travel_time_frames=BOMB_TRAVEL_TICKS)
                         except Exception:
                             pass
 
-            # handle menu selection flicker countdown (if active)
-            if self.menu_flicker_timer > 0:
-                self.menu_flicker_timer -= 1
-                # when timer reaches zero, finalize choice and start game
-                if self.menu_flicker_timer == 0 and self.menu_selected_choice is not None:
-                    self.ai_enabled = False  # Always disable AI for 2-player
-                    # clear selection state and actually start the game
-                    self.menu_selected_choice = None
-                    self.start()
-
-            keys = pygame.key.get_pressed()  # still available if needed elsewhere
-
-            if self.state == "waiting":
-                self.draw_menu()
-            elif not self.game_over:
-                # ---- AI decision step: call ai_act BEFORE update so bursts apply immediately ----
-                if getattr(self, "ai_enabled", False):
-                    try:
-                        rope_pos = getattr(self.rope, "pos", 0.5)
-                        rope_center = 0.5
-                        # call ai_act on right player (1-player mode)
-                        if getattr(self.right, "ai_act", None):
-                            self.right.ai_act(rope_pos, rope_center, opponent_pull=getattr(self.left, "pull", 0))
-                    except Exception:
-                        pass
-
-                # update players
-                self.left.update()
-                self.right.update()
-
-                # Spawn clone effect + sound when a player activates clone (both human & AI)
-                try:
-                    for player in (self.left, self.right):
-                        if getattr(player, "clone_active", False) and not getattr(player, "clone_effect_spawned", False):
-                            # place effect at the clone's position (match Player.draw clone offset),
-                            # not at the main character center.
-                            try:
-                                center_x = player.x + player.width // 2
-                                offset_x = int(player.width * 0.8)
-                                if getattr(player, "side", "") == "left":
-                                    fx = center_x + offset_x - 2
-                                else:
-                                    fx = center_x - offset_x + 2
-                                fy = player.y
-
-                                # spawn effect scaled to player height if supported
-                                try:
-                                    self.spawn_effect(fx, fy, target_h=player.height)
-                                except TypeError:
-                                    self.spawn_effect(fx, fy)
-                            except Exception:
-                                # fallback to player center if anything fails
-                                try:
-                                    self.spawn_effect(player.x + player.width // 2, player.y, target_h=player.height)
-                                except Exception:
-                                    pass
-
-                            if getattr(self, "clone_sound", None):
-                                try:
-                                    self.clone_sound.play()
-                                except Exception:
-                                    pass
-                            player.clone_effect_spawned = True
-                except Exception:
-                    pass
-
-                # DEBUG: compare pull values, strengths, stamina and timers
-                try:
-                    # gather debug info without printing to avoid spamming tests;
-                    # keep as a local tuple so the block is not empty and safe to run.
-                    left_info = (self.left.pull, getattr(self.left, "pull_strength", None), getattr(self.left, "stamina", None))
-                    right_info = (self.right.pull, getattr(self.right, "pull_strength", None), getattr(self.right, "stamina", None))
-                    # assign to a temporary variable to avoid lint warnings
-                    _debug_snapshot = (left_info, right_info)
-                except Exception:
-                    pass
-
-                # --- SIMPLE AI RANDOM ACTIONS (1-player only) ---
-                if getattr(self, "ai_enabled", False):
-                    try:
-                        # AI random clone
-                        if (not getattr(self.right, "clone_used", False)
-                                and getattr(self.right, "clone_cooldown_timer", 0) == 0
-                                and getattr(self.right, "freeze_timer", 0) == 0
-                                and random.random() < 0.004):
-                            try:
-                                if self.right.activate_clone():
-                                    fx = self.right.x + self.right.width // 2 - int(self.right.width * 0.6) - 5
-                                    fy = self.right.y
-                                    try:
-                                        self.spawn_effect(fx, fy, target_h=self.right.height)
-                                    except Exception:
-                                        pass
-                                    if getattr(self, "clone_sound", None):
-                                        try:
-                                            self.clone_sound.play()
-                                        except Exception:
-                                            pass
-                            except Exception:
-                                pass
+            # run as many fixed ticks as real time has accumulated (capped after long stalls)
+            accumulator += min(frame_ms, MAX_FRAME_MS)
+            while accumulator >= TICK_MS:
+                self.step()
+                accumulator -= TICK_MS
 
-                        # AI random bomb
-                        if (not getattr(self.right, "bomb_used", False)
-                                and getattr(self.right, "freeze_timer", 0) == 0
-                                and random.random() < 0.002):
-                            try:
-                                self.spawn_bomb(self.right, self.left, travel_time_frames=60)
-                            except Exception:
-                                pass
+            self.render(accumulator / TICK_MS)
 
-                    except Exception:
-                        pass
-                # --- end AI random actions ---
-
-                # play pull-start sound if someone just started pulling
-                if self.left.pull > 0 and prev_left == 0:
-                    self._maybe_play_pull_sound()
-                if self.right.pull > 0 and prev_right == 0:
-                    self._maybe_play_pull_sound()
-
-                # apply pulls to rope
-                self.rope.apply_pull(self.left.pull, self.right.pull)
-
-                # check win condition...
-                if self.rope.pos <= self.rope.min_x:
-                    self.game_over = True
-                    self.winner = "Left team"
-                    self._maybe_play_win_sound()
-                elif self.rope.pos >= self.rope.max_x:
-                    self.game_over = True
-                    self.winner = "Right team"
-                    self._maybe_play_win_sound()
-
-            # draw: use background during gameplay, menu draws with draw_menu()
-            if self.state == "waiting":
-                # draw menu (draw_menu fills the screen)
-                self.draw_menu()
-            elif self.game_over:
-                # final frame: keep background visible behind game over overlay
-                if self.game_bg:
-                    self.screen.blit(self.game_bg, (0, 0))
-                else:
-                    self.screen.fill((30, 30, 30))
-                self.rope.draw_body(self.screen)
-                self.left.draw(self.screen)
-                self.right.draw(self.screen)
-                self.rope.draw_knot(self.screen)
-                self.draw_game_over()
+            # (display flip / tick follows)
+            if shared_dirty:
+                # only the changed regions when dirty-rect mode is on
+                shared_dirty.present()
             else:
-                # gameplay: background -> rope body -> characters -> knot on top
-                if self.game_bg:
-                    self.screen.blit(self.game_bg, (0, 0))
-                else:
-                    self.screen.fill((30, 30, 30))
-                self.rope.draw_body(self.screen)
-                self.left.draw(self.screen)
-                self.right.draw(self.screen)
-                self.rope.draw_knot(self.screen)
-
-                # draw effects on top (smoke)
-                for e in self.effects:
-                    e.draw(self.screen)
-
-                # draw projectiles (bombs) - invisible for now
-                for p in self.projectiles:
-                    p.draw(self.screen)
-
-            # update effects
-            for e in self.effects:
-                e.update()
-            # remove finished
-            self.effects = [e for e in self.effects if not e.finished]
-
-            # update projectiles and handle collisions
-            for p in list(self.projectiles):
-                p.update()
-                if p.alive and not p.exploded:
-                    r = p.get_rect()
-                    if p.vx > 0:
-                        target = pygame.Rect(self.right.x, self.right.y - self.right.height, self.right.width, self.right.height)
-                        if r.colliderect(target):
-                            self.right.apply_bomb_hit(freeze_frames=120)
-                            if getattr(self, "explosion_sound", None):
-                                self.explosion_sound.play()
-                            p.exploded = True
-                            p.alive = False
-                    else:
-                        target = pygame.Rect(self.left.x, self.left.y - self.left.height, self.left.width, self.left.height)
-                        if r.colliderect(target):
-                            self.left.apply_bomb_hit(freeze_frames=120)
-                            if getattr(self, "explosion_sound", None):
-                                self.explosion_sound.play()
-                            p.exploded = True
-                            p.alive = False
-                if not p.alive or p.offscreen(self.width, self.height):
-                    try:
-                        self.projectiles.remove(p)
-                    except Exception:
-                        pass
+                pygame.display.flip()
+            if self.match_stats is not None:
+                self.match_stats.frame()
+            frame_ms = clock.tick(RENDER_FPS)
 
-            # (display flip / tick follows)
-            pygame.display.flip()
-            clock.tick(60)  # cap at 60 FPS
+        return self.result()
 
 class Projectile:
     def __init__(self, x, y, vx, vy):
-        import os
-        import pygame
         self.x = x
         self.y = y
         self.vx = vx
@@ -925,52 +935,13 @@ class Projectile:
         self._image_name = None
         self.image = None
 
-        # candidates to try
-        sprites_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "assets", "sprites"))
-        candidates = [
-            os.path.join(sprites_dir, "bomb.png"),
-            os.path.join(sprites_dir, "bomb0.png"),
-            os.path.join(sprites_dir, "projectile.png"),
-            os.path.join(sprites_dir, "missile.png"),
-            "bomb.png",
-        ]
-
-        # try each candidate and print debug info about existence + load error
-        for path in candidates:
-            try:
-                exists = os.path.exists(path)
-            except Exception:
-                exists = False
-            print(f"[debug] Projectile: trying path={path} exists={exists}")
-            if not exists:
-                continue
-            try:
-                img = pygame.image.load(path)
-                try:
-                    img = img.convert_alpha()
-                except Exception:
-                    img = img.convert()
-                self.image = img
-                self._image_name = path
-                print(f"[debug] Projectile: loaded image {path}")
-                break
-            except Exception as e:
-                print(f"[debug] Projectile: failed to load {path}: {e}")
-
-        # fallback: try helper load_image (may search by basename)
-        if not self.image:
-            try:
-                img = load_image("bomb.png")
-                if img:
-                    self.image = img
-                    self._image_name = "bomb.png (via load_image)"
-                    print(f"[debug] Projectile: loaded bomb.png via load_image")
-            except Exception as e:
-                print(f"[debug] Projectile: load_image raised: {e}")
+        # shared, preloaded image (no disk access per projectile)
+        self.image = projectile_image("bomb")
+        if self.image:
+            self._image_name = "bomb"
 
         # final fallback placeholder
         if not self.image:
-            print("[debug] Projectile: using placeholder gray circle")
             surf = pygame.Surface((16, 16), pygame.SRCALPHA)
             pygame.draw.circle(surf, (180, 180, 180), (8, 8), 6)
             self.image = surf
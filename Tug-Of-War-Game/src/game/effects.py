@@ -1,35 +1,15 @@
 import pygame
-from .utils import load_image
+from . import sequences
 
-def load_sequence(name, num_frames):
+def load_sequence(name, num_frames=None):
     """
-    Load a sequence of images. Supports two common patterns:
-      - name + index + .png   (e.g. "explosion" -> explosion0.png)
-      - name + index padded   (e.g. "clone-smoke/frame_" -> clone-smoke/frame_000.png)
-    Tries both index and zero-padded (3 digits).
+    Load the first num_frames frames of a sequence (all frames when None). Supports
+    both layouts (explosion0.png ... and clone-smoke/frame_000.png ...) via game.sequences,
+    which scans the sprites once and shares the decoded frames.
     """
-    frames = []
-    for i in range(num_frames):
-        tried = []
-        candidates = [
-            f"{name}{i}.png",
-            f"{name}{i:03d}.png",
-            # also support if caller passed base without trailing separator
-            f"{name}/{i}.png",
-            f"{name}/{i:03d}.png",
-        ]
-        found = None
-        for fname in candidates:
-            tried.append(fname)
-            img = load_image(fname)
-            if img:
-                found = img
-                break
-        if found:
-            frames.append(found)
-        else:
-            print(f"[debug] Failed to load sequence frame for index {i}, tried: {tried}")
-    print(f"[debug] load_sequence('{name}', {num_frames}) -> {len(frames)} frames")
+    frames = list(sequences.get(name)[:num_frames])
+    if num_frames is not None and len(frames) < num_frames:
+        print(f"[debug] load_sequence('{name}', {num_frames}) -> only {len(frames)} frames")
     return frames
 
 class Anim:
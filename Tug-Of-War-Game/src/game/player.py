@@ -1,9 +1,20 @@
 import pygame
 import random
 from game.utils import load_image
-from game.effects import ExplosionAnim, load_sequence
+from game.effects import ExplosionAnim
+from game import sequences
 
 class Player:
+    # AI tuning, all per simulation tick (game.selfplay sweeps these headless)
+    AI_AGGRESSIVENESS = 0.95
+    AI_IDLE_BIAS = 0.45             # added to the burst chance while the opponent is not pulling
+    AI_RESPONSE_BIAS = 0.7          # added to the burst chance while the opponent is pulling
+    AI_OPPORTUNISTIC_CHANCE = 0.18  # extra burst chance while the opponent is not pulling
+    AI_BURST_TICKS = (1, 4)         # very short bursts
+    AI_PAUSE_TICKS = (1, 6)         # short pause
+    AI_CLONE_WISH = {"left": 0.008, "right": 0.012}
+    AI_BOMB_WISH = {"left": 0.003, "right": 0.008}
+
     def __init__(self, x, y, width, height, side, push_img_path, pull_img_path):
         self.side = side
         self.x = x
@@ -26,7 +37,7 @@ class Player:
         # AI timers / params
         # Keep pull strength identical for both players so pulls are fair.
         # Side-specific difficulty should be expressed via ai_aggressiveness and timers only.
-        self.ai_aggressiveness = 0.95
+        self.ai_aggressiveness = self.AI_AGGRESSIVENESS
         self.ai_burst_timer = 0
         self.ai_pause_timer = 0
 
@@ -53,8 +64,8 @@ class Player:
             push_name = "boy-push.png"
             pull_name = "boy-pull.png"
 
-        self.push_img = load_image(push_name)
-        self.pull_img = load_image(pull_name)
+        self.push_img = load_image(push_name, size=(self.width, self.height))
+        self.pull_img = load_image(pull_name, size=(self.width, self.height))
 
         # If preferred files are missing, log warning and attempt fallback but do NOT
         # let fallback override a successfully loaded preferred image.
@@ -97,11 +108,15 @@ class Player:
             except Exception:
                 self.pull_img = pygame.transform.scale(self.pull_img, (self.width, self.height))
 
-        # preload clone smoke frames (folder: src/assets/sprites/clone-smoke/)
+        # semi-transparent clone sprites, built once instead of copying every frame
+        self.clone_push_img = self._clone_variant(self.push_img)
+        self.clone_pull_img = self._clone_variant(self.pull_img)
+
+        # clone smoke frames (folder: src/assets/sprites/clone-smoke/), shared by all players
         try:
-            self.clone_smoke_frames = load_sequence("clone-smoke")
+            self.clone_smoke_frames = sequences.get("clone-smoke")
         except Exception:
-            self.clone_smoke_frames = []
+            self.clone_smoke_frames = ()
 
         # active particle/effect list
         self.effects = []
@@ -109,9 +124,21 @@ class Player:
         # 300 ms total for 6 frames -> 50 ms per frame
         # total explosion time in milliseconds: 6 frames * 100ms = 600ms
         self.explosion_duration_ms = 600
-        self.explosion_frames = load_sequence("explosion", 6)
+        self.explosion_frames = sequences.get("explosion")[:6]
         self.explosion_anim = None
 
+    @staticmethod
+    def _clone_variant(img, alpha=160):
+        if img is None:
+            return None
+        try:
+            clone_img = img.copy()
+            # semi-transparent
+            clone_img.set_alpha(alpha)
+        except Exception:
+            clone_img = img
+        return clone_img
+
     def press_pull(self):
         # cannot pull if frozen
         if self.freeze_timer > 0:
@@ -154,8 +181,13 @@ class Player:
         cy += int(y_offset)
 
         size = int(max(self.width, self.height) * 1.6)
+        # scale to cover size x size (same rule as ExplosionAnim's target_size), built once and shared
+        fw, fh = self.explosion_frames[0].get_size()
+        frames = self.explosion_frames
+        if fw > 0 and fh > 0:
+            frames = sequences.get("explosion", scale=max(size / float(fw), size / float(fh)))[:len(frames)]
         # pass explicit duration in milliseconds
-        self.explosion_anim = ExplosionAnim(cx, cy, self.explosion_frames, duration_ms=self.explosion_duration_ms, target_size=(size, size))
+        self.explosion_anim = ExplosionAnim(cx, cy, frames, duration_ms=self.explosion_duration_ms)
 
     def update(self, *args, **kwargs):
         # always update explosion animation first
@@ -233,39 +265,42 @@ class Player:
             condition = rope_pos < (rope_center - threshold)
 
         # higher base chance to start bursts, but keep bursts short so no long holds
-        respond_bias = 0.45 if opponent_pull == 0 else 0.7
+        respond_bias = self.AI_IDLE_BIAS if opponent_pull == 0 else self.AI_RESPONSE_BIAS
 
         if self.ai_pause_timer == 0:
             chance = min(1.0, self.ai_aggressiveness + respond_bias)
             if condition and random.random() < chance:
                 # SHORT burst lengths, very brief pauses => frequent short pulls
-                self.ai_burst_timer = random.randint(1, 4)   # very short bursts
-                self.ai_pause_timer = random.randint(1, 6)   # short pause
+                self.ai_burst_timer = random.randint(*self.AI_BURST_TICKS)
+                self.ai_pause_timer = random.randint(*self.AI_PAUSE_TICKS)
                 return
 
         # higher opportunistic short-burst chance when opponent not pulling
-        if opponent_pull == 0 and random.random() < 0.18:
-            self.ai_burst_timer = random.randint(1, 4)
-            self.ai_pause_timer = random.randint(1, 6)
+        if opponent_pull == 0 and random.random() < self.AI_OPPORTUNISTIC_CHANCE:
+            self.ai_burst_timer = random.randint(*self.AI_BURST_TICKS)
+            self.ai_pause_timer = random.randint(*self.AI_PAUSE_TICKS)
             return
 
         # small increased chance for specials (still single-use per round)
         if not getattr(self, "clone_used", False) and not getattr(self, "clone_active", False):
-            if random.random() < (0.012 if self.side == "right" else 0.008):
+            if random.random() < self.AI_CLONE_WISH.get(self.side, 0.0):
                 self.ai_wants_clone = True
 
         if not getattr(self, "bomb_used", False):
-            if random.random() < (0.008 if self.side == "right" else 0.003):
+            if random.random() < self.AI_BOMB_WISH.get(self.side, 0.0):
                 self.ai_wants_bomb = True
 
     def draw(self, surface):
         # draw player sprite
         # show pull frame when actively pulling, else ready/push frame if available
         img = None  # Initialize img to None first
+        clone_img = None
         if self.pull > 0 and self.pull_img:
             img = self.pull_img
+            clone_img = self.clone_pull_img
         elif self.push_img:
             img = self.push_img
+            clone_img = self.clone_push_img
 
         if img:
             rect = img.get_rect(center=(self.x + self.width // 2, self.y))
@@ -277,13 +312,7 @@ class Player:
             pygame.draw.rect(surface, color, rect)
 
         # draw clone (semi-transparent copy) in front if active
-        if self.clone_active and img:
-            try:
-                clone_img = img.copy()
-                # semi-transparent
-                clone_img.set_alpha(160)
-            except Exception:
-                clone_img = img
+        if self.clone_active and clone_img:
             # offset in front toward center: left clone appears to the right, right clone to the left
             offset_x = int(self.width * 0.8)
             # small manual nudges: left clone 2px left, right clone 2px right
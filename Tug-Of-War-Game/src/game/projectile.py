@@ -11,7 +11,7 @@ _BOMB_IMG = load_image("bomb.png")
 
 # explicit fallback to src/assets/sprites/bomb.png
 if not _BOMB_IMG:
-    path = os.path.join("src", "assets", "sprites", "bomb.png")
+    path = os.path.join(os.path.dirname(__file__), "..", "assets", "sprites", "bomb.png")
     if os.path.exists(path):
         try:
             _BOMB_IMG = pygame.image.load(path).convert_alpha()
@@ -31,37 +31,57 @@ if _BOMB_IMG:
     except Exception:
         pass
 
+# one preloaded, pre-scaled image per projectile type (None -> fallback circle)
+PROJECTILE_IMAGES = {"bomb": _BOMB_IMG}
+
+
+def projectile_image(kind="bomb"):
+    """The shared image of a projectile type; never touches the disk."""
+    return PROJECTILE_IMAGES.get(kind)
+
+
 class Bomb:
     """Simple parabolic projectile using bomb.png when available."""
     def __init__(self, x, y, vx, vy, gravity=0.4):
+        self.reset(x, y, vx, vy, gravity)
+
+    def reset(self, x, y, vx, vy, gravity=0.4):
+        """(Re)launch the bomb; used by BombPool to reuse finished bombs."""
         self.x = float(x)
         self.y = float(y)
         self.vx = float(vx)
         self.vy = float(vy)
         self.gravity = gravity
+        # position one tick ago (for interpolated drawing)
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.alive = True
         self.exploded = False
 
     def update(self):
         if not self.alive or self.exploded:
             return
+        self.prev_x, self.prev_y = self.x, self.y
         self.vy += self.gravity
         self.x += self.vx
         self.y += self.vy
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
+        """Draw the bomb alpha (0..1) of the way from its previous to its current position."""
         if not self.alive or self.exploded:
             return
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
         if _BOMB_IMG:
             try:
-                rect = _BOMB_IMG.get_rect(center=(int(self.x), int(self.y)))
+                rect = _BOMB_IMG.get_rect(center=(int(x), int(y)))
                 surface.blit(_BOMB_IMG, rect)
                 return
             except Exception:
                 pass
         # fallback: draw same-sized gray circle
         radius = max(4, BOMB_SIZE // 2)
-        pygame.draw.circle(surface, (80, 80, 80), (int(self.x), int(self.y)), radius)
+        pygame.draw.circle(surface, (80, 80, 80), (int(x), int(y)), radius)
 
     def get_rect(self):
         if _BOMB_IMG:
@@ -71,4 +91,57 @@ class Bomb:
         return pygame.Rect(int(self.x - r), int(self.y - r), r*2, r*2)
 
     def offscreen(self, width, height):
-        return (self.x < -200) or (self.x > width + 200) or (self.y > height + 400)
\ No newline at end of file
+        return (self.x < -200) or (self.x > width + 200) or (self.y > height + 400)
+
+
+class BombPool:
+    """Active bombs plus a free list of finished ones, so throwing allocates nothing.
+
+    Iterating the pool yields the active bombs in launch order.
+    """
+    def __init__(self, prealloc=8):
+        self.active = []
+        self.free = [Bomb(0, 0, 0, 0) for _ in range(prealloc)]
+
+    def __iter__(self):
+        return iter(self.active)
+
+    def __len__(self):
+        return len(self.active)
+
+    def spawn(self, x, y, vx, vy, gravity=0.4):
+        bomb = self.free.pop() if self.free else Bomb(x, y, vx, vy, gravity)
+        bomb.reset(x, y, vx, vy, gravity)
+        self.active.append(bomb)
+        return bomb
+
+    def clear(self):
+        self.free.extend(self.active)
+        self.active = []
+
+    def update(self, width, height, left_rect, right_rect):
+        """
+        Advance every bomb one tick and collide it with the player it flies toward
+        (rightward bombs -> right_rect, leftward -> left_rect). Returns the sides hit
+        this tick ("left"/"right", in launch order); finished bombs go back to the free list.
+        """
+        hits = []
+        still_active = []
+        for bomb in self.active:
+            bomb.update()
+            if bomb.alive and not bomb.exploded:
+                side, target = ("right", right_rect) if bomb.vx > 0 else ("left", left_rect)
+                if bomb.get_rect().colliderect(target):
+                    hits.append(side)
+                    bomb.exploded = True
+                    bomb.alive = False
+            if not bomb.alive or bomb.offscreen(width, height):
+                self.free.append(bomb)
+            else:
+                still_active.append(bomb)
+        self.active = still_active
+        return hits
+
+    def draw(self, surface, alpha=1.0):
+        for bomb in self.active:
+            bomb.draw(surface, alpha)
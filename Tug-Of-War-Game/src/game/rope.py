@@ -10,6 +10,7 @@ class Rope:
         self.min_x = 120
         self.max_x = width - 120
         self.pos = width // 2
+        self.prev_pos = self.pos  # knot position one tick ago (for interpolated drawing)
         # vertical position: below characters (baseline)
         self.y = height // 2 + 80
 
@@ -59,15 +60,18 @@ class Rope:
             # fallback: draw a thicker line (2x thickness)
             pygame.draw.line(surface, (220, 200, 60), (0, self.y), (self.width, self.y), 6)
 
-    def draw_knot(self, surface):
+    def draw_knot(self, surface, pos=None):
+        """Draw the knot at pos (defaults to the current rope position)."""
+        if pos is None:
+            pos = self.pos
         if self.knot_img:
             kw, kh = self.knot_img.get_size()
-            kx = int(self.pos - kw // 2)
+            kx = int(pos - kw // 2)
             ky = int(self.y - kh // 2 + getattr(self, "knot_offset", 0))
             surface.blit(self.knot_img, (kx, ky))
         else:
             # baseline fallback circle
-            pygame.draw.circle(surface, (240, 240, 240), (int(self.pos), int(self.y + getattr(self, "knot_offset", 0))), 8)
+            pygame.draw.circle(surface, (240, 240, 240), (int(pos), int(self.y + getattr(self, "knot_offset", 0))), 8)
 
     def reset(self):
         self.rope = Rope(self.width, self.height)
@@ -0,0 +1,281 @@
+"""Headless self-play simulator for tuning the Tug Of War AI.
+
+Replays the per-tick rules of Player.ai_act(), Player.update(), Rope.apply_pull()
+and the bomb flight in Game.step() on plain numbers (no pygame surfaces, no
+display), so a match takes a few milliseconds. Matches are spread over all cores
+with a process pool and summarised per parameter set (win rates and match-length
+distribution), e.g. from src/:
+
+    python -m game.selfplay --matches 4000 --set ai_aggressiveness=0.5,0.75,0.95
+
+With left="idle" and the same random seed, a match consumes random numbers in
+exactly the same order as Game.simulate() in 1-player mode and ends the same way.
+"""
+import argparse
+import itertools
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from game.core import (
+    AI_BOMB_CHANCE, AI_CLONE_CHANCE, AI_START_PAUSE, BOMB_FREEZE_TICKS, BOMB_TRAVEL_TICKS,
+    MAX_STAMINA, PULL_POWER, SIM_HZ, STAMINA_DRAIN, STAMINA_REGEN, TAP_DURATION,
+)
+from game.player import Player
+from game.projectile import BOMB_SIZE
+
+WIDTH, HEIGHT = 800, 480
+LEFT_MODES = ("ai", "idle", "tapper")
+
+# every tunable value; a parameter set overrides any of these
+DEFAULT_PARAMS = {
+    "ai_aggressiveness": Player.AI_AGGRESSIVENESS,
+    "ai_idle_bias": Player.AI_IDLE_BIAS,
+    "ai_response_bias": Player.AI_RESPONSE_BIAS,
+    "ai_opportunistic_chance": Player.AI_OPPORTUNISTIC_CHANCE,
+    "ai_burst_ticks": Player.AI_BURST_TICKS,
+    "ai_pause_ticks": Player.AI_PAUSE_TICKS,
+    "ai_clone_chance": AI_CLONE_CHANCE,
+    "ai_bomb_chance": AI_BOMB_CHANCE,
+    # the game passes the knot position in pixels but the centre as 0.5
+    "rope_center": 0.5,
+    "pull_power": PULL_POWER,
+    "tap_duration": TAP_DURATION,
+    "max_stamina": MAX_STAMINA,
+    "stamina_drain": STAMINA_DRAIN,
+    "stamina_regen": STAMINA_REGEN,
+    "clone_duration": 60,
+    "clone_cooldown": 180,
+    "freeze_ticks": BOMB_FREEZE_TICKS,
+    "tap_rate": 6.0,  # taps per second of the "tapper" left player
+}
+
+
+class _Side:
+    """The numeric state of one Player."""
+    __slots__ = ("name", "x", "y", "width", "height", "pull", "stamina", "tap", "burst", "pause",
+                 "clone_active", "clone_timer", "clone_used", "clone_cooldown", "bomb_used", "freeze")
+
+    def __init__(self, name, x, y, stamina):
+        self.name = name
+        self.x, self.y = x, y
+        self.width, self.height = 60, 80  # Player's fixed sprite size
+        self.pull = 0
+        self.stamina = stamina
+        self.tap = self.burst = self.pause = 0
+        self.clone_active = False
+        self.clone_timer = self.clone_cooldown = 0
+        self.clone_used = self.bomb_used = False
+        self.freeze = 0
+
+
+def _ai_act(side, rope_pos, opponent_pull, p, rng, threshold=10):
+    """Player.ai_act()"""
+    if side.freeze > 0:
+        return
+    if side.pause > 0:
+        side.pause -= 1
+    if side.name == "left":
+        condition = rope_pos > (p["rope_center"] + threshold)
+    else:
+        condition = rope_pos < (p["rope_center"] - threshold)
+    respond_bias = p["ai_idle_bias"] if opponent_pull == 0 else p["ai_response_bias"]
+    if side.pause == 0:
+        chance = min(1.0, p["ai_aggressiveness"] + respond_bias)
+        if condition and rng.random() < chance:
+            side.burst = rng.randint(*p["ai_burst_ticks"])
+            side.pause = rng.randint(*p["ai_pause_ticks"])
+            return
+    if opponent_pull == 0 and rng.random() < p["ai_opportunistic_chance"]:
+        side.burst = rng.randint(*p["ai_burst_ticks"])
+        side.pause = rng.randint(*p["ai_pause_ticks"])
+        return
+    # the AI's own special wishes are only rolled, never acted on (as in Player)
+    if not side.clone_used and not side.clone_active:
+        rng.random()
+    if not side.bomb_used:
+        rng.random()
+
+
+def _update(side, p):
+    """Player.update()"""
+    if side.clone_timer > 0:
+        side.clone_timer -= 1
+        if side.clone_timer <= 0:
+            side.clone_active = False
+    if side.clone_cooldown > 0:
+        side.clone_cooldown -= 1
+    if side.freeze > 0:
+        side.freeze -= 1
+        side.tap = side.burst = 0
+        side.pause = max(side.pause, side.freeze)
+        side.pull = 0
+        return
+    if side.tap > 0 or side.burst > 0:
+        if side.tap > 0:
+            side.tap -= 1
+        else:
+            side.burst -= 1
+        side.pull = p["pull_power"] * (2 if side.clone_active else 1)
+        side.stamina = max(0, side.stamina - p["stamina_drain"])
+        return
+    side.pull = 0
+    side.stamina = min(p["max_stamina"], side.stamina + p["stamina_regen"])
+
+
+def _specials(side, target, bombs, p, rng):
+    """The 'SIMPLE AI RANDOM ACTIONS' block of Game.step()"""
+    if not side.clone_used and side.clone_cooldown == 0 and side.freeze == 0 and rng.random() < p["ai_clone_chance"]:
+        if not side.clone_active:
+            side.clone_active = True
+            side.clone_timer = p["clone_duration"]
+            side.clone_used = True
+            side.clone_cooldown = p["clone_cooldown"]
+    if not side.bomb_used and side.freeze == 0 and rng.random() < p["ai_bomb_chance"]:
+        # Game.spawn_bomb(): a parabola that reaches the target after BOMB_TRAVEL_TICKS
+        sx = side.x + side.width // 2
+        sy = side.y - (side.height * 0.1)
+        t, g = float(BOMB_TRAVEL_TICKS), 0.4
+        vx = (target.x + target.width // 2 - sx) / t
+        vy = (target.y - sy - 0.5 * g * t * t) / t
+        bombs.append([float(sx), float(sy), vx, vy])
+        side.bomb_used = True
+
+
+def _update_bombs(bombs, left, right, p):
+    """Bomb.update() and the projectile collision in Game.step()"""
+    half = BOMB_SIZE // 2
+    for bomb in list(bombs):
+        bomb[3] += 0.4
+        bomb[0] += bomb[2]
+        bomb[1] += bomb[3]
+        x, y = bomb[0], bomb[1]
+        target = right if bomb[2] > 0 else left
+        bx, by = int(x - half), int(y - half)
+        if (bx < target.x + target.width and target.x < bx + BOMB_SIZE
+                and by < target.y and target.y - target.height < by + BOMB_SIZE):
+            target.freeze = p["freeze_ticks"]
+            bombs.remove(bomb)
+        elif x < -200 or x > WIDTH + 200 or y > HEIGHT + 400:
+            bombs.remove(bomb)
+
+
+def play_match(params=None, seed=None, left="ai", max_ticks=SIM_HZ * 120, rng=None):
+    """Play one match and return (winner, ticks): winner 1 = left, 2 = right, None = time limit.
+
+    left: "ai" (both sides run the AI), "idle" (left never pulls, like an
+    absent human in 1-player mode) or "tapper" (left taps at params["tap_rate"]).
+    """
+    if left not in LEFT_MODES:
+        raise ValueError(f"unknown left mode: {left!r} (choose from {', '.join(LEFT_MODES)})")
+    p = dict(DEFAULT_PARAMS, **(params or {}))
+    rng = rng or random.Random(seed)
+    # the same layout as Game.__init__()
+    y = HEIGHT // 2 + 20
+    l = _Side("left", 100, y, p["max_stamina"])
+    r = _Side("right", WIDTH - (100 + 30) - 30, y, p["max_stamina"])
+    r.pause = AI_START_PAUSE
+    if left == "ai":
+        l.pause = AI_START_PAUSE
+    rope_pos, min_x, max_x = WIDTH // 2, 120, WIDTH - 120
+    tap_chance = p["tap_rate"] / SIM_HZ
+    bombs = []
+
+    for tick in range(1, max_ticks + 1):
+        if left == "tapper" and rng.random() < tap_chance and l.freeze == 0 and l.stamina > 0:
+            l.tap = p["tap_duration"]
+        if left == "ai":
+            _ai_act(l, rope_pos, r.pull, p, rng)
+        _ai_act(r, rope_pos, l.pull, p, rng)
+        _update(l, p)
+        _update(r, p)
+        if left == "ai":
+            _specials(l, r, bombs, p, rng)
+        _specials(r, l, bombs, p, rng)
+        rope_pos = max(min_x, min(max_x, rope_pos + r.pull - l.pull))
+        if rope_pos <= min_x:
+            return 1, tick
+        if rope_pos >= max_x:
+            return 2, tick
+        _update_bombs(bombs, l, r, p)
+    return None, max_ticks
+
+
+def _play_batch(job):
+    params, seeds, left, max_ticks = job
+    return [play_match(params, seed, left, max_ticks) for seed in seeds]
+
+
+def summarize(results):
+    """Win rates and match-length percentiles (in ticks and seconds) of [(winner, ticks), ...]"""
+    n = len(results)
+    lengths = sorted(t for _, t in results)
+
+    def pct(q):
+        return lengths[min(n - 1, int(q * n))] if n else 0
+
+    return {
+        "matches": n,
+        "left_wins": sum(1 for w, _ in results if w == 1) / n if n else 0.0,
+        "right_wins": sum(1 for w, _ in results if w == 2) / n if n else 0.0,
+        "timeouts": sum(1 for w, _ in results if w is None) / n if n else 0.0,
+        "mean_ticks": sum(lengths) / n if n else 0.0,
+        "p10_ticks": pct(0.1),
+        "p50_ticks": pct(0.5),
+        "p90_ticks": pct(0.9),
+        "mean_seconds": sum(lengths) / n / SIM_HZ if n else 0.0,
+    }
+
+
+def sweep(param_sets, matches=1000, left="ai", max_ticks=SIM_HZ * 120, seed=0, jobs=None, chunk=250):
+    """Play matches for every parameter set in parallel and return [(params, summary), ...].
+    Match i of every set uses seed + i, so sets are compared on the same random streams."""
+    param_sets = list(param_sets)
+    seeds = list(range(seed, seed + matches))
+    batches = [(index, (params, seeds[i:i + chunk], left, max_ticks))
+               for index, params in enumerate(param_sets) for i in range(0, matches, chunk)]
+    results = [[] for _ in param_sets]
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        for (index, _), batch in zip(batches, pool.map(_play_batch, [job for _, job in batches])):
+            results[index].extend(batch)
+    return [(params, summarize(r)) for params, r in zip(param_sets, results)]
+
+
+def _parse_value(text, default):
+    if isinstance(default, tuple):
+        return tuple(int(v) for v in text.split("-"))
+    return type(default)(text)
+
+
+def _parse_sets(specs):
+    """--set name=v1,v2 ... -> the cartesian product of all listed values"""
+    axes = []
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if name not in DEFAULT_PARAMS:
+            raise SystemExit(f"unknown parameter {name!r} (choose from {', '.join(DEFAULT_PARAMS)})")
+        axes.append([(name, _parse_value(v, DEFAULT_PARAMS[name])) for v in values.split(",")])
+    return [dict(combo) for combo in itertools.product(*axes)] or [{}]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Tug Of War AI self-play sweeps.")
+    parser.add_argument("--matches", type=int, default=1000, help="matches per parameter set")
+    parser.add_argument("--left", choices=LEFT_MODES, default="ai", help="who plays the left side")
+    parser.add_argument("--max-seconds", type=float, default=120, help="time limit per match")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=V1,V2",
+                        help="sweep a parameter (ranges as 1-4); repeat for a grid")
+    args = parser.parse_args(argv)
+
+    rows = sweep(_parse_sets(args.set), matches=args.matches, left=args.left,
+                 max_ticks=int(args.max_seconds * SIM_HZ), seed=args.seed, jobs=args.jobs)
+    for params, s in rows:
+        label = ", ".join(f"{k}={v}" for k, v in params.items()) or "defaults"
+        print(f"{label}: left {s['left_wins']:.1%}  right {s['right_wins']:.1%}  timeout {s['timeouts']:.1%}  "
+              f"length mean {s['mean_seconds']:.1f}s  p10/p50/p90 {s['p10_ticks']}/{s['p50_ticks']}/{s['p90_ticks']} ticks")
+
+
+if __name__ == "__main__":
+    main()
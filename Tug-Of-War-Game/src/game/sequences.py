@@ -0,0 +1,150 @@
+"""Frame sequences (effect animations) shared by every Player and Game.
+
+Sequences live in assets/sprites either as numbered files in the sprites folder
+(explosion0.png, explosion1.png, ...) or as a folder of numbered frames
+(clone-smoke/frame_000.png, ...). Instead of probing file names until a load
+fails, the frame lists come from assets/sprites/sequences.json (regenerate it
+with `python -m game.sequences` from src/), or from a single directory scan when
+the manifest is missing. Each sequence is decoded once, with its frames decoded
+in parallel, and every scaled variant is built once; later calls (other players,
+resets, new effects) get the same tuple of Surfaces, which must not be modified.
+"""
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from game.utils import ASSET_ROOT, shared_assets
+
+SPRITES_DIR = os.path.join(ASSET_ROOT, "sprites")
+MANIFEST = os.path.join(SPRITES_DIR, "sequences.json")
+
+# explosion3.png in the sprites folder / frame_003.png or 003.png inside a sequence folder
+_ROOT_FRAME = re.compile(r"^(?P<name>.*?\D)(?P<index>\d+)\.png$", re.IGNORECASE)
+_DIR_FRAME = re.compile(r"^(?:frame_)?(?P<index>\d+)\.png$", re.IGNORECASE)
+
+_index = None     # {sequence name: [frame paths relative to SPRITES_DIR]}
+_decoded = {}     # {sequence name: (Surface, ...)}
+_variants = {}    # {(sequence name, scale, height): (Surface, ...)}
+
+
+def scan(root=SPRITES_DIR):
+    """Find all frame sequences under root with one pass over the folder and its subfolders."""
+    found = {}
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return {}
+    for entry in entries:
+        if entry.is_file():
+            m = _ROOT_FRAME.match(entry.name)
+            if m:
+                found.setdefault(m.group("name"), []).append((int(m.group("index")), entry.name))
+        elif entry.is_dir():
+            for sub in os.scandir(entry.path):
+                m = _DIR_FRAME.match(sub.name)
+                if m and sub.is_file():
+                    found.setdefault(entry.name, []).append((int(m.group("index")), f"{entry.name}/{sub.name}"))
+    return {name: [path for _, path in sorted(frames)] for name, frames in sorted(found.items())}
+
+
+def write_manifest(path=MANIFEST, root=SPRITES_DIR):
+    """Scan root and write the manifest read by get(); returns the sequences written."""
+    sequences = scan(root)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(sequences, f, indent=2)
+        f.write("\n")
+    return sequences
+
+
+def _sequence_index():
+    global _index
+    if _index is None:
+        try:
+            with open(MANIFEST, encoding="utf-8") as f:
+                _index = json.load(f)
+        except (OSError, ValueError):
+            _index = scan()
+    return _index
+
+
+def _decode(rel_path):
+    """Decode one frame (runs in a worker thread; pygame releases the GIL while decoding)."""
+    try:
+        return pygame.image.load(os.path.join(SPRITES_DIR, rel_path))
+    except Exception as e:
+        print(f"[sequences] failed to load {rel_path}: {e}")
+        return None
+
+
+def _load(name):
+    paths = _sequence_index().get(name, [])
+    if shared_assets:
+        # inside the launcher the frames were already decoded by the prefetch
+        frames = []
+        for rel_path in paths:
+            try:
+                frames.append(shared_assets.load_image(os.path.join(SPRITES_DIR, rel_path)))
+            except Exception as e:
+                print(f"[sequences] failed to load {rel_path}: {e}")
+        return tuple(frames)
+    if len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+            images = list(pool.map(_decode, paths))
+    else:
+        images = [_decode(p) for p in paths]
+    frames = []
+    for img in images:
+        if img is None:
+            continue
+        try:
+            img = img.convert_alpha()
+        except pygame.error:
+            pass  # no display yet: keep the unconverted Surface
+        frames.append(img)
+    return tuple(frames)
+
+
+def _scale(frame, factor):
+    size = (max(1, int(frame.get_width() * factor)), max(1, int(frame.get_height() * factor)))
+    try:
+        return pygame.transform.smoothscale(frame, size)
+    except Exception:
+        return pygame.transform.scale(frame, size)
+
+
+def get(name, scale=None, height=None):
+    """
+    Frames of sequence name as a shared tuple (empty when the sequence does not exist).
+    scale multiplies every frame by the same factor; height scales each frame to that height.
+    """
+    frames = _decoded.get(name)
+    if frames is None:
+        frames = _decoded[name] = _load(name)
+    if scale is None and height is None:
+        return frames
+    key = (name, scale, height)
+    variant = _variants.get(key)
+    if variant is None:
+        if height is not None:
+            variant = tuple(_scale(f, float(height) / f.get_height()) if f.get_height() else f for f in frames)
+        else:
+            variant = tuple(_scale(f, scale) for f in frames)
+        _variants[key] = variant
+    return variant
+
+
+def clear():
+    """Forget the manifest and all decoded frames (e.g. after the sprites changed)."""
+    global _index
+    _index = None
+    _decoded.clear()
+    _variants.clear()
+
+
+if __name__ == "__main__":
+    for seq, frame_paths in write_manifest().items():
+        print(f"{seq}: {len(frame_paths)} frames")
+    print(f"wrote {MANIFEST}")
@@ -1,7 +1,14 @@
 import os
 import pygame
 
-ASSET_ROOT = os.path.join("src", "assets")
+# resolve assets relative to this package so the game runs from any working directory
+ASSET_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "assets"))
+
+# shared asset cache, available when the game runs inside the launcher
+try:
+    from game_wrappers import assets as shared_assets
+except ImportError:
+    shared_assets = None
 
 # optional global bomb image; set to a Surface when available to avoid NameError
 _BOMB_IMG = None
@@ -34,6 +41,8 @@ def load_sound(filename):
             path = os.path.join(ASSET_ROOT, c)
             if os.path.exists(path):
                 try:
+                    if shared_assets:
+                        return shared_assets.load_sound(path)
                     return pygame.mixer.Sound(path)
                 except Exception:
                     return None
@@ -47,6 +56,12 @@ def load_sound(filename):
         pass
     return None
 
+def load_font(path, size):
+    """Return a pygame Font for a font file (shared inside the launcher)."""
+    if shared_assets:
+        return shared_assets.load_font(path, size)
+    return pygame.font.Font(path, size)
+
 def load_music(filename):
     """Return a file path for pygame.mixer.music.load or None."""
     try:
@@ -62,9 +77,11 @@ def load_music(filename):
     print(f"[load_music] File not found: {os.path.join(ASSET_ROOT, 'music', filename)}")
     return None
 
-def load_image(filename):
+def load_image(filename, size=None):
     """
     Load an image from the assets/sprites directory.
+    With size=(w, h) the image is scaled once; inside the launcher the scaled
+    Surface comes from the shared cache (or the prebuilt sprite atlas).
     """
     base_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "assets", "sprites"))
     path = os.path.join(base_dir, filename)
@@ -83,7 +100,14 @@ def load_image(filename):
         print(f"[debug] LFS check error for {filename}: {e}")
     
     try:
-        img = pygame.image.load(path).convert_alpha()
+        if shared_assets and size is not None:
+            img = shared_assets.load_scaled(path, size)
+        elif shared_assets:
+            img = shared_assets.load_image(path)
+        else:
+            img = pygame.image.load(path).convert_alpha()
+            if size is not None and img.get_size() != tuple(size):
+                img = pygame.transform.smoothscale(img, size)
         print(f"[debug] Successfully loaded image: {filename}")
         return img
     except Exception as e:
@@ -105,7 +129,7 @@ def play_sound(sound, volume=1.0):
 def load_music(filename):
     """Load music file path for pygame.mixer.music."""
     try:
-        path = os.path.join("src", "assets", "music", filename)
+        path = os.path.join(ASSET_ROOT, "music", filename)
         if os.path.exists(path):
             return path  # return path for pygame.mixer.music
         else:
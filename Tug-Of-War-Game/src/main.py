@@ -8,13 +8,18 @@ from game.utils import init_audio  # keep only init_audio here
 
 WIDTH, HEIGHT = 800, 480
 
-def main():
+def play():
+    """Play Tug Of War and return the winner (1 = left, 2 = right, None = no result).
+    Does not quit pygame, so it can run inside the launcher's game host."""
     # ensure mixer pre-init then init pygame
     init_audio()
     pygame.init()
 
     # Initialize the display early (must happen before convert_alpha())
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    # reuse an existing window of the right size (e.g. inside the game host)
+    screen = pygame.display.get_surface()
+    if screen is None or screen.get_size() != (WIDTH, HEIGHT):
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Tug Of War - Prototype")
 
     # import modules that may load images/assets now that display exists
@@ -69,7 +74,16 @@ def main():
     except Exception:
         pass
 
-    game.run()
+    try:
+        return game.run()
+    finally:
+        pygame.mixer.stop()
+        pygame.mixer.music.stop()
+
+def main():
+    play()
+    pygame.quit()
+    sys.exit()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,34 @@
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from game import selfplay
+from game.core import Game
+
+
+def _game():
+    pygame.init()
+    screen = pygame.display.set_mode((selfplay.WIDTH, selfplay.HEIGHT))
+    return Game(screen, selfplay.WIDTH, selfplay.HEIGHT, ai=True)
+
+def test_selfplay_matches_game_simulation():
+    for seed in range(5):
+        game = _game()
+        game.start()
+        random.seed(seed)
+        winner = game.simulate(max_ticks=3600)
+        assert selfplay.play_match(seed=seed, left="idle", max_ticks=3600) == (winner, game.ticks)
+
+def test_selfplay_is_deterministic_per_seed():
+    assert selfplay.play_match(seed=7) == selfplay.play_match(seed=7)
+
+def test_summarize_counts_outcomes():
+    s = selfplay.summarize([(1, 100), (2, 300), (None, 600), (1, 200)])
+    assert s["matches"] == 4
+    assert s["left_wins"] == 0.5
+    assert s["timeouts"] == 0.25
+    assert s["p50_ticks"] == 300
@@ -0,0 +1,30 @@
+"""
+Two Player Mini Games Showdown - Sprite Atlas Builder
+Packs the pre-scaled sprites of the launcher and every game into binary
+atlases under .atlas/, so startup maps them instead of decoding and
+rescaling PNGs (see game_wrappers/atlas.py). Run again after changing
+any image; stale sprites are ignored until then.
+
+Usage: python build_atlas.py [launcher|butterfly|maze|coin|tug ...]
+"""
+import sys
+
+import pygame
+
+from game_wrappers import atlas
+
+
+def main():
+    pygame.init()
+    if not sys.argv[1:]:
+        atlas.build_all()
+    for name in sys.argv[1:]:
+        if name not in atlas.ATLAS_SPRITES:
+            print(f"⚠ Unknown atlas: {name}")
+            continue
+        atlas.build_atlas(name)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -100,8 +100,9 @@ while running:
             state = "MENU"
     
     # Draw
-    if BACKGROUND_IMAGE:
-        screen.blit(BACKGROUND_IMAGE, (0, 0))
+    background_image = RESOURCES.get('background')
+    if background_image:
+        screen.blit(background_image, (0, 0))
     else:
         screen.fill((50, 50, 50))
     
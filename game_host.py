@@ -0,0 +1,172 @@
+"""
+Two Player Mini Games Showdown - Game Host
+A long-lived worker process that keeps pygame and the four games loaded,
+so the launcher can start a round without paying for a fresh interpreter,
+pygame.init(), font loading and asset decoding every time.
+
+The launcher starts the host once (GameHost), the host connects back over a
+local authenticated socket, pre-imports every game and then plays one game
+per request, replying with the winner. Games are loaded and run with the
+same runtime the launcher uses in-process (game_wrappers/runtime.py); the
+host only adds process isolation.
+"""
+import os
+import sys
+import time
+import secrets
+import threading
+import subprocess
+from multiprocessing.connection import Listener, Client
+
+PYTHON_EXECUTABLE = sys.executable or "python3"
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Environment variables used to hand the connection details to the host process
+ENV_ADDRESS = "SHOWDOWN_HOST_ADDRESS"
+ENV_AUTHKEY = "SHOWDOWN_HOST_AUTHKEY"
+
+
+def play_round(games, name):
+    """Show the host window, play one game with the shared runtime and hide the window again"""
+    import pygame
+    from game_wrappers import runtime, results
+
+    started = time.time()
+    winner = None
+    record = None
+    error = None
+    if name not in games:
+        error = f"game not loaded: {name}"
+    else:
+        pygame.display.set_mode((runtime.SCREEN_WIDTH, runtime.SCREEN_HEIGHT), pygame.SHOWN)
+        try:
+            winner = runtime.run_game(name)
+            record = results.last_record()
+        finally:
+            pygame.display.set_mode((runtime.SCREEN_WIDTH, runtime.SCREEN_HEIGHT), pygame.HIDDEN)
+
+    return {
+        "type": "result",
+        "game": name,
+        "winner": winner,
+        "record": record,
+        "elapsed": time.time() - started,
+        "error": error,
+    }
+
+
+def serve():
+    """Host process entry point: connect to the launcher, preload games, play on request"""
+    address = os.environ[ENV_ADDRESS]
+    host, port = address.rsplit(":", 1)
+    conn = Client((host, int(port)), authkey=bytes.fromhex(os.environ[ENV_AUTHKEY]))
+
+    import pygame
+    from game_wrappers import runtime
+
+    started = time.time()
+    pygame.init()
+    runtime.shared_mixer()
+    # keep the window hidden until a game is played
+    pygame.display.set_mode((runtime.SCREEN_WIDTH, runtime.SCREEN_HEIGHT), pygame.HIDDEN)
+
+    games = []
+    for name in runtime.GAME_SPECS:
+        try:
+            runtime.get_game(name)
+            games.append(name)
+            print(f"✓ Game host preloaded: {name}")
+        except (Exception, SystemExit) as e:
+            print(f"⚠ Game host could not preload {name}: {e}")
+
+    print(f"✓ Game host ready in {time.time() - started:.2f}s")
+    conn.send({"type": "ready", "games": sorted(games)})
+
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            break
+        if request.get("type") == "quit":
+            break
+        if request.get("type") == "play":
+            conn.send(play_round(games, request.get("game")))
+
+    conn.close()
+    pygame.quit()
+
+
+class GameHost:
+    """
+    Launcher-side handle of the game host process.
+    Starting is non-blocking; ready() tells whether the host has finished preloading.
+    """
+
+    def __init__(self):
+        self.authkey = secrets.token_bytes(16)
+        self.listener = Listener(("127.0.0.1", 0), authkey=self.authkey)
+        self.conn = None
+        self.games = []
+        self._ready = threading.Event()
+
+        env = dict(os.environ)
+        env[ENV_ADDRESS] = "%s:%d" % self.listener.address
+        env[ENV_AUTHKEY] = self.authkey.hex()
+        self.process = subprocess.Popen(
+            [PYTHON_EXECUTABLE, "-u", os.path.join(ROOT_DIR, "game_host.py")],
+            cwd=ROOT_DIR,
+            env=env
+        )
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        try:
+            conn = self.listener.accept()
+            message = conn.recv()
+            if message.get("type") == "ready":
+                self.conn = conn
+                self.games = message.get("games", [])
+                self._ready.set()
+        except Exception as e:
+            print(f"⚠ Game host did not connect: {e}")
+        finally:
+            self.listener.close()
+
+    def ready(self, timeout=0):
+        """True if the host is connected and still running"""
+        return self._ready.wait(timeout) and self.process.poll() is None
+
+    def run_game(self, name):
+        """
+        Play a game in the host and return the winner: 1, 2, or None.
+        Raises RuntimeError if the host is not usable, so the caller can fall back.
+        """
+        if not self.ready() or name not in self.games:
+            raise RuntimeError(f"game host cannot run {name}")
+        try:
+            self.conn.send({"type": "play", "game": name})
+            result = self.conn.recv()
+        except (EOFError, OSError) as e:
+            self._ready.clear()
+            raise RuntimeError(f"game host connection lost: {e}")
+        if result.get("error"):
+            print(f"⚠ Game host reported an error in {name}: {result['error']}")
+        print(f"✓ {name} finished in the game host after {result.get('elapsed', 0):.1f}s, result: {result.get('record')}")
+        return result.get("winner")
+
+    def close(self):
+        """Ask the host to exit and wait for it"""
+        try:
+            if self.conn is not None:
+                self.conn.send({"type": "quit"})
+                self.conn.close()
+        except Exception:
+            pass
+        try:
+            self.process.wait(timeout=3)
+        except Exception:
+            self.process.kill()
+
+
+if __name__ == "__main__":
+    serve()
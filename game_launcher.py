@@ -10,9 +10,25 @@ import os
 import subprocess
 import importlib.util
 import time
+import threading
+from game_wrappers.results import ResultListener
+from game_wrappers.assets import load_fit, load_scaled, load_font
+from game_wrappers.atlas import load_atlas
+from game_wrappers.runtime import prefetch_game, is_warm
+from game_wrappers import text as shared_text
+from game_wrappers import dirty as shared_dirty
 
 PYTHON_EXECUTABLE = sys.executable or "python3"
 
+# Run games inside the launcher process, on the launcher window, with the shared
+# runtime in game_wrappers (one display, one mixer, one image cache)
+RUN_GAMES_IN_PROCESS = True
+# Otherwise run games in a persistent, preloaded game host process (see game_host.py)
+# instead of starting a fresh Python process for every round
+USE_GAME_HOST = True
+# How long a round waits for the game host to finish preloading before falling back
+GAME_HOST_READY_TIMEOUT = 10.0
+
 # Initialize Pygame
 pygame.init()
 pygame.mixer.init()
@@ -47,6 +63,10 @@ except:
     font_medium = pygame.font.Font(None, 28)
     font_small = pygame.font.Font(None, 20)
 
+def render_text(font, text, antialias, color):
+    """font.render() that reuses the surface of unchanged text (menu title, hints, score)"""
+    return shared_text.render(font, text, color, antialias)
+
 # Game information - corresponding to four colored boxes
 GAMES = [
     {
@@ -94,29 +114,92 @@ GAMES = [
 # Gray box color (for played games)
 GRAY_BOX_COLOR = (120, 120, 120)
 
+# Launcher resource manifest: candidate files per resource, the first one that
+# exists is resolved once (see resolve_resource)
+RESOURCE_MANIFEST = {
+    'background': ['png/homepage_background.JPG', 'png/homepage_background.jpg', 'png/homepage_background.png',
+                   'homepage_background.JPG', 'homepage_background.jpg', 'homepage_background.png',
+                   'background.png', 'background.jpg', 'background.jpeg', 'bg.png'],
+    'crown': ['CROWN.png'],
+    'menu_bgm': ['launcher_audio/menu_bgm.wav'],
+    'victory': ['launcher_audio/victory.wav'],
+}
+_resolved_resources = {}
+
+
+def resolve_resource(name):
+    """Return the first existing file of a manifest entry (or None), resolved only once"""
+    if name not in _resolved_resources:
+        _resolved_resources[name] = next(
+            (path for path in RESOURCE_MANIFEST[name] if os.path.exists(path)), None
+        )
+    return _resolved_resources[name]
+
+
+class ResourceRegistry:
+    """
+    Launcher resources loaded on first use instead of at import time.
+    get() loads (or waits for) a resource, peek() never blocks, and
+    prefetch() loads resources on a background thread.
+    """
+
+    def __init__(self, loaders):
+        self.loaders = loaders  # {name: function returning the resource or None}
+        self._values = {}
+        self._loading = {}  # {name: threading.Event}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        """Return the resource, loading it now if nobody has started yet"""
+        with self._lock:
+            if name in self._values:
+                return self._values[name]
+            event = self._loading.get(name)
+            owner = event is None
+            if owner:
+                event = self._loading[name] = threading.Event()
+        if owner:
+            try:
+                value = self.loaders[name]()
+            except Exception as e:
+                print(f"⚠ Unable to load resource {name}: {e}")
+                value = None
+            with self._lock:
+                self._values[name] = value
+            event.set()
+        else:
+            event.wait()
+        return self._values.get(name)
+
+    def ready(self, name):
+        """True once the resource has been loaded (successfully or not)"""
+        return name in self._values
+
+    def peek(self, name):
+        """Return the resource if it is already loaded, otherwise None"""
+        return self._values.get(name)
+
+    def prefetch(self, *names):
+        """Load resources in order on a daemon thread"""
+        def worker():
+            for name in names:
+                self.get(name)
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        return thread
+
+
 # Load box images
 def load_box_images():
-    """Load all box PNG images"""
+    """Load all box PNG images (through the shared asset cache)"""
+    # Prebuilt sprite atlas (python build_atlas.py); without it images are decoded as usual
+    load_atlas("launcher")
     box_images = {}
     try:
-        # Load four colored boxes
-        box_images['yellow'] = pygame.image.load('png/yellowbox.png').convert_alpha()
-        box_images['red'] = pygame.image.load('png/redbox.png').convert_alpha()
-        box_images['blue'] = pygame.image.load('png/bluebox.png').convert_alpha()
-        box_images['pink'] = pygame.image.load('png/pinkbox.png').convert_alpha()
-        box_images['grey'] = pygame.image.load('png/greybox.png').convert_alpha()
-        
-        # Resize image while maintaining aspect ratio
+        # Load four colored boxes and resize while maintaining aspect ratio
         box_size = 85  # Reduce box size further
-        for key in box_images:
-            original = box_images[key]
-            # Get original dimensions
-            orig_w, orig_h = original.get_size()
-            # Scale while maintaining aspect ratio
-            scale = box_size / max(orig_w, orig_h)
-            new_w = int(orig_w * scale)
-            new_h = int(orig_h * scale)
-            box_images[key] = pygame.transform.smoothscale(original, (new_w, new_h))
+        for key in ('yellow', 'red', 'blue', 'pink', 'grey'):
+            box_images[key] = load_fit(f'png/{key}box.png', box_size, box_size)
         
         print("✓ Box images loaded successfully!")
         return box_images
@@ -128,70 +211,45 @@ def load_box_images():
 # Load background image
 def load_background():
     """Load background image"""
-    try:
-        # Try loading background image (support multiple formats)
-        bg_files = ['png/homepage_background.JPG', 'png/homepage_background.jpg', 'png/homepage_background.png', 
-                    'homepage_background.JPG', 'homepage_background.jpg', 'homepage_background.png',
-                    'background.png', 'background.jpg', 'background.jpeg', 'bg.png']
-        for bg_file in bg_files:
-            try:
-                bg = pygame.image.load(bg_file).convert()
-                # Scale to window size
-                bg = pygame.transform.scale(bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
-                print(f"✓ Background image loaded successfully: {bg_file}")
-                return bg
-            except:
-                continue
+    bg_file = resolve_resource('background')
+    if bg_file is None:
         print("⚠ Background image not found, using default background")
         return None
+    try:
+        # Scaled to window size once and kept in the shared cache
+        bg = load_scaled(bg_file, (SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False, smooth=False)
+        print(f"✓ Background image loaded successfully: {bg_file}")
+        return bg
     except Exception as e:
         print(f"⚠ Failed to load background image: {e}")
         return None
 
-# Load box images
-BOX_IMAGES = load_box_images()
-
-# Load background image
-BACKGROUND_IMAGE = load_background()
-
 # Load crown image
 def load_crown_image():
     """Load crown image"""
     try:
-        crown = pygame.image.load('CROWN.png').convert_alpha()
+        load_atlas("launcher")
         # Scale to appropriate size (New crown is wider, adjust proportions)
-        crown = pygame.transform.smoothscale(crown, (40, 28))
+        crown = load_scaled(resolve_resource('crown') or 'CROWN.png', (40, 28))
         print("✓ Crown image loaded successfully!")
         return crown
     except Exception as e:
         print(f"⚠ Unable to load crown image: {e}")
         return None
 
-CROWN_IMAGE = load_crown_image()
-
 # Load player animation images
 def load_player_images():
     """Load player character standing and walking images"""
+    load_atlas("launcher")
     player_images = {}
     try:
-        # Blue player
-        player_images['blue_stand'] = pygame.image.load('Counting-Butterfly-Two-Player-Game-fresh/assets/images/blue_player_stand.png').convert_alpha()
-        player_images['blue_walk'] = pygame.image.load('Counting-Butterfly-Two-Player-Game-fresh/assets/images/blue_player_walk.png').convert_alpha()
-        
-        # Red player
-        player_images['red_stand'] = pygame.image.load('Counting-Butterfly-Two-Player-Game-fresh/assets/images/red_player_stand.png').convert_alpha()
-        player_images['red_walk'] = pygame.image.load('Counting-Butterfly-Two-Player-Game-fresh/assets/images/red_player_walk.png').convert_alpha()
-        
-        # Scale player images to appropriate size
+        # Same files as Counting Butterfly, so the decode is shared with the game
+        player_dir = 'Counting-Butterfly-Two-Player-Game-fresh/assets/images'
         player_size = 80  # Player character size
-        for key in player_images:
-            original = player_images[key]
-            orig_w, orig_h = original.get_size()
-            # Scale while maintaining aspect ratio
-            scale = player_size / max(orig_w, orig_h)
-            new_w = int(orig_w * scale)
-            new_h = int(orig_h * scale)
-            player_images[key] = pygame.transform.smoothscale(original, (new_w, new_h))
+        for color in ('blue', 'red'):
+            for pose in ('stand', 'walk'):
+                path = f'{player_dir}/{color}_player_{pose}.png'
+                player_images[f'{color}_{pose}'] = load_fit(path, player_size, player_size)
         
         print("✓ Player character images loaded successfully!")
         return player_images
@@ -199,40 +257,51 @@ def load_player_images():
         print(f"⚠ Unable to load player images: {e}")
         return None
 
-# Load player images
-PLAYER_IMAGES = load_player_images()
+# Load a launcher sound effect
+def load_sound(name, volume, label):
+    """Load a manifest sound and set its volume"""
+    path = resolve_resource(name)
+    if path is None:
+        print(f"⚠ {label} file not found")
+        return None
+    try:
+        sound = pygame.mixer.Sound(path)
+        sound.set_volume(volume)
+        print(f"✓ {label} loaded successfully!")
+        return sound
+    except Exception as e:
+        print(f"⚠ Unable to load {label}: {e}")
+        return None
+
+RESOURCES = ResourceRegistry({
+    'boxes': load_box_images,
+    'background': load_background,
+    'crown': load_crown_image,
+    'players': load_player_images,
+    'menu_bgm': lambda: load_sound('menu_bgm', 0.3, "Main menu BGM"),
+    'victory': lambda: load_sound('victory', 0.5, "Victory sound effect"),
+})
 
 # Load audio files
 def load_audio():
-    """Load game launcher audio files"""
-    audio = {
-        'menu_bgm': None,
-        'victory': None
-    }
-    
-    try:
-        # Try to load main menu BGM
-        try:
-            audio['menu_bgm'] = pygame.mixer.Sound('launcher_audio/menu_bgm.wav')
-            audio['menu_bgm'].set_volume(0.3)
-            print("✓ Main menu BGM loaded successfully!")
-        except:
-            print("⚠ Main menu BGM file not found")
-        
-        # Try to load victory sound effect
-        try:
-            audio['victory'] = pygame.mixer.Sound('launcher_audio/victory.wav')
-            audio['victory'].set_volume(0.5)
-            print("✓ Victory sound effect loaded successfully!")
-        except:
-            print("⚠ Victory sound effect file not found")
-            
-    except Exception as e:
-        print(f"⚠ Audio loading error: {e}")
-    
-    return audio
+    """Return the launcher audio files {'menu_bgm', 'victory'}"""
+    return {'menu_bgm': RESOURCES.get('menu_bgm'), 'victory': RESOURCES.get('victory')}
 
-AUDIO = load_audio()
+# Module-level names kept for scripts that import them (demo_crown_system.py);
+# each one is loaded on first access
+_LAZY_RESOURCES = {
+    'BOX_IMAGES': 'boxes',
+    'BACKGROUND_IMAGE': 'background',
+    'CROWN_IMAGE': 'crown',
+    'PLAYER_IMAGES': 'players',
+}
+
+def __getattr__(name):
+    if name in _LAZY_RESOURCES:
+        return RESOURCES.get(_LAZY_RESOURCES[name])
+    if name == 'AUDIO':
+        return load_audio()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Player animation class
 class PlayerAnimator:
@@ -257,7 +326,8 @@ class PlayerAnimator:
     
     def draw(self, surface):
         """Draw player"""
-        if not PLAYER_IMAGES:
+        player_images = RESOURCES.get('players')
+        if not player_images:
             return
         
         # Select image based on current frame
@@ -266,7 +336,7 @@ class PlayerAnimator:
         else:
             img_key = f'{self.player_type}_walk'
         
-        img = PLAYER_IMAGES.get(img_key)
+        img = player_images.get(img_key)
         if img:
             img_rect = img.get_rect(center=(self.x, self.y))
             surface.blit(img, img_rect)
@@ -299,6 +369,61 @@ class ScoreManager:
         else:
             return 0  # Tie
 
+# Game name zoom animation
+class GameNameReveal:
+    """
+    Pre-rendered zoom animation for the selected game's name.
+    The name (with shadow and bold layers) is rasterised once at full size;
+    each zoom step is a scaled copy built on first use and then reused,
+    so the animation does no file I/O or TTF rendering per frame.
+    """
+    MAX_FONT_SIZE = 40  # Maximum font size (adjusted from 48 to 40)
+    FONT_PATH = "Counting-Butterfly-Two-Player-Game-fresh/assets/fonts/PressStart2P-Regular.ttf"
+    _font = None
+    
+    @classmethod
+    def font(cls):
+        """Load the reveal font once"""
+        if cls._font is None:
+            try:
+                cls._font = load_font(cls.FONT_PATH, cls.MAX_FONT_SIZE)
+            except Exception:
+                cls._font = pygame.font.Font(None, int(cls.MAX_FONT_SIZE * 1.5))
+        return cls._font
+    
+    def __init__(self, game_name):
+        font = self.font()
+        name_surface = font.render(game_name, True, YELLOW)
+        shadow_surface = font.render(game_name, True, (50, 50, 50))
+        w, h = name_surface.get_size()
+        # 2px margin for the shadow offsets
+        self.full = pygame.Surface((w + 4, h + 4), pygame.SRCALPHA)
+        # Shadow effect (dark outline)
+        for offset in [(2, 2), (-2, 2), (2, -2), (-2, -2)]:
+            self.full.blit(shadow_surface, (2 + offset[0], 2 + offset[1]))
+        # Bold effect (multi-layer overlay)
+        for offset in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
+            self.full.blit(name_surface, (2 + offset[0], 2 + offset[1]))
+        # Main text
+        self.full.blit(name_surface, (2, 2))
+        self.frames = {}  # {zoom step: Surface}
+    
+    def frame(self, scale):
+        """Return the name at the given zoom (0..1), or None while it is too small to show"""
+        step = int(self.MAX_FONT_SIZE * scale)  # one step per font size, like the original animation
+        if step <= 0:
+            return None
+        img = self.frames.get(step)
+        if img is None:
+            if step >= self.MAX_FONT_SIZE:
+                img = self.full
+            else:
+                w, h = self.full.get_size()
+                size = (max(1, w * step // self.MAX_FONT_SIZE), max(1, h * step // self.MAX_FONT_SIZE))
+                img = pygame.transform.smoothscale(self.full, size)
+            self.frames[step] = img
+        return img
+
 # Box roulette selector
 class BoxRoulette:
     def __init__(self, center_x, center_y):
@@ -385,12 +510,13 @@ class BoxRoulette:
     def draw_box(self, surface, x, y, color, game_name, is_played=False, box_image_key=None):
         """Draw single box"""
         # If image exists and is loaded, use PNG image
-        if BOX_IMAGES and box_image_key:
+        box_images = RESOURCES.get('boxes')
+        if box_images and box_image_key:
             # Select correct image (gray for played games)
             if is_played:
-                img = BOX_IMAGES.get('grey')
+                img = box_images.get('grey')
             else:
-                img = BOX_IMAGES.get(box_image_key)
+                img = box_images.get(box_image_key)
             
             if img:
                 # Draw image (centered)
@@ -534,45 +660,66 @@ class BoxRoulette:
             pygame.draw.circle(surface, BLACK, (self.center_x, self.center_y), 10)
             pygame.draw.circle(surface, YELLOW, (self.center_x, self.center_y), 8)
 
-# Winner input
-def manual_winner_input(game_name):
+# Result channel
+def winner_from_record(record):
     """
-    After game ends, read game result file
-    Return: 1 (Player 1 wins), 2 (Player 2 wins), None (tie or unknown)
+    Winner of a finished match from its result record
+    Return: 1 (Player 1 wins), 2 (Player 2 wins), None (tie or no finished match)
     """
-    print(f"Checking game result, game: {game_name}")
-    
-    # Try to read result file
-    result_file = "game_result.txt"
-    winner = None
-    
-    if os.path.exists(result_file):
-        try:
-            with open(result_file, 'r') as f:
-                result = f.read().strip()
-                if result == "1":
-                    winner = 1
-                    print("Read from result file: Player 1 wins")
-                elif result == "2":
-                    winner = 2
-                    print("Read from result file: Player 2 wins")
-                elif result == "0" or result == "tie":
-                    winner = None
-                    print("Read from result file: Tie")
-            # Delete result file
-            os.remove(result_file)
-        except Exception as e:
-            print(f"Failed to read result file: {e}")
-    else:
-        print(f"Result file not found, game may not have ended normally")
-    
-    # Return result directly, don't show manual input interface
-    return winner
+    if record is None:
+        print("No result received, game may not have ended normally")
+        return None
+    print(f"Result received: {record}")
+    return record.get("winner")
+
+# Game host (warm worker process)
+def start_game_host():
+    """Start the game host in the background, return None if it is disabled or fails"""
+    if RUN_GAMES_IN_PROCESS or not USE_GAME_HOST:
+        return None
+    try:
+        from game_host import GameHost
+        host = GameHost()
+        print("✓ Game host starting in background")
+        return host
+    except Exception as e:
+        print(f"⚠ Could not start game host, games will run as new processes: {e}")
+        return None
+
+def restore_launcher_window():
+    """Bring the launcher window back after a game"""
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Two Player Mini Games Showdown")
 
 # Game launch function
-def launch_game(game_index):
+def draw_loading_screen(game_name):
+    """Show the LOADING screen while a game starts"""
+    screen.fill(DARK_GRAY)
+    loading_text = render_text(font_large, "LOADING...", True, YELLOW)
+    loading_rect = loading_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+    screen.blit(loading_text, loading_rect)
+    
+    game_text = render_text(font_small, game_name, True, WHITE)
+    game_rect = game_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
+    screen.blit(game_text, game_rect)
+    shared_dirty.present()
+
+def prefetch_selected_game(game_index):
+    """
+    Decode the selected game's assets on a worker thread while the roulette spins,
+    so ENTER starts the game against a warm cache
+    """
+    if not RUN_GAMES_IN_PROCESS:
+        return  # the game host preloads every game itself
+    try:
+        prefetch_game(GAMES[game_index]["name"])
+    except Exception as e:
+        print(f"⚠ Could not prefetch {GAMES[game_index]['display_name']}: {e}")
+
+def launch_game(game_index, host=None):
     """
-    Launch specified game
+    Launch specified game: in-process, in the game host if one is ready,
+    otherwise as a new process
     Return winner: 1, 2, or None
     """
     game = GAMES[game_index]
@@ -580,18 +727,33 @@ def launch_game(game_index):
     game_folder = game["folder"]
     game_script = game["script"]
     
-    # Show launch prompt
-    screen.fill(DARK_GRAY)
-    loading_text = font_large.render("LOADING...", True, YELLOW)
-    loading_rect = loading_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-    screen.blit(loading_text, loading_rect)
+    # Show launch prompt, unless the assets were already prefetched during the spin
+    if not (RUN_GAMES_IN_PROCESS and is_warm(game["name"])):
+        draw_loading_screen(game_name)
     
-    game_text = font_small.render(game_name, True, WHITE)
-    game_rect = game_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-    screen.blit(game_text, game_rect)
-    pygame.display.flip()
+    # Fastest path: play on this window, no window or mixer round trip
+    if RUN_GAMES_IN_PROCESS:
+        try:
+            from game_wrappers import run_game
+        except ImportError as e:
+            print(f"⚠ In-process runner not available, launching game as a new process: {e}")
+        else:
+            from game_wrappers import last_record
+            run_game(game["name"])
+            winner = winner_from_record(last_record())
+            print(f"launch_game returned, winner: {winner}")
+            return winner
     
-    pygame.time.wait(1000)
+    # Fast path: the game host already has pygame and the game loaded
+    if host is not None and host.ready(timeout=GAME_HOST_READY_TIMEOUT):
+        pygame.display.iconify()
+        try:
+            winner = host.run_game(game["name"])
+            restore_launcher_window()
+            print(f"launch_game returned, winner: {winner}")
+            return winner
+        except Exception as e:
+            print(f"⚠ Game host failed, launching game as a new process: {e}")
     
     # Hide launcher window
     pygame.display.iconify()
@@ -599,6 +761,13 @@ def launch_game(game_index):
     winner = None
     original_dir = os.getcwd()
     
+    # The game sends its result record back over this channel when the match ends
+    result_listener = ResultListener()
+    child_env = result_listener.child_env()
+    # Let the game import game_wrappers (result channel, shared image cache)
+    launcher_dir = os.path.dirname(os.path.abspath(__file__))
+    child_env["PYTHONPATH"] = os.pathsep.join(p for p in [launcher_dir, os.environ.get("PYTHONPATH")] if p)
+    
     try:
         # Build game path
         game_path = os.path.join(original_dir, game_folder)
@@ -657,6 +826,7 @@ def launch_game(game_index):
                     proc = subprocess.run(
                         [PYTHON_EXECUTABLE, "-u", "-m", "game.main"],
                         cwd=cwd_for_process,
+                        env=child_env,
                         stdout=subprocess.PIPE,
                         stderr=subprocess.PIPE,
                         text=True
@@ -665,6 +835,7 @@ def launch_game(game_index):
                     proc = subprocess.run(
                         [PYTHON_EXECUTABLE, "-u", script_arg],
                         cwd=cwd_for_process,
+                        env=child_env,
                         stdout=subprocess.PIPE,
                         stderr=subprocess.PIPE,
                         text=True
@@ -690,16 +861,10 @@ def launch_game(game_index):
                 print(f"⚠ Failed to re-initialize mixer: {e}")
         
         # Restore launcher window
-        pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Two Player Mini Games Showdown")
-        
-        # Reload background image (if exists)
-        global BACKGROUND_IMAGE
-        if BACKGROUND_IMAGE is None:
-            BACKGROUND_IMAGE = load_background()
+        restore_launcher_window()
         
-        # After game ends, manually input winner
-        winner = manual_winner_input(game["display_name"])
+        # After game ends, take the winner from the result record
+        winner = winner_from_record(result_listener.close())
         
         print(f"launch_game returned, winner: {winner}")
         
@@ -709,11 +874,10 @@ def launch_game(game_index):
         traceback.print_exc()
         
         # Restore launcher window
-        pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Two Player Mini Games Showdown")
+        restore_launcher_window()
         
-        # Let user input result even if error occurs
-        winner = manual_winner_input(game["display_name"])
+        # A game may have reported its result before the error
+        winner = winner_from_record(result_listener.close())
     
     finally:
         os.chdir(original_dir)
@@ -725,6 +889,9 @@ def main():
     score_manager = ScoreManager()
     roulette = BoxRoulette(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20)
     
+    # Start preloading the games while the players are in the menu
+    game_host = start_game_host()
+    
     # Create player animations on left and right sides
     blue_player = PlayerAnimator('blue', 80, SCREEN_HEIGHT - 80)  # Bottom-left corner
     red_player = PlayerAnimator('red', SCREEN_WIDTH - 80, SCREEN_HEIGHT - 80)  # Bottom-right corner
@@ -736,21 +903,29 @@ def main():
     # Game name zoom animation parameters
     game_name_scale = 0.0  # Current scale ratio
     game_name_animation_duration = 800  # Animation duration (milliseconds)
+    name_reveal = None  # Pre-rendered zoom frames of the selected game's name
     
     # Music playback state
     menu_bgm_playing = False
     victory_sound_played = False
     
-    # Play main menu BGM
-    if AUDIO['menu_bgm']:
-        AUDIO['menu_bgm'].play(loops=-1)  # Infinite loop
-        menu_bgm_playing = True
-        print("🎵 Starting main menu BGM playback")
+    # Decode the audio in the background; the menu BGM starts once it is ready,
+    # so the first menu frame does not wait for the WAV
+    menu_bgm_pending = True
+    RESOURCES.prefetch('menu_bgm', 'victory')
     
     running = True
     while running:
         clock.tick(FPS)
         
+        # Play main menu BGM as soon as it has been loaded
+        if menu_bgm_pending and RESOURCES.ready('menu_bgm'):
+            menu_bgm_pending = False
+            if state in ("MENU", "SPINNING", "WAITING") and RESOURCES.peek('menu_bgm'):
+                RESOURCES.peek('menu_bgm').play(loops=-1)  # Infinite loop
+                menu_bgm_playing = True
+                print("🎵 Starting main menu BGM playback")
+        
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
@@ -766,6 +941,8 @@ def main():
                         print(f"Available games: {available_indices}")
                         if available:
                             selected_game_index = roulette.start_spin()
+                            prefetch_selected_game(selected_game_index)
+                            name_reveal = GameNameReveal(GAMES[selected_game_index]["display_name"])
                             print(f"Roulette selected game index: {selected_game_index}")
                             print(f"Selected game: {GAMES[selected_game_index]['display_name']}")
                             print(f"Is this game played? {GAMES[selected_game_index]['played']}")
@@ -815,15 +992,16 @@ def main():
             print(f"Entering PLAYING state, selected_game_index = {selected_game_index}")
             
             # Stop main menu BGM
-            if menu_bgm_playing and AUDIO['menu_bgm']:
-                AUDIO['menu_bgm'].stop()
+            menu_bgm_pending = False
+            if menu_bgm_playing and RESOURCES.peek('menu_bgm'):
+                RESOURCES.peek('menu_bgm').stop()
                 menu_bgm_playing = False
                 print("🔇 Stop main menu BGM")
             
             # Launch selected game
             if selected_game_index is not None:
                 print(f"Launching game: {GAMES[selected_game_index]['display_name']}")
-                winner = launch_game(selected_game_index)
+                winner = launch_game(selected_game_index, game_host)
                 
                 print(f"Game ended, winner: {winner}")
                 
@@ -845,24 +1023,27 @@ def main():
                     state = "MENU"
                     
                     # Resume main menu BGM
-                    if not menu_bgm_playing and AUDIO['menu_bgm']:
-                        AUDIO['menu_bgm'].play(loops=-1)
+                    if not menu_bgm_playing and RESOURCES.get('menu_bgm'):
+                        RESOURCES.get('menu_bgm').play(loops=-1)
                         menu_bgm_playing = True
                         print("🎵 Resume main menu BGM playback")
                     
                     # Ensure menu interface is redrawn
-                    pygame.display.flip()
+                    shared_dirty.present()
         
         # Draw
+        background_image = RESOURCES.get('background')
+        crown_image = RESOURCES.get('crown')
+        player_images = RESOURCES.get('players') or {}
         # Draw background image or default color
-        if BACKGROUND_IMAGE:
-            screen.blit(BACKGROUND_IMAGE, (0, 0))
+        if background_image:
+            screen.blit(background_image, (0, 0))
         else:
             screen.fill(DARK_GRAY)
         
         if state in ["MENU", "SPINNING", "WAITING"]:
             # Draw title
-            title = font_large.render("GAME SHOWDOWN", True, YELLOW)
+            title = render_text(font_large, "GAME SHOWDOWN", True, YELLOW)
             title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 40))
             screen.blit(title, title_rect)
             
@@ -874,7 +1055,7 @@ def main():
             roulette.draw(screen)
             
             # Draw crowns above winning players
-            if CROWN_IMAGE:
+            if crown_image:
                 crown_offset_y = 50  # Crown distance from player head
                 crown_spacing = 20   # Spacing between multiple crowns
                 
@@ -885,22 +1066,22 @@ def main():
                 
                 # P1 (Blue) crowns
                 for i in range(score_manager.player1_crowns):
-                    crown_x = blue_player.x - CROWN_IMAGE.get_width() // 2
+                    crown_x = blue_player.x - crown_image.get_width() // 2
                     crown_y = blue_player.y - crown_offset_y - (i * crown_spacing)
-                    screen.blit(CROWN_IMAGE, (crown_x, crown_y))
+                    screen.blit(crown_image, (crown_x, crown_y))
                 
                 # P2 (Red) crowns
                 for i in range(score_manager.player2_crowns):
-                    crown_x = red_player.x - CROWN_IMAGE.get_width() // 2
+                    crown_x = red_player.x - crown_image.get_width() // 2
                     crown_y = red_player.y - crown_offset_y - (i * crown_spacing)
-                    screen.blit(CROWN_IMAGE, (crown_x, crown_y))
+                    screen.blit(crown_image, (crown_x, crown_y))
             else:
                 if not hasattr(main, '_no_crown_warning'):
-                    print("[WARNING] CROWN_IMAGE is None!")
+                    print("[WARNING] Crown image is None!")
                     main._no_crown_warning = True
             
             # Draw score - moved higher to avoid Player overlap
-            score_text = font_medium.render(
+            score_text = render_text(font_medium,
                 f"P1: {score_manager.player1_score}  P2: {score_manager.player2_score}",
                 True, WHITE
             )
@@ -910,66 +1091,29 @@ def main():
             # Draw prompts - optimized layout and spacing
             if state == "MENU":
                 # Main menu prompt - clear and concise
-                hint = font_small.render("Press SPACE to Spin", True, BRIGHT_CYAN)
+                hint = render_text(font_small, "Press SPACE to Spin", True, BRIGHT_CYAN)
                 hint_rect = hint.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 70))
                 screen.blit(hint, hint_rect)
                 
                 # Add control instructions - use brighter colors
-                controls = font_small.render("P1: WASD  |  P2: Arrow Keys", True, LIGHT_GRAY)
+                controls = render_text(font_small, "P1: WASD  |  P2: Arrow Keys", True, LIGHT_GRAY)
                 controls_rect = controls.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 45))
                 screen.blit(controls, controls_rect)
                 
             elif state == "WAITING":
                 if selected_game_index is not None:
-                    game_name = GAMES[selected_game_index]["display_name"]
-                    
                     # Game name zoom animation - appears from small to large in screen center
-                    if game_name_scale > 0:
-                        # Create larger font for zoom effect
-                        max_font_size = 40  # Maximum font size (adjusted from 48 to 40)
-                        current_font_size = int(max_font_size * game_name_scale)
-                        
-                        if current_font_size > 0:
-                            try:
-                                # Use bold effect - implemented by repeated rendering
-                                zoom_font = pygame.font.Font(
-                                    "Counting-Butterfly-Two-Player-Game-fresh/assets/fonts/PressStart2P-Regular.ttf", 
-                                    current_font_size
-                                )
-                            except:
-                                zoom_font = pygame.font.Font(None, int(current_font_size * 1.5))
-                            
-                            # Render game name
-                            name_surface = zoom_font.render(game_name, True, YELLOW)
-                            
-                            # Bold effect：Render multiple times around original position
-                            name_rect = name_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30))
-                            
-                            # DrawShadow effect (dark outline)
-                            shadow_surface = zoom_font.render(game_name, True, (50, 50, 50))
-                            for offset in [(2, 2), (-2, 2), (2, -2), (-2, -2)]:
-                                shadow_rect = shadow_surface.get_rect(
-                                    center=(SCREEN_WIDTH // 2 + offset[0], SCREEN_HEIGHT // 2 - 30 + offset[1])
-                                )
-                                screen.blit(shadow_surface, shadow_rect)
-                            
-                            # DrawBold effect（Multi-layer overlay）
-                            for offset in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-                                bold_rect = name_surface.get_rect(
-                                    center=(SCREEN_WIDTH // 2 + offset[0], SCREEN_HEIGHT // 2 - 30 + offset[1])
-                                )
-                                screen.blit(name_surface, bold_rect)
-                            
-                            # FinallyDrawMain text
-                            screen.blit(name_surface, name_rect)
+                    name_frame = name_reveal.frame(game_name_scale) if name_reveal else None
+                    if name_frame:
+                        screen.blit(name_frame, name_frame.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30)))
                     
                     # Start prompt - Merged into one line，More concise，Use bright cyan
-                    hint = font_small.render("Press ENTER to Start", True, BRIGHT_CYAN)
+                    hint = render_text(font_small, "Press ENTER to Start", True, BRIGHT_CYAN)
                     hint_rect = hint.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 70))
                     screen.blit(hint, hint_rect)
                     
                     # Control instructions - Use brighter colors
-                    controls = font_small.render("P1: WASD  |  P2: Arrow Keys", True, LIGHT_GRAY)
+                    controls = render_text(font_small, "P1: WASD  |  P2: Arrow Keys", True, LIGHT_GRAY)
                     controls_rect = controls.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 45))
                     screen.blit(controls, controls_rect)
                 else:
@@ -980,7 +1124,7 @@ def main():
             # PLAYINGState rendering - DisplayLoadScreen
             # Note：Actual game launch logic is in the update section above
             # Just ensure a transition screen is displayed before launch
-            title = font_large.render("STARTING...", True, YELLOW)
+            title = render_text(font_large, "STARTING...", True, YELLOW)
             title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             screen.blit(title, title_rect)
             
@@ -990,21 +1134,22 @@ def main():
         
         elif state == "FINAL":
             # Stop main menu BGM（If still playing）
-            if menu_bgm_playing and AUDIO['menu_bgm']:
-                AUDIO['menu_bgm'].stop()
+            menu_bgm_pending = False
+            if menu_bgm_playing and RESOURCES.peek('menu_bgm'):
+                RESOURCES.peek('menu_bgm').stop()
                 menu_bgm_playing = False
                 print("🔇 Stop main menu BGM（Final screen）")
             
             # Play victory sound effect（Play only once）
-            if not victory_sound_played and AUDIO['victory']:
-                AUDIO['victory'].play()
+            if not victory_sound_played and RESOURCES.get('victory'):
+                RESOURCES.get('victory').play()
                 victory_sound_played = True
                 print("🏆 Play victory sound effect")
             
             # Final score screen - like main menu but with winner celebration
             # Draw background (same as main menu)
-            if BACKGROUND_IMAGE:
-                screen.blit(BACKGROUND_IMAGE, (0, 0))
+            if background_image:
+                screen.blit(background_image, (0, 0))
             else:
                 screen.fill((50, 50, 50))
             
@@ -1019,14 +1164,14 @@ def main():
                 red_player.draw(screen)
                 
                 # "TIE GAME!" text
-                result_text = font_large.render("TIE GAME!", True, YELLOW)
+                result_text = render_text(font_large, "TIE GAME!", True, YELLOW)
                 result_rect = result_text.get_rect(center=(SCREEN_WIDTH // 2, 80))
                 screen.blit(result_text, result_rect)
             else:
                 # Winner celebration - enlarge winner, show crown
                 if winner == 1:
                     # Player 1 wins - enlarge blue player
-                    winner_img = PLAYER_IMAGES.get('blue_stand')
+                    winner_img = player_images.get('blue_stand')
                     if winner_img:
                         # Scale up 2.5x
                         enlarged = pygame.transform.scale(winner_img, 
@@ -1035,22 +1180,22 @@ def main():
                         screen.blit(enlarged, enlarged_rect)
                         
                         # Draw crown above winner
-                        if CROWN_IMAGE:
-                            crown_x = enlarged_rect.centerx - CROWN_IMAGE.get_width() // 2
-                            crown_y = enlarged_rect.top - CROWN_IMAGE.get_height() - 10
-                            screen.blit(CROWN_IMAGE, (crown_x, crown_y))
+                        if crown_image:
+                            crown_x = enlarged_rect.centerx - crown_image.get_width() // 2
+                            crown_y = enlarged_rect.top - crown_image.get_height() - 10
+                            screen.blit(crown_image, (crown_x, crown_y))
                     
                     # Show loser small in corner
-                    loser_img = PLAYER_IMAGES.get('red_stand')
+                    loser_img = player_images.get('red_stand')
                     if loser_img:
                         screen.blit(loser_img, (SCREEN_WIDTH - 100, SCREEN_HEIGHT - 100))
                     
                     # Use more vividBlue
-                    result_text = font_large.render("PLAYER 1 WIN!", True, (120, 200, 255))
+                    result_text = render_text(font_large, "PLAYER 1 WIN!", True, (120, 200, 255))
                     
                 else:
                     # Player 2 wins - enlarge red player
-                    winner_img = PLAYER_IMAGES.get('red_stand')
+                    winner_img = player_images.get('red_stand')
                     if winner_img:
                         # Scale up 2.5x
                         enlarged = pygame.transform.scale(winner_img,
@@ -1059,25 +1204,25 @@ def main():
                         screen.blit(enlarged, enlarged_rect)
                         
                         # Draw crown above winner
-                        if CROWN_IMAGE:
-                            crown_x = enlarged_rect.centerx - CROWN_IMAGE.get_width() // 2
-                            crown_y = enlarged_rect.top - CROWN_IMAGE.get_height() - 10
-                            screen.blit(CROWN_IMAGE, (crown_x, crown_y))
+                        if crown_image:
+                            crown_x = enlarged_rect.centerx - crown_image.get_width() // 2
+                            crown_y = enlarged_rect.top - crown_image.get_height() - 10
+                            screen.blit(crown_image, (crown_x, crown_y))
                     
                     # Show loser small in corner
-                    loser_img = PLAYER_IMAGES.get('blue_stand')
+                    loser_img = player_images.get('blue_stand')
                     if loser_img:
                         screen.blit(loser_img, (50, SCREEN_HEIGHT - 100))
                     
                     # Use more vividRed
-                    result_text = font_large.render("PLAYER 2 WIN!", True, (255, 120, 120))
+                    result_text = render_text(font_large, "PLAYER 2 WIN!", True, (255, 120, 120))
                 
                 # Draw winner text at top
                 result_rect = result_text.get_rect(center=(SCREEN_WIDTH // 2, 60))
                 screen.blit(result_text, result_rect)
             
             # Display final score at bottom - Optimize layout
-            score_text = font_medium.render(
+            score_text = render_text(font_medium,
                 f"Final Score - P1: {score_manager.player1_score}  P2: {score_manager.player2_score}",
                 True, YELLOW
             )
@@ -1085,7 +1230,7 @@ def main():
             screen.blit(score_text, score_rect)
             
             # Exit hint - Use bright cyan for better visibility
-            hint = font_small.render("Press ESC to Exit", True, BRIGHT_CYAN)
+            hint = render_text(font_small, "Press ESC to Exit", True, BRIGHT_CYAN)
             hint_rect = hint.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 55))
             screen.blit(hint, hint_rect)
             
@@ -1094,8 +1239,10 @@ def main():
             if keys[pygame.K_ESCAPE]:
                 running = False
         
-        pygame.display.flip()
+        shared_dirty.present()
     
+    if game_host is not None:
+        game_host.close()
     pygame.quit()
     sys.exit()
 
@@ -2,3 +2,5 @@
 游戏包装器模块
 用于集成各个子游戏到主系统
 """
+from .runtime import run_game, get_game, load_image, shared_display, shared_mixer, GAME_SPECS
+from .results import MatchStats, ResultListener, report, last_record
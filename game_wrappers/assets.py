@@ -0,0 +1,258 @@
+"""
+共用图片资源服务
+启动器和四个子游戏通过同一个缓存取图片：
+- 原图按 (绝对路径, 修改时间, 文件大小, alpha) 作为键，每个文件只解码一次
+- 缩放后的版本按 (原图键, 配方) 放在 LRU 中，总内存不超过预算
+- 预先打包好的图集（atlas.py）中的精灵直接使用，不再解码和缩放
+- 所有调用者拿到同一个 Surface，修改前请先 copy()
+- 声音（Sound）和字体（Font）同样按文件内容缓存，可以在后台线程中预先加载
+
+配方（recipe）描述如何从原图得到派生图片，缓存和图集构建都用 render() 生成：
+    ("scale", 宽, 高, smooth)      缩放到固定尺寸
+    ("fit", 宽, 高, smooth)        保持宽高比放进框内（宽或高可以为 None）
+    ("factor", 倍数, smooth)       按倍数缩放
+    ("crop_fit", 宽, 高, smooth)   先裁掉透明边，再按 fit 缩放
+"""
+import os
+import threading
+from collections import OrderedDict
+
+import pygame
+
+# 缩放版本的默认内存预算（字节）
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+def surface_bytes(surf):
+    """Surface 像素数据占用的字节数"""
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+def crop_transparent(surf):
+    """用像素遮罩裁掉透明边，失败时返回原图"""
+    try:
+        rect = pygame.mask.from_surface(surf).get_bounding_rect()
+        if rect.width > 0 and rect.height > 0:
+            return surf.subsurface(rect).copy()
+    except Exception:
+        pass
+    return surf
+
+
+def recipe_size(size, recipe):
+    """按配方计算派生图片的尺寸"""
+    ow, oh = size
+    kind = recipe[0]
+    if kind == "scale":
+        w, h = recipe[1], recipe[2]
+    elif kind == "factor":
+        w, h = ow * recipe[1], oh * recipe[1]
+    elif kind in ("fit", "crop_fit"):
+        scales = []
+        if recipe[1] is not None:
+            scales.append(recipe[1] / ow)
+        if recipe[2] is not None:
+            scales.append(recipe[2] / oh)
+        if not scales:
+            return size
+        w, h = ow * min(scales), oh * min(scales)
+    else:
+        raise ValueError(f"unknown recipe: {recipe!r}")
+    return (max(1, int(w)), max(1, int(h)))
+
+
+def render(original, recipe):
+    """按配方从原图生成派生图片（尺寸不变时直接返回原图）"""
+    if recipe[0] == "crop_fit":
+        original = crop_transparent(original)
+    size = recipe_size(original.get_size(), recipe)
+    if size == original.get_size():
+        return original
+    if recipe[-1]:
+        return pygame.transform.smoothscale(original, size)
+    return pygame.transform.scale(original, size)
+
+
+class AssetCache:
+    """按内容（路径 + 修改时间 + 大小）索引的图片缓存"""
+
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._originals = {}          # {原图键: Surface}
+        self._current = {}            # {(绝对路径, alpha): 当前原图键}
+        self._variants = OrderedDict()  # {(原图键, 配方): Surface}，按最近使用排序
+        self._variant_bytes = 0
+        self._atlas = {}              # {(原图键, 配方): 图集中的 Surface}，不计入预算
+        self._sounds = {}             # {文件键: Sound}
+        self._fonts = {}              # {(文件键, 字号): Font}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, path, alpha):
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        return (path, st.st_mtime_ns, st.st_size, alpha)
+
+    def image(self, path, alpha=True):
+        """返回原始尺寸的图片（文件不存在时抛出 FileNotFoundError）"""
+        key = self._key(path, alpha)
+        with self._lock:
+            img = self._originals.get(key)
+            if img is not None:
+                self.hits += 1
+                return img
+            self.misses += 1
+            # 文件变了：丢掉旧版本
+            old_key = self._current.get((key[0], alpha))
+            if old_key is not None:
+                self._originals.pop(old_key, None)
+            img = pygame.image.load(key[0])
+            img = img.convert_alpha() if alpha else img.convert()
+            self._originals[key] = img
+            self._current[(key[0], alpha)] = key
+            return img
+
+    def variant(self, path, recipe, alpha=True):
+        """返回按配方派生的图片：先查 LRU 和图集，都没有时才解码原图"""
+        key = (self._key(path, alpha), tuple(recipe))
+        with self._lock:
+            img = self._variants.get(key)
+            if img is not None:
+                self._variants.move_to_end(key)
+                self.hits += 1
+                return img
+            img = self._atlas.get(key)
+            if img is not None:
+                self.hits += 1
+                return img
+            original = self.image(path, alpha)
+            img = render(original, key[1])
+            if img is original:
+                return img
+            self.misses += 1
+            self._variants[key] = img
+            self._variant_bytes += surface_bytes(img)
+            self._evict()
+            return img
+
+    def scaled(self, path, size, alpha=True, smooth=True):
+        """返回缩放到 size=(宽, 高) 的图片"""
+        return self.variant(path, ("scale", max(1, int(size[0])), max(1, int(size[1])), smooth), alpha)
+
+    def fit(self, path, width=None, height=None, alpha=True, smooth=True):
+        """
+        按原图宽高比缩放，使图片放进 width x height 的框内
+        只给 width 或 height 时只按这一边缩放
+        """
+        if width is None and height is None:
+            return self.image(path, alpha)
+        return self.variant(path, ("fit", width, height, smooth), alpha)
+
+    def factor(self, path, factor, alpha=True, smooth=True):
+        """按倍数缩放"""
+        return self.variant(path, ("factor", factor, smooth), alpha)
+
+    def cropped_fit(self, path, width=None, height=None, alpha=True, smooth=True):
+        """裁掉透明边后按 fit 缩放"""
+        return self.variant(path, ("crop_fit", width, height, smooth), alpha)
+
+    def sound(self, path):
+        """返回共用的 Sound，同一个文件只解码一次（音量等设置对所有调用者生效）"""
+        key = self._key(path, None)
+        with self._lock:
+            snd = self._sounds.get(key)
+            if snd is None:
+                snd = self._sounds[key] = pygame.mixer.Sound(key[0])
+            return snd
+
+    def font(self, path, size):
+        """返回共用的 Font"""
+        key = (self._key(path, None), size)
+        with self._lock:
+            fnt = self._fonts.get(key)
+            if fnt is None:
+                fnt = self._fonts[key] = pygame.font.Font(key[0][0], size)
+            return fnt
+
+    def add_atlas(self, sprites):
+        """登记图集中的精灵 {(原图键, 配方): Surface}"""
+        with self._lock:
+            self._atlas.update(sprites)
+
+    def atlas_key(self, path, recipe, alpha=True):
+        """图集登记用的键（文件不存在时抛出 OSError）"""
+        return (self._key(path, alpha), tuple(recipe))
+
+    def _evict(self):
+        while self._variant_bytes > self.budget_bytes and len(self._variants) > 1:
+            _, img = self._variants.popitem(last=False)
+            self._variant_bytes -= surface_bytes(img)
+
+    def stats(self):
+        """缓存统计信息"""
+        with self._lock:
+            return {
+                "originals": len(self._originals),
+                "variants": len(self._variants),
+                "variant_bytes": self._variant_bytes,
+                "atlas": len(self._atlas),
+                "sounds": len(self._sounds),
+                "fonts": len(self._fonts),
+                "budget_bytes": self.budget_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._originals.clear()
+            self._current.clear()
+            self._variants.clear()
+            self._variant_bytes = 0
+            self._atlas.clear()
+            self._sounds.clear()
+            self._fonts.clear()
+
+
+# 进程内唯一的缓存
+_cache = AssetCache()
+
+
+def get_cache():
+    return _cache
+
+
+def load_image(path, alpha=True):
+    """原始尺寸的图片（共用）"""
+    return _cache.image(path, alpha)
+
+
+def load_scaled(path, size, alpha=True, smooth=True):
+    """缩放到固定尺寸的图片（共用）"""
+    return _cache.scaled(path, size, alpha, smooth)
+
+
+def load_fit(path, width=None, height=None, alpha=True, smooth=True):
+    """保持宽高比缩放后的图片（共用）"""
+    return _cache.fit(path, width, height, alpha, smooth)
+
+
+def load_scaled_by(path, factor, alpha=True, smooth=True):
+    """按倍数缩放后的图片（共用）"""
+    return _cache.factor(path, factor, alpha, smooth)
+
+
+def load_cropped_fit(path, width=None, height=None, alpha=True, smooth=True):
+    """裁掉透明边并保持宽高比缩放后的图片（共用）"""
+    return _cache.cropped_fit(path, width, height, alpha, smooth)
+
+
+def load_sound(path):
+    """解码后的声音（共用）"""
+    return _cache.sound(path)
+
+
+def load_font(path, size):
+    """字体（共用）"""
+    return _cache.font(path, size)
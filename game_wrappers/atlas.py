@@ -0,0 +1,180 @@
+"""
+预编译精灵图集
+构建步骤把每个游戏用到的、已经缩放好的精灵打包成一个图集：
+    .atlas/<名字>.rgba   原始 RGBA 像素数据
+    .atlas/<名字>.json   索引：图集尺寸，每个精灵的来源文件、配方和子矩形
+运行时用 mmap 映射像素文件，pygame.image.frombuffer 直接包装成 Surface，
+再复制一次成可写的显示格式 Surface（映射是只读的，写入会让进程崩溃），
+每个精灵是这份副本的子 Surface，登记到共用缓存（assets.py）后，
+load_scaled / load_fit 等调用不再解码 PNG，也不再缩放
+
+来源文件的修改时间或大小变了，对应的精灵就不再使用（退回正常解码），
+重新构建即可：  python build_atlas.py
+"""
+import os
+import json
+import mmap
+
+import pygame
+
+from . import assets
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ATLAS_DIR = os.path.join(ROOT_DIR, ".atlas")
+ATLAS_VERSION = 1
+ATLAS_MAX_WIDTH = 1024
+PADDING = 1
+
+_BUTTERFLY = "Counting-Butterfly-Two-Player-Game-fresh/assets/images/"
+_MAZE = "Double-Maze/"
+_COIN = "pixel-coin-collectors/assets/images/"
+_TUG = "Tug-Of-War-Game/src/assets/sprites/"
+
+# 每个图集包含的精灵: (相对项目根目录的路径, 配方)
+# 配方必须和游戏中的调用完全一致（见 assets.py 的说明），否则查不到图集
+ATLAS_SPRITES = {
+    "launcher": (
+        [("png/%sbox.png" % c, ("fit", 85, 85, True)) for c in ("yellow", "red", "blue", "pink", "grey")]
+        + [(_BUTTERFLY + "%s_player_%s.png" % (c, p), ("fit", 80, 80, True))
+           for c in ("blue", "red") for p in ("stand", "walk")]
+        + [("CROWN.png", ("scale", 40, 28, True))]
+    ),
+    "butterfly": [
+        (_BUTTERFLY + "%s_player_%s.png" % (c, p), ("crop_fit", None, 130, False))
+        for c in ("red", "blue") for p in ("stand", "walk")
+    ],
+    "maze": [
+        (_MAZE + "maze/assets/blue_player.png", ("fit", None, 32, True)),
+        (_MAZE + "maze/assets/blue_player_stand.png", ("fit", None, 32, True)),
+        (_MAZE + "maze/assets/red_player.png", ("fit", None, 32, True)),
+        (_MAZE + "maze/assets/red_player_stand.png", ("fit", None, 32, True)),
+        (_MAZE + "assets/treasure_chest.png", ("fit", None, 60, True)),
+        (_MAZE + "assets/Grass.png", ("scale", 40, 40, True)),
+    ],
+    "coin": (
+        [(_COIN + "player%d/%s.png" % (n, d), ("factor", 0.5, False))
+         for n in (1, 2) for d in ("front", "left", "right")]
+        + [(_COIN + "coin.png", ("factor", 0.04, False)),
+           (_COIN + "diamond.png", ("factor", 0.06, False)),
+           (_COIN + "bomb.png", ("factor", 0.06, False))]
+    ),
+    "tug": [
+        (_TUG + name, ("scale", 60, 80, True))
+        for name in ("girl-push.png", "girl-pull.png", "boy-push.png", "boy-pull.png")
+    ],
+}
+
+# 已加载的图集 {名字: (Surface, 索引)}，Surface 是从映射复制出来的，不再引用 mmap
+_loaded = {}
+
+
+def atlas_paths(name):
+    """返回 (像素文件, 索引文件) 的路径"""
+    return (os.path.join(ATLAS_DIR, name + ".rgba"), os.path.join(ATLAS_DIR, name + ".json"))
+
+
+def _pack(sizes, max_width=ATLAS_MAX_WIDTH):
+    """按行（shelf）排列矩形，返回 (每个矩形的位置, 图集尺寸)"""
+    width = max([max_width] + [w + PADDING for w, h in sizes])
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    positions = [None] * len(sizes)
+    x = y = row_height = 0
+    for i in order:
+        w, h = sizes[i]
+        if x + w > width:
+            x, y, row_height = 0, y + row_height, 0
+        positions[i] = (x, y)
+        x += w + PADDING
+        row_height = max(row_height, h + PADDING)
+    return positions, (width, max(1, y + row_height))
+
+
+def build_atlas(name):
+    """构建一个图集，返回打包的精灵数量（缺少的来源文件跳过）"""
+    if pygame.display.get_surface() is None:
+        # convert_alpha() 需要一个显示窗口
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    cache = assets.AssetCache(budget_bytes=float("inf"))
+
+    entries = []
+    for rel_path, recipe in ATLAS_SPRITES[name]:
+        path = os.path.join(ROOT_DIR, rel_path)
+        try:
+            img = cache.variant(path, recipe)
+        except Exception as e:
+            print(f"⚠ Atlas {name}: skipping {rel_path}: {e}")
+            continue
+        st = os.stat(path)
+        entries.append({
+            "path": rel_path,
+            "mtime_ns": st.st_mtime_ns,
+            "bytes": st.st_size,
+            "recipe": list(recipe),
+            "surface": img,
+        })
+
+    positions, size = _pack([e["surface"].get_size() for e in entries])
+    sheet = pygame.Surface(size, pygame.SRCALPHA, 32)
+    sheet.fill((0, 0, 0, 0))
+    for entry, pos in zip(entries, positions):
+        img = entry.pop("surface")
+        # BLEND_RGBA_MAX 在全透明底上等于原样复制（普通 blit 会做 alpha 混合）
+        sheet.blit(img, pos, special_flags=pygame.BLEND_RGBA_MAX)
+        entry["rect"] = [pos[0], pos[1], img.get_width(), img.get_height()]
+
+    os.makedirs(ATLAS_DIR, exist_ok=True)
+    data_path, index_path = atlas_paths(name)
+    with open(data_path, "wb") as f:
+        f.write(pygame.image.tobytes(sheet, "RGBA"))
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump({"version": ATLAS_VERSION, "size": list(size), "format": "RGBA", "sprites": entries}, f, indent=1)
+    print(f"✓ Atlas {name}: {len(entries)} sprites, {size[0]}x{size[1]}")
+    return len(entries)
+
+
+def build_all():
+    """构建所有图集"""
+    for name in ATLAS_SPRITES:
+        build_atlas(name)
+
+
+def load_atlas(name, cache=None):
+    """
+    映射一个图集并把仍然有效的精灵登记到共用缓存，返回登记的数量
+    图集不存在或已过期时返回 0，调用者照常解码即可
+    """
+    cache = cache or assets.get_cache()
+    data_path, index_path = atlas_paths(name)
+    try:
+        if name not in _loaded:
+            with open(index_path, encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") != ATLAS_VERSION:
+                return 0
+            with open(data_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                mapped = pygame.image.frombuffer(data, tuple(index["size"]), index["format"])
+                # 只读映射上的 Surface 不能写；复制一次，有窗口时同时转换成显示格式（blit 更快）
+                if pygame.display.get_surface() is not None:
+                    sheet = mapped.convert_alpha()
+                else:
+                    sheet = mapped.copy()
+                del mapped
+            _loaded[name] = (sheet, index)
+        sheet, index = _loaded[name]
+    except (OSError, ValueError, KeyError, pygame.error):
+        return 0
+
+    sprites = {}
+    for entry in index["sprites"]:
+        path = os.path.join(ROOT_DIR, entry["path"])
+        try:
+            key = cache.atlas_key(path, entry["recipe"])
+        except OSError:
+            continue
+        # 来源文件变了：不用这个精灵
+        if key[0][1] != entry["mtime_ns"] or key[0][2] != entry["bytes"]:
+            continue
+        sprites[key] = sheet.subsurface(pygame.Rect(entry["rect"]))
+    cache.add_atlas(sprites)
+    return len(sprites)
+
@@ -0,0 +1,166 @@
+"""
+脏矩形显示更新（可选）
+游戏每帧都重画整个画面再 pygame.display.flip()，即使画面几乎没变（菜单、输入阶段）
+flip 也要把整幅 800x480 画面送到窗口。启用后 present() 代替 flip()：
+- 和上一次送出的画面比较，找出变化的区域（按 16 行一条、每条分 8 列比较原始像素字节）
+- 只用 pygame.display.update(rects) 送出变化的区域；画面没变时什么也不送
+- 变化超过画面的 60%、窗口尺寸变了或每隔 REFRESH_FRAMES 帧时照常整屏 flip
+  （窗口被遮挡后重新显示时靠它补全）
+
+游戏是直接往屏幕上画的，没有 LayeredDirty 那样的精灵组可以记录每个精灵的位置，
+所以这里比较画好的整帧而不是逐个精灵记录，游戏的绘制代码不用改
+
+启用：环境变量 MINIGAMES_DIRTY_RECTS=1，或调用 set_enabled(True)
+"""
+import os
+
+import pygame
+
+ENV_VAR = "MINIGAMES_DIRTY_RECTS"
+BAND_HEIGHT = 16          # 每条比较区域的行数
+COLUMNS = 8               # 每条分成的列数
+FULL_UPDATE_RATIO = 0.6   # 变化面积超过这个比例时整屏 flip
+REFRESH_FRAMES = 120      # 每隔这么多帧强制整屏 flip 一次
+
+
+def _env_enabled():
+    return os.environ.get(ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class DirtyDisplay:
+    """按变化区域更新显示窗口"""
+
+    def __init__(self, enabled=False, band_height=BAND_HEIGHT, columns=COLUMNS,
+                 full_ratio=FULL_UPDATE_RATIO, refresh_frames=REFRESH_FRAMES):
+        self.enabled = enabled
+        self.band_height = band_height
+        self.columns = columns
+        self.full_ratio = full_ratio
+        self.refresh_frames = refresh_frames
+        self._last = None        # 上一次送出的画面（原始像素字节）
+        self._layout = None      # (尺寸, 每行字节数, 每像素字节数)
+        self._since_full = 0
+        self.frames = 0
+        self.full_updates = 0
+        self.partial_updates = 0
+        self.idle_frames = 0
+
+    def invalidate(self):
+        """下一帧整屏 flip（例如画面被其他代码直接更新过）"""
+        self._last = None
+
+    def present(self):
+        """代替 pygame.display.flip()"""
+        if not self.enabled:
+            pygame.display.flip()
+            return
+        surface = pygame.display.get_surface()
+        try:
+            rects = self.changed_rects(surface) if surface is not None else None
+        except pygame.error:
+            rects = None
+        self.frames += 1
+        if rects is None:
+            self.full_updates += 1
+            pygame.display.flip()
+        elif rects:
+            self.partial_updates += 1
+            pygame.display.update(rects)
+        else:
+            self.idle_frames += 1
+
+    def changed_rects(self, surface):
+        """
+        返回和上一次送出的画面相比变化的矩形列表（没变时为空列表）
+        需要整屏更新时返回 None
+        """
+        data = surface.get_buffer().raw
+        last, self._last = self._last, data
+        layout = (surface.get_size(), surface.get_pitch(), surface.get_bytesize())
+        self._since_full += 1
+        if last is None or layout != self._layout or self._since_full >= self.refresh_frames:
+            self._layout = layout
+            self._since_full = 0
+            return None
+
+        (width, height), pitch, bytesize = layout
+        col_width = -(-width // self.columns)
+        col_bytes = col_width * bytesize
+        rects = []
+        open_rects = {}  # {(起始列, 结束列): 上一条中同样列范围的 Rect}，用来纵向合并
+        changed_area = 0
+        for y in range(0, height, self.band_height):
+            y_end = min(height, y + self.band_height)
+            lo, hi = y * pitch, y_end * pitch
+            if data[lo:hi] == last[lo:hi]:
+                open_rects = {}
+                continue
+            # 找出这一条中变化的列
+            cols = set()
+            for row in range(lo, hi, pitch):
+                for c in range(self.columns):
+                    if c in cols:
+                        continue
+                    start = row + c * col_bytes
+                    end = min(row + width * bytesize, start + col_bytes)
+                    if data[start:end] != last[start:end]:
+                        cols.add(c)
+                if len(cols) == self.columns:
+                    break
+            # 相邻的列合并成一个矩形，和上一条列范围相同的矩形向下延长
+            band_rects = {}
+            for c in sorted(cols):
+                if band_rects and c - 1 in cols:
+                    first = next(reversed(band_rects))
+                    band_rects[(first[0], c)] = band_rects.pop(first)
+                else:
+                    band_rects[(c, c)] = None
+            for span in band_rects:
+                x = span[0] * col_width
+                w = min(width, (span[1] + 1) * col_width) - x
+                changed_area += w * (y_end - y)
+                rect = open_rects.get(span)
+                if rect is not None:
+                    rect.height = y_end - rect.y
+                else:
+                    rect = pygame.Rect(x, y, w, y_end - y)
+                    rects.append(rect)
+                band_rects[span] = rect
+            open_rects = band_rects
+
+        if changed_area > self.full_ratio * width * height:
+            self._since_full = 0
+            return None
+        return rects
+
+    def stats(self):
+        return {
+            "enabled": self.enabled,
+            "frames": self.frames,
+            "full_updates": self.full_updates,
+            "partial_updates": self.partial_updates,
+            "idle_frames": self.idle_frames,
+        }
+
+
+# 进程内唯一的显示更新器
+_display = DirtyDisplay(enabled=_env_enabled())
+
+
+def get_display():
+    return _display
+
+
+def set_enabled(enabled):
+    """打开或关闭脏矩形更新"""
+    _display.enabled = bool(enabled)
+    _display.invalidate()
+
+
+def is_enabled():
+    return _display.enabled
+
+
+def present():
+    """代替 pygame.display.flip()：启用时只更新变化的区域"""
+    _display.present()
@@ -0,0 +1,130 @@
+"""
+对局结果通道
+游戏在对局结束的那一刻上报一条结构化记录（胜者、分数、时长、帧统计），
+启动器直接拿到记录，不再通过 game_result.txt 文件交接：
+- 同一进程内运行：记录保存在内存中，由 runtime.run_game() 读取
+- 子进程运行：启动器用 ResultListener 监听本地 socket，
+  地址和密钥通过环境变量传给子进程，report() 把记录发回启动器
+"""
+import os
+import time
+import secrets
+import threading
+from multiprocessing.connection import Listener, Client
+
+# 传给子进程的环境变量
+ENV_ADDRESS = "SHOWDOWN_RESULT_ADDRESS"
+ENV_AUTHKEY = "SHOWDOWN_RESULT_AUTHKEY"
+
+# 本进程最近一次上报的记录
+_last_record = None
+
+
+class MatchStats:
+    """记录一局的时长和帧统计，对局开始时创建，每帧调用 frame()"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.frames = 0
+        self.worst_frame_ms = 0.0
+        self._last_frame = self.started
+
+    def frame(self):
+        now = time.perf_counter()
+        self.worst_frame_ms = max(self.worst_frame_ms, (now - self._last_frame) * 1000.0)
+        self._last_frame = now
+        self.frames += 1
+
+    def record(self, game, winner, scores=None):
+        """生成结果记录; winner: 1, 2 或 None (平局), scores: (玩家1分数, 玩家2分数) 或 None"""
+        duration = time.perf_counter() - self.started
+        return {
+            "game": game,
+            "winner": winner if winner in (1, 2) else None,
+            "scores": list(scores) if scores is not None else None,
+            "duration": round(duration, 3),
+            "frames": self.frames,
+            "avg_fps": round(self.frames / duration, 1) if duration > 0 else 0.0,
+            "worst_frame_ms": round(self.worst_frame_ms, 1),
+        }
+
+
+def report(record):
+    """对局结束时调用：保存记录，并在由启动器启动的子进程中发回启动器"""
+    global _last_record
+    _last_record = record
+    print(f"[RESULT] {record['game']}: winner={record['winner']} scores={record['scores']}")
+
+    address = os.environ.get(ENV_ADDRESS)
+    if not address:
+        return
+    try:
+        host, port = address.rsplit(":", 1)
+        conn = Client((host, int(port)), authkey=bytes.fromhex(os.environ[ENV_AUTHKEY]))
+        try:
+            conn.send(record)
+        finally:
+            conn.close()
+    except Exception as e:
+        print(f"[ERROR] Could not send result to launcher: {e}")
+
+
+def clear():
+    """开始新的一局前清除上一局的记录"""
+    global _last_record
+    _last_record = None
+
+
+def last_record():
+    """返回本进程最近一次上报的记录（没有则为 None）"""
+    return _last_record
+
+
+class ResultListener:
+    """
+    启动器一侧：接收子进程上报的记录
+    用法: listener = ResultListener(); subprocess.run(..., env=listener.child_env()); record = listener.close()
+    """
+
+    def __init__(self):
+        self.authkey = secrets.token_bytes(16)
+        self.listener = Listener(("127.0.0.1", 0), authkey=self.authkey)
+        self.records = []
+        self._closed = False
+        self._lock = threading.Lock()
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def child_env(self, env=None):
+        """返回带有结果通道地址的环境变量"""
+        env = dict(os.environ if env is None else env)
+        env[ENV_ADDRESS] = "%s:%d" % self.listener.address
+        env[ENV_AUTHKEY] = self.authkey.hex()
+        return env
+
+    def _accept_loop(self):
+        while True:
+            try:
+                conn = self.listener.accept()
+            except Exception:
+                # listener closed or a client failed authentication
+                if self._closed:
+                    return
+                continue
+            try:
+                record = conn.recv()
+                with self._lock:
+                    self.records.append(record)
+            except Exception as e:
+                print(f"⚠ Bad result record: {e}")
+            finally:
+                conn.close()
+
+    def close(self, timeout=0.2):
+        """停止监听，返回最后一条记录（没有则为 None）"""
+        deadline = time.time() + timeout
+        while not self.records and time.time() < deadline:
+            time.sleep(0.01)
+        self._closed = True
+        self.listener.close()
+        with self._lock:
+            return self.records[-1] if self.records else None
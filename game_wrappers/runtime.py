@@ -0,0 +1,261 @@
+"""
+游戏运行时
+在同一个进程内运行四个子游戏：共用一个显示窗口、一个混音器和一个图片缓存，
+胜者通过返回值交给调用者（不再需要 chdir / sys.path / sys.modules 的处理）
+"""
+import os
+import sys
+import glob
+import time
+import threading
+import importlib
+import importlib.util
+import traceback
+
+import pygame
+
+from . import assets, atlas, results
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 所有游戏和启动器使用同样大小的窗口
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 480
+
+# 各游戏的加载方式，键为 game_launcher.py 中 GAMES[...]["name"]
+#   path:    游戏入口脚本（相对项目根目录），必须提供 play()
+#   module:  脚本在 sys.modules 中注册的名字
+#   package: 可选，脚本依赖的 (包名, 目录)
+#   preload: 可选，提前导入的模块，让其资源只解码一次
+#   atlas:   可选，导入前映射的预编译精灵图集（atlas.py）
+#   prefetch: 可选，prefetch_game() 在后台预先解码的资源（路径可以是通配符）:
+#            images: [(路径, alpha, 配方或 None)], sounds: [路径], fonts: [(路径, 字号)]
+GAME_SPECS = {
+    "Counting Butterfly": {
+        "path": "Counting-Butterfly-Two-Player-Game-fresh/counting_butterfly.py",
+        "module": "counting_butterfly",
+        "atlas": "butterfly",
+        "prefetch": {
+            "images": [
+                ("Counting-Butterfly-Two-Player-Game-fresh/assets/images/background1.png", False, ("scale", SCREEN_WIDTH, SCREEN_HEIGHT, False)),
+                ("Counting-Butterfly-Two-Player-Game-fresh/assets/images/butterfly_*.png", True, None),
+            ],
+            "sounds": ["Counting-Butterfly-Two-Player-Game-fresh/assets/audio/%s.wav" % n for n in ("countdown", "start", "beep", "success", "wrong")],
+            "fonts": [("Counting-Butterfly-Two-Player-Game-fresh/assets/fonts/PressStart2P-Regular.ttf", n) for n in (32, 20, 14)],
+        },
+    },
+    "Double Maze": {
+        "path": "Double-Maze/maze_game.py",
+        "module": "maze_game",
+        "package": ("maze_core", "Double-Maze/maze_core"),
+        "atlas": "maze",
+        "prefetch": {
+            "images": [("Double-Maze/assets/background_new.png", False, ("scale", SCREEN_WIDTH, SCREEN_HEIGHT, False))],
+            "fonts": [("Double-Maze/assets/PressStart2P-Regular.ttf", n) for n in (30, 18, 14, 10, 32)],
+        },
+    },
+    "Coin Collectors": {
+        # 按路径加载：该目录同样叫 "game"，与 Tug Of War 的包重名
+        "path": "pixel-coin-collectors/game/main.py",
+        "module": "coin_collectors_main",
+        "atlas": "coin",
+        "prefetch": {
+            "images": [("pixel-coin-collectors/assets/images/starry_sky.png", True, ("scale", SCREEN_WIDTH, SCREEN_HEIGHT, False))],
+            "sounds": ["pixel-coin-collectors/assets/audio/*.wav"],
+            "fonts": [("pixel-coin-collectors/assets/fonts/PressStart2P.ttf", n) for n in (24, 96, 28, 18)],
+        },
+    },
+    "Tug Of War": {
+        "path": "Tug-Of-War-Game/src/main.py",
+        "module": "tug_of_war_main",
+        "package": ("game", "Tug-Of-War-Game/src/game"),
+        "preload": ["game.core"],
+        "atlas": "tug",
+        "prefetch": {
+            "images": [
+                ("Tug-Of-War-Game/src/assets/sprites/*.png", True, None),
+                ("Tug-Of-War-Game/src/assets/sprites/clone-smoke/*.png", True, None),
+            ],
+            "sounds": ["Tug-Of-War-Game/src/assets/sfx/*.wav"],
+            "fonts": [("Tug-Of-War-Game/src/assets/fonts/determination.ttf", n) for n in (28, 14, 12, 10)],
+        },
+    },
+}
+
+# 已加载的游戏模块 {name: module}
+_games = {}
+
+# 正在或已经预加载的游戏 {name: Thread}
+_prefetching = {}
+
+
+def shared_display():
+    """返回共用的显示窗口，没有（或大小不对）时才创建"""
+    if not pygame.get_init():
+        pygame.init()
+    screen = pygame.display.get_surface()
+    if screen is None or screen.get_size() != (SCREEN_WIDTH, SCREEN_HEIGHT):
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    return screen
+
+
+def shared_mixer():
+    """确保共用混音器已初始化，返回是否可用"""
+    try:
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        return True
+    except Exception as e:
+        print(f"⚠ Audio not available: {e}")
+        return False
+
+
+def load_image(path, alpha=True):
+    """
+    从共用缓存（assets.py）中取图片，第一次请求时才解码
+    所有调用者拿到的是同一个 Surface，修改前请先 copy()
+    """
+    return assets.load_image(path, alpha)
+
+
+def load_game_module(spec):
+    """按文件路径导入游戏脚本（不修改工作目录和 sys.path），返回模块"""
+    package = spec.get("package")
+    if package and package[0] not in sys.modules:
+        pkg_name, pkg_folder = package
+        pkg_dir = os.path.join(ROOT_DIR, pkg_folder)
+        pkg_spec = importlib.util.spec_from_file_location(
+            pkg_name, os.path.join(pkg_dir, "__init__.py"),
+            submodule_search_locations=[pkg_dir]
+        )
+        pkg_module = importlib.util.module_from_spec(pkg_spec)
+        sys.modules[pkg_name] = pkg_module
+        pkg_spec.loader.exec_module(pkg_module)
+
+    module_spec = importlib.util.spec_from_file_location(spec["module"], os.path.join(ROOT_DIR, spec["path"]))
+    module = importlib.util.module_from_spec(module_spec)
+    sys.modules[spec["module"]] = module
+    try:
+        module_spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(spec["module"], None)
+        raise
+
+    for name in spec.get("preload", []):
+        importlib.import_module(name)
+    return module
+
+
+def _prefetch(name):
+    """后台线程：映射图集并解码游戏的图片、精灵、声音和字体，放进共用缓存"""
+    started = time.perf_counter()
+    spec = GAME_SPECS[name]
+    manifest = spec.get("prefetch", {})
+    count = 0
+
+    def paths(pattern):
+        return sorted(glob.glob(os.path.join(ROOT_DIR, pattern)))
+
+    def warm(load, *args):
+        nonlocal count
+        try:
+            load(*args)
+            count += 1
+        except Exception as e:
+            print(f"⚠ Prefetch {name}: {args[0]}: {e}")
+
+    if spec.get("atlas"):
+        atlas.load_atlas(spec["atlas"])
+        # 图集中没有（或已过期）的精灵在这里解码并缩放
+        for rel_path, recipe in atlas.ATLAS_SPRITES[spec["atlas"]]:
+            warm(assets.get_cache().variant, os.path.join(ROOT_DIR, rel_path), recipe)
+    for pattern, alpha, recipe in manifest.get("images", []):
+        for path in paths(pattern):
+            if recipe is None:
+                warm(assets.load_image, path, alpha)
+            else:
+                warm(assets.get_cache().variant, path, recipe, alpha)
+    if shared_mixer():
+        for pattern in manifest.get("sounds", []):
+            for path in paths(pattern):
+                warm(assets.load_sound, path)
+    for pattern, size in manifest.get("fonts", []):
+        for path in paths(pattern):
+            warm(assets.load_font, path, size)
+    print(f"✓ Prefetched {count} assets for {name} in {time.perf_counter() - started:.2f}s")
+
+
+def prefetch_game(name):
+    """
+    在后台线程中预先解码游戏的资源（例如轮盘转动期间），返回线程
+    已经加载过或正在预加载的游戏不会重复预加载
+    """
+    thread = _prefetching.get(name)
+    if thread is None and name not in _games and name in GAME_SPECS:
+        shared_display()
+        thread = threading.Thread(target=_prefetch, args=(name,), daemon=True)
+        _prefetching[name] = thread
+        thread.start()
+    return thread
+
+
+def is_warm(name):
+    """游戏已经加载，或者资源已经预加载完成"""
+    thread = _prefetching.get(name)
+    return name in _games or (thread is not None and not thread.is_alive())
+
+
+def get_game(name):
+    """返回已加载的游戏模块，第一次调用时导入（需要先有显示窗口）"""
+    module = _games.get(name)
+    if module is None:
+        # 还在预加载时等它完成，避免同一个文件被解码两次
+        thread = _prefetching.get(name)
+        if thread is not None:
+            thread.join()
+        shared_display()
+        shared_mixer()
+        if GAME_SPECS[name].get("atlas"):
+            atlas.load_atlas(GAME_SPECS[name]["atlas"])
+        module = load_game_module(GAME_SPECS[name])
+        _games[name] = module
+    return module
+
+
+def run_game(name):
+    """
+    在当前进程、当前窗口中运行一局游戏
+    返回值: 1 (玩家1胜), 2 (玩家2胜), 或 None (平局/退出/出错)
+    完整的结果记录可以通过 results.last_record() 获取（没有结束的对局为 None）
+    """
+    shared_display()
+    shared_mixer()
+    caption = pygame.display.get_caption()
+    results.clear()
+    winner = None
+    try:
+        module = get_game(name)
+        pygame.event.clear()
+        winner = module.play()
+    except (Exception, SystemExit) as e:
+        # 游戏出错不能带着启动器一起退出
+        print(f"运行 {name} 时出错: {e}")
+        traceback.print_exc()
+    finally:
+        # 只停止游戏的声音，窗口和混音器继续给启动器使用
+        try:
+            pygame.mixer.stop()
+            pygame.mixer.music.stop()
+        except Exception:
+            pass
+        if caption:
+            pygame.display.set_caption(caption[0])
+        pygame.event.clear()
+
+    # 以对局结束时上报的记录为准
+    record = results.last_record()
+    if record is not None:
+        winner = record["winner"]
+    if winner not in (1, 2):
+        winner = None
+    return winner
@@ -0,0 +1,77 @@
+"""
+共用文字渲染
+每帧都在画的文字（分数、计时器、提示）大多不变，不需要每帧调用 font.render()：
+整串文字的 Surface 按 (字体, 文字, 颜色, 抗锯齿) 放在 LRU 中，不变的文字只渲染一次，
+只需要测量的文字用 size() 的缓存
+返回的 Surface 是共用的，不要修改；只在主线程中使用
+"""
+from collections import OrderedDict
+
+# 整串文字缓存的最大条目数
+DEFAULT_MAX_STRINGS = 512
+
+
+class TextRenderer:
+    """整串文字的 LRU 缓存"""
+
+    def __init__(self, max_strings=DEFAULT_MAX_STRINGS):
+        self.max_strings = max_strings
+        self._strings = OrderedDict()  # {(font, text, color, antialias): Surface}
+        self._sizes = {}               # {(font, text): (宽, 高)}
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        """返回文字的 Surface（同样的参数总是返回同一个 Surface）"""
+        if not isinstance(color, tuple):
+            color = tuple(color)
+        key = (font, text, color, antialias)
+        surf = self._strings.get(key)
+        if surf is not None:
+            self._strings.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = self._strings[key] = font.render(str(text), antialias, color)
+        if len(self._strings) > self.max_strings:
+            self._strings.popitem(last=False)
+        return surf
+
+    def size(self, font, text):
+        """font.size() 的缓存版本，用于只需要测量文字的地方"""
+        key = (font, text)
+        size = self._sizes.get(key)
+        if size is None:
+            if len(self._sizes) > self.max_strings:
+                self._sizes.clear()
+            size = self._sizes[key] = font.size(str(text))
+        return size
+
+    def stats(self):
+        return {
+            "strings": len(self._strings),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def clear(self):
+        self._strings.clear()
+        self._sizes.clear()
+
+
+# 进程内唯一的文字渲染器
+_renderer = TextRenderer()
+
+
+def get_renderer():
+    return _renderer
+
+
+def render(font, text, color, antialias=True):
+    """缓存版的 font.render(text, antialias, color)"""
+    return _renderer.render(font, text, color, antialias)
+
+
+def size(font, text):
+    """缓存版的 font.size(text)"""
+    return _renderer.size(font, text)
@@ -2,6 +2,9 @@ import os
 import pygame
 import random
 import sys
+from array import array
+from itertools import compress, repeat
+from operator import add, lt, mul
 
 # 初始化Pygame
 pygame.init()
@@ -9,7 +12,10 @@ pygame.mixer.init()
 
 # Canvas setup
 WIDTH, HEIGHT = 800, 480
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
+# 复用已有的同尺寸窗口（例如在启动器的游戏宿主进程中运行时）
+screen = pygame.display.get_surface()
+if screen is None or screen.get_size() != (WIDTH, HEIGHT):
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Pixel Coin Collectors")
 
 # 全局变量声明（在函数外初始化）
@@ -22,6 +28,7 @@ bombs = None      # 炸弹组（新增）
 # 新增：倒计时音效跟踪
 countdown_sounds = {}   # map {3: Sound, 2: Sound, 1: Sound} or empty if none
 countdown_last = None
+match_stats = None      # 本局时长/帧统计（结果上报后清空）
 
 # 颜色（Pixel风格高对比度色）
 BLACK = (0, 0, 0)
@@ -42,11 +49,29 @@ RESULT_COLOR = (173, 216, 230) # lightblue for result
 RESTART_COLOR = (240, 230, 140) # khaki for restart instruction
 SCORE_COLOR = (255, 215, 0)    # gold for generic score labels
 
+# 共用图片缓存、文字缓存、显示更新和结果通道（由启动器启动时可用）
+try:
+    from game_wrappers import assets as shared_assets
+    from game_wrappers import results
+    from game_wrappers import text as shared_text
+    from game_wrappers import dirty as shared_dirty
+except ImportError:
+    shared_assets = None
+    results = None
+    shared_text = None
+    shared_dirty = None
+
 # 资源Load函数
 def load_image(path, scale=1):
-    """Load and scale images while preserving transparency"""
+    """Load and scale images while preserving transparency (shared Surface when cached, copy before modifying)"""
     try:
-        img = pygame.image.load(asset_path(path)).convert_alpha()
+        if shared_assets and scale != 1:
+            # 缩放结果在共用缓存（或预编译图集）中只生成一次，不需要解码原图
+            return shared_assets.load_scaled_by(asset_path(path), scale, smooth=False)
+        if shared_assets:
+            img = shared_assets.load_image(asset_path(path))
+        else:
+            img = pygame.image.load(asset_path(path)).convert_alpha()
         if scale != 1:
             new_size = (max(1, int(img.get_width() * scale)), max(1, int(img.get_height() * scale)))
             img = pygame.transform.scale(img, new_size)
@@ -57,6 +82,35 @@ def load_image(path, scale=1):
         sys.exit(1)
 
 
+def load_sound(path):
+    """Load a sound effect (shared and decoded only once when started by the launcher)"""
+    if shared_assets:
+        return shared_assets.load_sound(path)
+    return pygame.mixer.Sound(path)
+
+
+def load_font(path, size):
+    """Load a font file (shared when started by the launcher)"""
+    if shared_assets:
+        return shared_assets.load_font(path, size)
+    return pygame.font.Font(path, size)
+
+
+def render_text(font_obj, text, antialias, color):
+    """font.render() that reuses the surface of unchanged text such as the HUD (cached inside the launcher)"""
+    if shared_text:
+        return shared_text.render(font_obj, text, color, antialias)
+    return font_obj.render(text, antialias, color)
+
+
+def present_frame():
+    """pygame.display.flip(); dirty-rect mode only sends the changed regions"""
+    if shared_dirty:
+        shared_dirty.present()
+    else:
+        pygame.display.flip()
+
+
 def asset_path(rel_path: str) -> str:
     """Return an absolute path to a resource located relative to this file's parent package.
 
@@ -69,12 +123,16 @@ def asset_path(rel_path: str) -> str:
 
 # Load background and scale to screen size so it fits the window
 try:
-    bg = load_image("assets/images/starry_sky.png")
-    if isinstance(bg, pygame.Surface):
-        bg = pygame.transform.scale(bg, (WIDTH, HEIGHT))
+    if shared_assets:
+        # 缩放后的背景在共用缓存中（轮盘转动时已经预加载）
+        bg = shared_assets.load_scaled(asset_path("assets/images/starry_sky.png"), (WIDTH, HEIGHT), smooth=False)
     else:
+        bg = load_image("assets/images/starry_sky.png")
+    if not isinstance(bg, pygame.Surface):
         bg = pygame.Surface((WIDTH, HEIGHT))
         bg.fill(BLACK)
+    elif bg.get_size() != (WIDTH, HEIGHT):
+        bg = pygame.transform.scale(bg, (WIDTH, HEIGHT))
 except Exception:
     bg = pygame.Surface((WIDTH, HEIGHT))
     bg.fill(BLACK)
@@ -101,19 +159,19 @@ bomb_img = load_image("assets/images/bomb.png", 0.06)
 # 音频资源
 try:
     # main sounds
-    bgm = pygame.mixer.Sound(asset_path("assets/audio/bgm.mp3"))
-    coin_sound = pygame.mixer.Sound(asset_path("assets/audio/coin_sound.wav"))
+    bgm = load_sound(asset_path("assets/audio/bgm.mp3"))
+    coin_sound = load_sound(asset_path("assets/audio/coin_sound.wav"))
 
     # countdown sounds for 3-2-1: try per-number files, fall back to single file
     try:
-        countdown_sounds[3] = pygame.mixer.Sound(asset_path("assets/audio/count3.wav"))
-        countdown_sounds[2] = pygame.mixer.Sound(asset_path("assets/audio/count2.wav"))
-        countdown_sounds[1] = pygame.mixer.Sound(asset_path("assets/audio/count1.wav"))
+        countdown_sounds[3] = load_sound(asset_path("assets/audio/count3.wav"))
+        countdown_sounds[2] = load_sound(asset_path("assets/audio/count2.wav"))
+        countdown_sounds[1] = load_sound(asset_path("assets/audio/count1.wav"))
         for s in countdown_sounds.values():
             s.set_volume(0.5)
     except (pygame.error, FileNotFoundError):
         try:
-            single = pygame.mixer.Sound(asset_path("assets/audio/countdown.wav"))
+            single = load_sound(asset_path("assets/audio/countdown.wav"))
             single.set_volume(0.5)
             countdown_sounds = {3: single, 2: single, 1: single}
         except (pygame.error, FileNotFoundError):
@@ -121,14 +179,14 @@ try:
 
     # bomb hit sound
     try:
-        bomb_sound = pygame.mixer.Sound(asset_path("assets/audio/bomb.wav"))
+        bomb_sound = load_sound(asset_path("assets/audio/bomb.wav"))
         bomb_sound.set_volume(0.5)
     except (pygame.error, FileNotFoundError):
         bomb_sound = None
 
     # diamond collect sound
     try:
-        diamond_sound = pygame.mixer.Sound(asset_path("assets/audio/diamond.wav"))
+        diamond_sound = load_sound(asset_path("assets/audio/diamond.wav"))
         diamond_sound.set_volume(0.5)
     except (pygame.error, FileNotFoundError):
         diamond_sound = None
@@ -195,6 +253,9 @@ class Player(pygame.sprite.Sprite):
 
 # Coin class
 class Coin(pygame.sprite.Sprite):
+    kind = "coin"
+    points = 1
+
     def __init__(self):
         super().__init__()
         self.image = coin_img
@@ -217,6 +278,9 @@ class Coin(pygame.sprite.Sprite):
 
 # 新增：钻石类（行为与金币相同，But different scores）
 class Diamond(pygame.sprite.Sprite):
+    kind = "diamond"
+    points = 5
+
     def __init__(self):
         super().__init__()
         self.image = diamond_img
@@ -238,6 +302,9 @@ class Diamond(pygame.sprite.Sprite):
 
 # 新增：炸弹类（行为与金币相同，但扣分）
 class Bomb(pygame.sprite.Sprite):
+    kind = "bomb"
+    points = -5
+
     def __init__(self):
         super().__init__()
         self.image = bomb_img
@@ -258,10 +325,144 @@ class Bomb(pygame.sprite.Sprite):
             self.reset()
 
 
+
+# -----------------------
+# Falling items: one update + collision pass
+# -----------------------
+# 每种物品开局的数量和数量上限（被拾取时补充一个新的，直到上限）
+ITEM_START = {"coin": 5, "diamond": 2, "bomb": 2}
+ITEM_CAPS = {"coin": 10, "diamond": 5, "bomb": 5}
+# frenzy 模式：物品多得多（MINIGAMES_COIN_FRENZY=1 或 python game/main.py --frenzy）
+FRENZY_ITEM_START = {"coin": 60, "diamond": 15, "bomb": 15}
+FRENZY_ITEM_CAPS = {"coin": 300, "diamond": 80, "bomb": 80}
+FRENZY = os.environ.get("MINIGAMES_COIN_FRENZY", "").strip().lower() in ("1", "true", "yes", "on") \
+    or "--frenzy" in sys.argv[1:]
+
+
+class BandHash:
+    """Uniform grid (one row of cell-wide columns) over the horizontal band the players move in.
+
+    Items outside the band are rejected with one comparison; items inside it are only tested
+    against the players registered in the columns they overlap.
+    """
+
+    def __init__(self, cell=64):
+        self.cell = cell
+        self.top = self.bottom = 0
+        self.columns = {}   # {列号: [sprite, ...]}，按加入的顺序
+
+    def rebuild(self, sprites):
+        self.columns = {}
+        rects = [sp.rect for sp in sprites]
+        if not rects:
+            self.top = self.bottom = 0
+            return
+        self.top = min(r.top for r in rects)
+        self.bottom = max(r.bottom for r in rects)
+        for sp in sprites:
+            for col in range(sp.rect.left // self.cell, (sp.rect.right - 1) // self.cell + 1):
+                self.columns.setdefault(col, []).append(sp)
+
+    def query(self, rect):
+        """Sprites whose rect overlaps rect, in the order they were added"""
+        if rect.bottom <= self.top or rect.top >= self.bottom:
+            return []
+        found = []
+        for col in range(rect.left // self.cell, (rect.right - 1) // self.cell + 1):
+            for sp in self.columns.get(col, ()):
+                if sp not in found and sp.rect.colliderect(rect):
+                    found.append(sp)
+        return found
+
+
+player_hash = BandHash()
+
+
+def update_items(groups, player_list, caps):
+    """
+    所有下落物品一次更新 + 碰撞检测
+    每个物品每帧最多被一个玩家拾取：同时碰到两个玩家时给水平距离更近的，一样近时给 Player1，
+    所以得分与精灵组的遍历顺序无关；拾取后补充的新物品在这一帧结束后才加入
+    返回 [(player, item), ...] 本帧的拾取记录
+    """
+    player_hash.rebuild(player_list)
+    pickups = []
+    spawns = []
+    pending = {}   # {group: 本帧要补充的数量}
+    for group in groups:
+        for item in group.sprites():
+            item.update()
+            hits = player_hash.query(item.rect)
+            if not hits:
+                continue
+            cx = item.rect.centerx
+            player = min(hits, key=lambda p: (abs(p.rect.centerx - cx), player_list.index(p)))
+            player.score = max(0, player.score + item.points)
+            pickups.append((player, item))
+            collect_effects(item)
+            item.reset()
+            if len(group) + pending.get(group, 0) < caps[item.kind]:
+                pending[group] = pending.get(group, 0) + 1
+                spawns.append((group, type(item)))
+    for group, cls in spawns:
+        group.add(cls())
+    return pickups
+
+
+def play_sound(sound):
+    if sound:
+        try:
+            sound.play()
+        except Exception:
+            pass
+
+
+def collect_effects(item):
+    """拾取物品时的音效和特效"""
+    if item.kind == "coin":
+        play_sound(coin_sound)
+    elif item.kind == "diamond":
+        # play diamond sound if available, else fallback to coin sound
+        play_sound(diamond_sound or coin_sound)
+        # spawn visual feedback: floating +5 and golden particles + soft flash
+        fx_pos = item.rect.center
+        floating_texts.append(FloatingText("+5", fx_pos, color=(255, 223, 0), lifetime=0.9, vel=(0, -30)))
+        particles.emit(fx_pos, color=(255, 215, 0), count=14, speed=150)
+        screen_flash["alpha"] = 120.0
+        screen_flash["color"] = (255, 215, 0)
+    elif item.kind == "bomb":
+        play_sound(bomb_sound)
+        # spawn visual feedback: floating -5 and red particles + strong red flash
+        fx_pos = item.rect.center
+        floating_texts.append(FloatingText("-5", fx_pos, color=(255, 80, 80), lifetime=0.9, vel=(0, -30)))
+        particles.emit(fx_pos, color=(255, 80, 80), count=16, speed=140)
+        screen_flash["alpha"] = 200.0
+        screen_flash["color"] = (255, 80, 80)
+
 # -----------------------
 # Visual / feedback effects
 # -----------------------
 # Floating text for +5 / -5
+# 弹出文字按透明度分级预先渲染，同样的文字和颜色共用一套（不再每帧 copy() + set_alpha()）
+POPUP_ALPHA_LEVELS = 16
+_popup_frames = {}   # {(text, color): [Surface, ...]}，下标越大越不透明
+
+
+def popup_frames(text, color):
+    """Pre-rendered copies of text at POPUP_ALPHA_LEVELS alpha steps (rendered once per text/color)"""
+    key = (text, tuple(color))
+    frames = _popup_frames.get(key)
+    if frames is None:
+        base = font.render(text, True, color)
+        frames = []
+        for level in range(POPUP_ALPHA_LEVELS):
+            s = base.copy()
+            s.set_alpha(255 * (level + 1) // POPUP_ALPHA_LEVELS)
+            frames.append(s)
+        _popup_frames[key] = frames
+    return frames
+
+
 class FloatingText:
     def __init__(self, text, pos, color=WHITE, lifetime=1.0, vel=(0, -40)):
         self.text = text
@@ -271,8 +472,8 @@ class FloatingText:
         # position in pixels (float)
         self.x, self.y = float(pos[0]), float(pos[1])
         self.vx, self.vy = float(vel[0]), float(vel[1])
-        # render surface
-        self.surf = font.render(self.text, True, self.color)
+        # render surfaces (shared by every popup with the same text and color)
+        self.frames = popup_frames(self.text, self.color)
 
     def update(self, dt):
         self.age += dt
@@ -281,86 +482,161 @@ class FloatingText:
             self.y += self.vy * dt
 
     def draw(self, surface):
-        alpha = max(0, 255 * (1 - (self.age / self.lifetime)))
-        s = self.surf.copy()
-        s.set_alpha(int(alpha))
+        fade = 1 - (self.age / self.lifetime)
+        if fade <= 0:
+            return
+        s = self.frames[min(POPUP_ALPHA_LEVELS - 1, int(fade * POPUP_ALPHA_LEVELS))]
         surface.blit(s, (int(self.x - s.get_width() / 2), int(self.y - s.get_height() / 2)))
 
 
-# Simple particle emitter for small colored circles
-class ParticleEmitter:
-    def __init__(self, pos, color, count=12, spread=60, speed=120, lifetime=0.8):
-        self.particles = []
-        self.lifetime = lifetime
+# 全屏闪光：一张复用的不透明画面，只在颜色变化时重新填充，淡出时只改整体透明度
+class FlashOverlay:
+    def __init__(self, size):
+        self.surface = pygame.Surface(size)
+        self.color = None
+
+    def draw(self, surface, color, alpha):
+        if color != self.color:
+            self.surface.fill(color)
+            self.color = color
+        self.surface.set_alpha(alpha)
+        surface.blit(self.surface, (0, 0))
+
+
+# 粒子池：所有爆发共用固定容量的数组列，不为单个粒子分配对象或 Surface
+class ParticlePool:
+    """Fixed-capacity particle system stored as array columns (x, y, vx, vy, age, life, size, color index).
+
+    update() advances every live particle with map()/compress() over whole columns (the loops run in C),
+    and draw() blits pre-rendered alpha circle sprites (one per color / size / alpha bucket) with surface.blits().
+    """
+
+    CAPACITY = 4096      # 同时存在的最多粒子数，超出的新粒子直接丢弃
+    MIN_SIZE, MAX_SIZE = 2, 5
+    ALPHA_BUCKETS = 16   # 淡出分成的透明度级数
+
+    def __init__(self, capacity=CAPACITY):
+        self.capacity = capacity
+        self.count = 0
+        self.x = array("d", bytes(8 * capacity))
+        self.y = array("d", bytes(8 * capacity))
+        self.vx = array("d", bytes(8 * capacity))
+        self.vy = array("d", bytes(8 * capacity))
+        self.age = array("d", bytes(8 * capacity))
+        self.life = array("d", bytes(8 * capacity))
+        self.size = array("B", bytes(capacity))
+        self.color = array("B", bytes(capacity))
+        self._columns = (self.x, self.y, self.vx, self.vy, self.age, self.life, self.size, self.color)
+        self._colors = {}    # {RGB: 颜色编号}
+        self._sprites = []   # [颜色编号][尺寸][透明度级] -> Surface
+
+    def _color_index(self, color):
+        """颜色编号；第一次用到某种颜色时预先画好它所有尺寸和透明度的圆"""
+        index = self._colors.get(color)
+        if index is None:
+            index = len(self._sprites)
+            if index > 255:
+                return 0
+            self._colors[color] = index
+            table = []
+            for size in range(self.MAX_SIZE + 1):
+                frames = []
+                for bucket in range(self.ALPHA_BUCKETS):
+                    s = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                    alpha = 255 * (bucket + 1) // self.ALPHA_BUCKETS
+                    if size:
+                        pygame.draw.circle(s, tuple(color) + (alpha,), (size, size), size)
+                    frames.append(s)
+                table.append(frames)
+            self._sprites.append(table)
+        return index
+
+    def emit(self, pos, color, count=12, spread=60, speed=120, lifetime=0.8):
+        """Spawn a burst of count particles at pos (silently truncated when the pool is full)."""
+        color_index = self._color_index(tuple(color))
+        count = min(count, self.capacity - self.count)
+        px, py = float(pos[0]), float(pos[1])
+        i = self.count
         for _ in range(count):
-            angle = random.random() * 2 * 3.14159
             spd = speed * (0.5 + random.random() * 0.8)
-            vx = spd * random.uniform(-1, 1)
-            vy = spd * random.uniform(-1, 1)
-            size = random.randint(2, 5)
-            self.particles.append({
-                "x": float(pos[0]),
-                "y": float(pos[1]),
-                "vx": vx,
-                "vy": vy,
-                "life": lifetime,
-                "age": 0.0,
-                "size": size,
-                "color": color,
-            })
+            self.x[i] = px
+            self.y[i] = py
+            self.vx[i] = spd * random.uniform(-1, 1)
+            self.vy[i] = spd * random.uniform(-1, 1)
+            self.age[i] = 0.0
+            self.life[i] = lifetime
+            self.size[i] = random.randint(self.MIN_SIZE, self.MAX_SIZE)
+            self.color[i] = color_index
+            i += 1
+        self.count = i
 
     def update(self, dt):
-        for p in self.particles:
-            p["age"] += dt
-            if p["age"] <= p["life"]:
-                p["x"] += p["vx"] * dt
-                p["y"] += p["vy"] * dt
-
-        # remove dead
-        self.particles = [p for p in self.particles if p["age"] < p["life"]]
+        n = self.count
+        if not n:
+            return
+        x, y, age = self.x, self.y, self.age
+        x[:n] = array("d", map(add, x[:n], map(mul, self.vx[:n], repeat(dt, n))))
+        y[:n] = array("d", map(add, y[:n], map(mul, self.vy[:n], repeat(dt, n))))
+        age[:n] = array("d", map(add, age[:n], repeat(dt, n)))
+        # 去掉寿命已到的粒子：存活的按原顺序移到各列前面
+        alive = list(map(lt, age[:n], self.life[:n]))
+        if all(alive):
+            return
+        for column in self._columns:
+            kept = array(column.typecode, compress(column[:n], alive))
+            column[:len(kept)] = kept
+        self.count = len(kept)
 
     def draw(self, surface):
-        for p in self.particles:
-            alpha = max(0, 255 * (1 - p["age"] / p["life"]))
-            col = p["color"] + (int(alpha),)
-            s = pygame.Surface((p["size"] * 2, p["size"] * 2), pygame.SRCALPHA)
-            pygame.draw.circle(s, col, (p["size"], p["size"]), p["size"]) 
-            surface.blit(s, (int(p["x"] - p["size"]), int(p["y"] - p["size"])))
+        n = self.count
+        if not n:
+            return
+        sprites, buckets = self._sprites, self.ALPHA_BUCKETS
+        surface.blits([
+            (sprites[c][s][min(buckets - 1, int(buckets * (1.0 - a / l)))], (px - s, py - s))
+            for px, py, a, l, s, c in zip(self.x[:n], self.y[:n], self.age[:n], self.life[:n],
+                                           self.size[:n], self.color[:n])
+        ], False)
+
+    def clear(self):
+        self.count = 0
 
 
 # effect containers
-emitters = []         # list of ParticleEmitter
+particles = ParticlePool()  # 所有粒子爆发
 floating_texts = []   # list of FloatingText
 # screen flash effect (dict)
 screen_flash = {"alpha": 0.0, "color": (0, 0, 0), "decay": 4.0}
+flash_overlay = FlashOverlay((WIDTH, HEIGHT))
 
 # Pixel fontLoad（确保字体文件存在）
 try:
-    font = pygame.font.Font(asset_path("assets/fonts/PressStart2P.ttf"), 24)
+    font = load_font(asset_path("assets/fonts/PressStart2P.ttf"), 24)
 except FileNotFoundError:
     print("Warning: Pixel font not found, using default font")
     font = pygame.font.SysFont(None, 24)
 # Large font for 3-2-1 countdown
 try:
-    font_big = pygame.font.Font(asset_path("assets/fonts/PressStart2P.ttf"), 96)
+    font_big = load_font(asset_path("assets/fonts/PressStart2P.ttf"), 96)
 except FileNotFoundError:
     font_big = pygame.font.SysFont(None, 96)
 # Title/instruction font (PressStart2P used if available) — made smaller
 try:
-    title_font = pygame.font.Font(asset_path("assets/fonts/PressStart2P.ttf"), 28)  # smaller title
+    title_font = load_font(asset_path("assets/fonts/PressStart2P.ttf"), 28)  # smaller title
 except FileNotFoundError:
     title_font = pygame.font.SysFont(None, 28)
 # New: smaller instruction font (PressStart2P)
 try:
-    instr_font = pygame.font.Font(asset_path("assets/fonts/PressStart2P.ttf"), 18)  # smaller instructions
+    instr_font = load_font(asset_path("assets/fonts/PressStart2P.ttf"), 18)  # smaller instructions
 except FileNotFoundError:
     instr_font = pygame.font.SysFont(None, 18)
 
 # 游戏初始化
 def init_game():
     # 声明全局变量（关键修复）
-    global players, coins, time_left, game_state, diamonds, bombs, countdown_last
+    global players, coins, time_left, game_state, diamonds, bombs, countdown_last, match_stats
     game_state = "countdown"  # 初始状态为倒计时
+    match_stats = results.MatchStats() if results else None
     countdown = 3  # 3seconds倒计时
     time_left = 30  # Game duration changed to30seconds（之前为60seconds）
     countdown_last = None
@@ -380,29 +656,36 @@ def init_game():
     )
     players = pygame.sprite.Group(player1, player2)
 
-    # 初始化金币（5个）
-    coins = pygame.sprite.Group()
-    for _ in range(5):
-        coins.add(Coin())
-
-    # 初始化钻石（2个）和炸弹（2个）
-    diamonds = pygame.sprite.Group()
-    for _ in range(2):
-        diamonds.add(Diamond())
-
-    bombs = pygame.sprite.Group()
-    for _ in range(2):
-        bombs.add(Bomb())
+    # 初始化金币、钻石和炸弹（数量见 ITEM_START / FRENZY_ITEM_START）
+    start = FRENZY_ITEM_START if FRENZY else ITEM_START
+    coins = pygame.sprite.Group(*(Coin() for _ in range(start["coin"])))
+    diamonds = pygame.sprite.Group(*(Diamond() for _ in range(start["diamond"])))
+    bombs = pygame.sprite.Group(*(Bomb() for _ in range(start["bomb"])))
     
     return countdown
 
+def get_winner():
+    """Winner of the current round: 1 = Player1 (WASD), 2 = Player2 (Arrows), None = tie"""
+    p1_score = players.sprites()[0].score
+    p2_score = players.sprites()[1].score
+    if p1_score > p2_score:
+        return 1
+    if p2_score > p1_score:
+        return 2
+    return None
+
+
 # 主游戏循环
-def main():
+def play():
+    """Play until the window is closed or ESC is pressed.
+    Returns the winner once a round has finished (see get_winner), otherwise None.
+    Does not quit pygame, so it can run inside the launcher's game host."""
     # 声明使用全局变量（关键修复）
-    global game_state, time_left, players, coins, diamonds, bombs, countdown_last, countdown_sounds
+    global game_state, time_left, players, coins, diamonds, bombs, countdown_last, countdown_sounds, match_stats
     clock = pygame.time.Clock()
     countdown = init_game()
-    bgm.play(-1)  # 循环播放Background音乐
+    if bgm:
+        bgm.play(-1)  # 循环播放Background音乐
 
     running = True
     while running:
@@ -428,68 +711,20 @@ def main():
             time_left -= clock.get_time() / 1000
             if time_left <= 0:
                 game_state = "game_over"
+                # 对局结束时立即上报结果
+                if match_stats is not None:
+                    results.report(match_stats.record(
+                        "Coin Collectors", get_winner(),
+                        scores=[p.score for p in players.sprites()]
+                    ))
+                    match_stats = None
 
             # 更新Player（移动和方向切换）
             players.update(keys_pressed)
 
-            # 更新金币（下落+碰撞检测）
-            for coin in list(coins):
-                coin.update()
-                for player in players:
-                    if pygame.sprite.collide_rect(player, coin):
-                        player.score += 1
-                        coin_sound.play()
-                        coin.reset()
-                        if len(coins) < 10:
-                            coins.add(Coin())
-
-            # 更新钻石（下落+碰撞检测，拾取加5）
-            for diamond in list(diamonds):
-                diamond.update()
-                for player in players:
-                    if pygame.sprite.collide_rect(player, diamond):
-                        player.score += 5
-                        # play diamond sound if available, else fallback to coin sound
-                        try:
-                            if 'diamond_sound' in globals() and diamond_sound:
-                                diamond_sound.play()
-                            elif 'coin_sound' in globals() and coin_sound:
-                                coin_sound.play()
-                        except Exception:
-                            pass
-                        # spawn visual feedback: floating +5 and golden particles + soft flash
-                        fx_pos = diamond.rect.center
-                        floating_texts.append(FloatingText("+5", fx_pos, color=(255, 223, 0), lifetime=0.9, vel=(0, -30)))
-                        emitters.append(ParticleEmitter(fx_pos, color=(255, 215, 0), count=14, speed=150))
-                        screen_flash["alpha"] = 120.0
-                        screen_flash["color"] = (255, 215, 0)
-
-                        diamond.reset()
-                        if len(diamonds) < 5:
-                            diamonds.add(Diamond())
-
-            # Update bombs（下落+碰撞检测，拾取扣5）
-            for bomb in list(bombs):
-                bomb.update()
-                for player in players:
-                    if pygame.sprite.collide_rect(player, bomb):
-                        player.score = max(0, player.score - 5)
-                        # play bomb sound if loaded
-                        try:
-                            if 'bomb_sound' in globals() and bomb_sound:
-                                bomb_sound.play()
-                        except Exception:
-                            pass
-                        # spawn visual feedback: floating -5 and red particles + strong red flash
-                        fx_pos = bomb.rect.center
-                        floating_texts.append(FloatingText("-5", fx_pos, color=(255, 80, 80), lifetime=0.9, vel=(0, -30)))
-                        emitters.append(ParticleEmitter(fx_pos, color=(255, 80, 80), count=16, speed=140))
-                        screen_flash["alpha"] = 200.0
-                        screen_flash["color"] = (255, 80, 80)
-
-                        bomb.reset()
-                        if len(bombs) < 5:
-                            bombs.add(Bomb())
+            # 更新金币、钻石和炸弹（下落+碰撞检测，一次遍历；金币+1，钻石+5，炸弹-5）
+            update_items((coins, diamonds, bombs), players.sprites(),
+                         FRENZY_ITEM_CAPS if FRENZY else ITEM_CAPS)
 
         elif game_state == "game_over":
             # 按R重启游戏
@@ -517,23 +752,23 @@ def main():
             countdown_last = current_count
 
             # Title and instructions (use PressStart2P if available)
-            title_text = title_font.render("Let's Eating", True, TITLE_COLOR)
-            instr1 = instr_font.render("Press left and right to crontrol player 1", True, INSTR1_COLOR)
-            instr2 = instr_font.render("press A and D to control player 2", True, INSTR2_COLOR)
+            title_text = render_text(title_font, "Let's Eating", True, TITLE_COLOR)
+            instr1 = render_text(instr_font, "Press left and right to crontrol player 1", True, INSTR1_COLOR)
+            instr2 = render_text(instr_font, "press A and D to control player 2", True, INSTR2_COLOR)
             screen.blit(title_text, (WIDTH//2 - title_text.get_width()//2, 40))
             screen.blit(instr1, (WIDTH//2 - instr1.get_width()//2, 100))
             screen.blit(instr2, (WIDTH//2 - instr2.get_width()//2, 130))
 
             # Large centered countdown number
-            big_text = font_big.render(str(current_count), True, COUNTDOWN_COLOR)
+            big_text = render_text(font_big, str(current_count), True, COUNTDOWN_COLOR)
             screen.blit(big_text, (WIDTH//2 - big_text.get_width()//2,
                                    HEIGHT//2 - big_text.get_height()//2))
 
         elif game_state == "playing":
             # 显示分数和剩余时间
-            p1_text = font.render(f"P1: {players.sprites()[0].score}", True, P1_COLOR)
-            p2_text = font.render(f"P2: {players.sprites()[1].score}", True, P2_COLOR)
-            time_text = font.render(f"TIME: {max(0, int(time_left))}", True, TIME_COLOR)
+            p1_text = render_text(font, f"P1: {players.sprites()[0].score}", True, P1_COLOR)
+            p2_text = render_text(font, f"P2: {players.sprites()[1].score}", True, P2_COLOR)
+            time_text = render_text(font, f"TIME: {max(0, int(time_left))}", True, TIME_COLOR)
             screen.blit(p1_text, (20, 20))
             screen.blit(p2_text, (WIDTH - p2_text.get_width() - 20, 20))
             screen.blit(time_text, (WIDTH//2 - time_text.get_width()//2, 20))
@@ -545,70 +780,55 @@ def main():
             result = "P1 WINS!" if p1_score > p2_score else "P2 WINS!" if p2_score > p1_score else "TIE!"
             
             texts = [
-                font.render("GAME OVER", True, GAME_OVER_COLOR),
-                font.render(f"P1: {p1_score}", True, P1_COLOR),
-                font.render(f"P2: {p2_score}", True, P2_COLOR),
-                font.render(result, True, RESULT_COLOR),
-                font.render("PRESS R TO RESTART", True, RESTART_COLOR),
-                font.render("Press ESC to exit", True, (200, 200, 200))
+                render_text(font, "GAME OVER", True, GAME_OVER_COLOR),
+                render_text(font, f"P1: {p1_score}", True, P1_COLOR),
+                render_text(font, f"P2: {p2_score}", True, P2_COLOR),
+                render_text(font, result, True, RESULT_COLOR),
+                render_text(font, "PRESS R TO RESTART", True, RESTART_COLOR),
+                render_text(font, "Press ESC to exit", True, (200, 200, 200))
             ]
             # Center align text
             for i, text in enumerate(texts):
                 y_pos = HEIGHT//2 - 80 + i*40
                 screen.blit(text, (WIDTH//2 - text.get_width()//2, y_pos))
 
-        # collision handling: when a player touches a bomb play bomb_sound
-        # place this inside your main loop where you handle collisions (replace existing bomb collision handling)
-        hits = pygame.sprite.groupcollide(players, bombs, False, True)
-        for player_sprite, bomb_list in hits.items():
-            for bomb in bomb_list:
-                # apply bomb effect (adjust to your game's logic; example subtract 1)
-                try:
-                    player_sprite.score -= getattr(bomb, "damage", 1)
-                except Exception:
-                    player_sprite.score -= 1
-                # play sound if loaded
-                if 'bomb_sound' in globals() and bomb_sound:
-                    try:
-                        bomb_sound.play()
-                    except Exception:
-                        pass
-
         # Update and draw effects (particles, floating text, and flash)
-        # Update floating texts and emitters
+        # Update floating texts and particles
         dt = clock.get_time() / 1000.0
         for ft in list(floating_texts):
             ft.update(dt)
             if ft.age >= ft.lifetime:
                 floating_texts.remove(ft)
 
-        for em in list(emitters):
-            em.update(dt)
-            if len(em.particles) == 0:
-                emitters.remove(em)
+        particles.update(dt)
 
         # Draw particles and floating texts on top of game elements
-        for em in emitters:
-            em.draw(screen)
+        particles.draw(screen)
 
         for ft in floating_texts:
             ft.draw(screen)
 
         # screen flash (overlay with additive-like tint)
         if screen_flash["alpha"] > 1.0:
-            ov = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
             # clamp alpha to 255
             a = max(0, min(255, int(screen_flash["alpha"])))
-            ov.fill(screen_flash["color"] + (a,))
-            screen.blit(ov, (0, 0))
+            flash_overlay.draw(screen, screen_flash["color"], a)
             # decay alpha
             screen_flash["alpha"] = max(0.0, screen_flash["alpha"] - screen_flash["decay"] * dt * 60)
 
-        pygame.display.flip()  # 更新画面
+        present_frame()  # 更新画面
+        if match_stats is not None:
+            match_stats.frame()
         clock.tick(60)  # 60FPS
 
-    # 退出游戏
-    bgm.stop()
+    # 退出游戏（只停止本游戏的声音，窗口和混音器留给调用者）
+    if bgm:
+        bgm.stop()
+    return get_winner() if game_state == "game_over" else None
+
+
+def main():
+    play()
     pygame.quit()
     sys.exit()
 